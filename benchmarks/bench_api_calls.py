@@ -0,0 +1,57 @@
+"""Conta as chamadas à API do Docker por refresh da tabela de containers.
+
+Uso: python -m benchmarks.bench_api_calls [--containers 10 100 500] [--images 20]
+"""
+import argparse
+import time
+
+from benchmarks.fake_docker_daemon import FakeDockerDaemon
+from src.services.docker_utils import DockerUtils
+
+
+def legacy_get_all_containers_details(client_docker):
+    """Implementação anterior: containers.list + c.image.tags (um inspect por container e por imagem)."""
+    containers = client_docker.containers.list(all=True)
+    return [
+        [
+            c.short_id,
+            c.name,
+            c.image.tags[0] if c.image.tags else "<sem tag>",
+            c.status,
+            c.attrs['Created'][:19].replace("T", " ")
+        ]
+        for c in containers
+    ]
+
+
+def measure(daemon, refresh):
+    daemon.reset_calls()
+    start = time.perf_counter()
+    refresh()
+    elapsed = time.perf_counter() - start
+    return daemon.total_calls(), elapsed
+
+
+def run(container_counts, image_count):
+    print(f"{'containers':>10} | {'legado (chamadas)':>18} | {'legado (ms)':>11} | "
+          f"{'novo 1º (chamadas)':>18} | {'novo (chamadas)':>15} | {'novo (ms)':>9}")
+
+    for count in container_counts:
+        with FakeDockerDaemon(containers=count, images=image_count) as daemon:
+            docker_utils = DockerUtils(daemon.client())
+
+            legacy_calls, legacy_time = measure(
+                daemon, lambda: legacy_get_all_containers_details(docker_utils.client_docker))
+            first_calls, _ = measure(daemon, docker_utils.get_all_containers_details)
+            calls, elapsed = measure(daemon, docker_utils.get_all_containers_details)
+
+            print(f"{count:>10} | {legacy_calls:>18} | {legacy_time * 1000:>11.1f} | "
+                  f"{first_calls:>18} | {calls:>15} | {elapsed * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--containers", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--images", type=int, default=20)
+    args = parser.parse_args()
+    run(args.containers, args.images)
@@ -0,0 +1,71 @@
+"""Latência por chamada: CLI `docker` em subprocess (implementação anterior) x API via socket.
+
+Uso: python -m benchmarks.bench_cli_vs_api [--containers 100] [--repeat 20]
+
+O CLI é apontado para o daemon simulado via DOCKER_HOST; se o binário `docker` não
+estiver instalado, a coluna do CLI é exibida como indisponível.
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import time
+
+from benchmarks.fake_docker_daemon import FakeDockerDaemon
+from src.services.docker_utils import DockerUtils
+
+
+def cli(args, env):
+    return subprocess.run(["docker"] + args, capture_output=True, text=True, env=env)
+
+
+def legacy_calls(container_id, env):
+    """As chamadas de subprocess que DockerUtils/LogUpdaterThread faziam antes."""
+    return {
+        "listar todos": lambda: cli(["ps", "-a", "--format", "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}"], env),
+        "listar em execução": lambda: cli(["ps", "--format", "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}"], env),
+        "inspect": lambda: json.loads(cli(["inspect", container_id], env).stdout or "[]"),
+        "logs --tail 100": lambda: cli(["logs", "--tail", "100", container_id], env),
+    }
+
+
+def api_calls(docker_utils, container_id):
+    return {
+        "listar todos": docker_utils.get_all_containers_details_subprocess,
+        "listar em execução": docker_utils.get_running_containers_details,
+        "inspect": lambda: docker_utils.get_container_details(container_id),
+        "logs --tail 100": lambda: docker_utils.api_client.logs(container_id, tail=100),
+    }
+
+
+def per_call_ms(function, repeat):
+    function()  # aquecimento (conexão, cache do CLI)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def run(container_count, repeat):
+    with FakeDockerDaemon(containers=container_count, images=10) as daemon:
+        docker_utils = DockerUtils(daemon.client())
+        container_id = daemon.containers[1]["Id"][:12]
+
+        env = dict(os.environ, DOCKER_HOST=daemon.base_url)
+        has_cli = shutil.which("docker") is not None
+        legacy = legacy_calls(container_id, env)
+        api = api_calls(docker_utils, container_id)
+
+        print(f"{'operação':<20} | {'CLI (ms/chamada)':>17} | {'API (ms/chamada)':>17}")
+        for name, api_call in api.items():
+            legacy_ms = f"{per_call_ms(legacy[name], repeat):>17.2f}" if has_cli else f"{'indisponível':>17}"
+            print(f"{name:<20} | {legacy_ms} | {per_call_ms(api_call, repeat):>17.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--containers", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.containers, args.repeat)
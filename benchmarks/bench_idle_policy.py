@@ -0,0 +1,72 @@
+"""Política de ociosidade do auto-stop: custo de cada verificação com o heap x varrer todos os containers.
+
+Simula N containers em execução com amostras a cada segundo, das quais só uma fração tem
+atividade, e mede `idle_containers` a cada tick contra a varredura completa equivalente.
+
+Uso: python -m benchmarks.bench_idle_policy [--containers 1000 10000] [--ticks 600]
+"""
+import argparse
+import random
+import time
+
+from src.services.idle_policy import IdlePolicy, SAMPLE_GAP
+
+WINDOW = 300
+
+
+def full_rescan(last_activity, samples, window, now):
+    # Mesma regra da política: sem atividade na janela e com amostras cobrindo a janela inteira
+    return {container_id for container_id, last in last_activity.items()
+            if now - last >= window and samples[container_id][0] <= now - window
+            and now - samples[container_id][1] <= SAMPLE_GAP}
+
+
+def run(count, ticks, active_fraction):
+    rng = random.Random(0)
+    rows = [{"Id": f"{i:064x}", "ID": f"{i:012x}", "Nome": f"c{i}", "State": "running", "Labels": {}}
+            for i in range(count)]
+    ids = [row["Id"] for row in rows]
+    policy = IdlePolicy({"idle_window": WINDOW})
+    policy.sync(rows, now=0)
+    last_activity = dict.fromkeys(ids, 0)
+    samples = dict.fromkeys(ids, (0, 0))
+    for container_id in ids:
+        policy.observe(container_id, 0, {"cpu_percent": 0.0})
+
+    active = rng.sample(ids, int(count * active_fraction))
+    active_set = set(active)
+    heap_time = scan_time = observe_time = 0.0
+    for tick in range(1, ticks + 1):
+        # Os containers ativos mostram CPU; os demais mandam amostras ociosas
+        start = time.perf_counter()
+        for container_id in ids:
+            policy.observe(container_id, tick, {"cpu_percent": 50.0 if container_id in active_set else 0.0})
+        observe_time += time.perf_counter() - start
+        for container_id in active:
+            last_activity[container_id] = tick
+        for container_id in ids:
+            samples[container_id] = (samples[container_id][0], tick)
+
+        start = time.perf_counter()
+        idle = policy.idle_containers(tick)
+        heap_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = full_rescan(last_activity, samples, WINDOW, tick)
+        scan_time += time.perf_counter() - start
+        assert idle == expected, (tick, len(idle), len(expected))
+
+    print(f"{count:>10} | {len(active):>7} | {len(idle):>7} | {heap_time / ticks * 1e6:>15.1f} | "
+          f"{scan_time / ticks * 1e6:>17.1f} | {observe_time / ticks / count * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--containers", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--active", type=float, default=0.1, help="fração de containers com atividade")
+    args = parser.parse_args()
+    print(f"{'containers':>10} | {'ativos':>7} | {'ociosos':>7} | {'heap/tick (us)':>15} | "
+          f"{'varredura (us)':>17} | {'amostra (us)':>16}")
+    for n in args.containers:
+        run(n, args.ticks, args.active)
@@ -0,0 +1,74 @@
+"""Histórico de métricas em disco: abrir uma semana de médias de 1 min de muitos containers.
+
+Uso: python -m benchmarks.bench_metrics_history [--containers 200] [--days 7]
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from src.models.metrics_store import METRICS
+from src.services.metrics_history import MetricsHistory, RECORD, container_key, container_name
+
+RESOLUTION = 60  # segundos, a mesma resolução gravada pelo MetricsStore
+
+
+def current_rss():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+def build_history(history, containers, days, end):
+    """Grava `days` dias de amostras de 1 min para `containers` containers, uma hora por vez."""
+    ids = np.array([container_key(f"{i:012x}") for i in range(containers)], dtype=np.uint64)
+    rng = np.random.default_rng(0)
+    start = end - days * 86400
+    for hour in range(int(start), int(end), 3600):
+        times = np.repeat(np.arange(hour, hour + 3600, RESOLUTION, dtype=np.float64), containers)
+        records = np.zeros(len(times), dtype=RECORD)
+        records["time"] = times
+        records["container"] = np.tile(ids, len(times) // containers)
+        records["values"] = rng.random((len(times), len(METRICS)), dtype=np.float32) * 100
+        history.write_records(records)
+    return ids
+
+
+def measure(name, function):
+    rss_before = current_rss()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<38} | {elapsed * 1000:>10.1f} | {(current_rss() - rss_before) / 2 ** 20:>14.1f}")
+    return result
+
+
+def run(containers, days):
+    end = float(int(time.time()) // 3600 * 3600)
+    with tempfile.TemporaryDirectory() as directory:
+        history = MetricsHistory(directory, retention_days=days + 1)
+
+        start = time.perf_counter()
+        ids = build_history(history, containers, days, end)
+        segments = history.segments()
+        size = sum(path.stat().st_size for _, path in segments)
+        print(f"{containers} containers, {days} dias: {len(segments)} segmentos, {size / 2 ** 20:.1f} MB, "
+              f"gravados em {time.perf_counter() - start:.1f} s")
+        print(f"{'operação':<38} | {'tempo (ms)':>10} | {'RSS (+MB)':>14}")
+
+        week = (end - days * 86400, end)
+        one = container_name(ids[containers // 2])
+        measure("read (1 container, período todo)", lambda: history.read(one, *week, metric="cpu_percent"))
+        measure("summary (todos, período todo)", lambda: history.summary("cpu_percent", *week))
+        measure("read_all (todos, últimas 24 h)", lambda: history.read_all(end - 86400, end))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--containers", type=int, default=200)
+    parser.add_argument("--days", type=int, default=7)
+    args = parser.parse_args()
+    run(args.containers, args.days)
@@ -0,0 +1,150 @@
+"""Suíte de benchmarks offline: DockerUtils e models das tabelas contra o daemon simulado.
+
+Para cada tamanho (containers; imagens = containers / 5, mínimo 10) mede a latência de
+ponta a ponta, o número de chamadas à API e o pico de memória (tracemalloc) de cada
+operação. Os models rodam na plataforma offscreen do Qt.
+
+Uso: python -m benchmarks.bench_suite [--sizes 10 100 1000 10000] [--latency 0.001] [--json saida.json]
+"""
+import argparse
+import json
+import os
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QTableView
+
+from benchmarks.fake_docker_daemon import FakeDockerDaemon
+from src.models.container_table_model import ContainerTableModel
+from src.models.image_table_model import ImageTableModel
+from src.services.docker_utils import DockerUtils
+
+EVENT_TIMEOUT = 10  # segundos esperando o cache refletir um evento
+
+
+def measure(daemon, action):
+    """Executa `action` uma vez e retorna (ms, chamadas à API, pico de memória em KiB)."""
+    QApplication.processEvents()
+    daemon.reset_calls()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        action()
+        QApplication.processEvents()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed * 1000, daemon.total_calls(), peak / 1024
+
+
+def wait_for(condition, timeout=EVENT_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError("o cache não refletiu o evento a tempo")
+        QApplication.processEvents()
+        time.sleep(0.001)
+
+
+def docker_utils_cases(daemon, docker_utils):
+    container_id = daemon.containers[len(daemon.containers) // 2]["Id"][:12]
+    cache = docker_utils.get_state_cache  # o primeiro uso (listagem + thread de eventos) é medido abaixo
+
+    def event_to_cache():
+        # Um container muda de estado no daemon; mede até o snapshot do cache refletir a mudança
+        container = next(c for c in daemon.containers if c["State"] != "running")
+        daemon.set_state(container, "running")
+        wait_for(lambda: any(row["Id"] == container["Id"] and row["Status"] == "running"
+                             for row in cache().snapshot()[1]))
+
+    def stop_running():
+        docker_utils.stop_containers(cache().running()[1][:50])
+
+    return [
+        ("get_all_containers_details", docker_utils.get_all_containers_details),
+        ("get_all_containers_details_subprocess", docker_utils.get_all_containers_details_subprocess),
+        ("get_running_containers_details", docker_utils.get_running_containers_details),
+        ("get_docker_images_details", docker_utils.get_docker_images_details),
+        ("get_container_details", lambda: docker_utils.get_container_details(container_id)),
+        ("logs (tail 1000)", lambda: docker_utils.api_client.logs(container_id, tail=1000)),
+        ("get_state_cache (1º uso)", cache),
+        ("state_cache.refresh", lambda: cache().refresh()),
+        ("state_cache.snapshot", lambda: cache().snapshot()),
+        ("evento -> state_cache", event_to_cache),
+        ("stop_containers (50)", stop_running),
+    ]
+
+
+def model_cases(docker_utils):
+    """Carga inicial (model novo + setModel) e refresh incremental (update_data) das duas tabelas."""
+    view = QTableView()
+    view.resize(1200, 800)
+    view.show()
+    models = {}
+
+    def load_containers():
+        headers, data = docker_utils.get_state_cache().snapshot()
+        models["containers"] = ContainerTableModel(headers, data)
+        view.setModel(models["containers"])
+
+    def refresh_containers():
+        models["containers"].update_data(*docker_utils.get_state_cache().snapshot())
+
+    def load_images():
+        headers, data = docker_utils.get_docker_images_details()
+        models["images"] = ImageTableModel(headers, data)
+        view.setModel(models["images"])
+
+    def refresh_images():
+        models["images"].update_data(*docker_utils.get_docker_images_details())
+
+    cases = [
+        ("ContainerTableModel carga", load_containers),
+        ("ContainerTableModel refresh", refresh_containers),
+        ("ImageTableModel carga", load_images),
+        ("ImageTableModel refresh", refresh_images),
+    ]
+    return cases, view
+
+
+def run_size(size, latency):
+    results = []
+    with FakeDockerDaemon(containers=size, images=max(10, size // 5), latency=latency) as daemon:
+        docker_utils = DockerUtils(daemon.client())
+        cases, view = model_cases(docker_utils)
+
+        for name, action in docker_utils_cases(daemon, docker_utils) + cases:
+            elapsed, calls, peak = measure(daemon, action)
+            results.append({"containers": size, "operação": name, "ms": round(elapsed, 2),
+                            "chamadas": calls, "pico_kib": round(peak, 1)})
+            print(f"{size:>10} | {name:<38} | {elapsed:>10.2f} | {calls:>8} | {peak:>10.1f}")
+
+        docker_utils.get_state_cache().stop()
+        view.close()
+    return results
+
+
+def run(sizes, latency):
+    print(f"{'containers':>10} | {'operação':<38} | {'tempo (ms)':>10} | {'chamadas':>8} | {'pico (KiB)':>10}")
+    results = []
+    for size in sizes:
+        results.extend(run_size(size, latency))
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--latency", type=float, default=0.0, help="latência simulada por requisição (s)")
+    parser.add_argument("--json", help="grava os resultados neste arquivo")
+    args = parser.parse_args()
+
+    app = QApplication([])
+    results = run(args.sizes, args.latency)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
@@ -0,0 +1,122 @@
+"""Custo de refresh das tabelas quando apenas uma linha mudou: recriar o model x diff incremental.
+
+Uso: python -m benchmarks.bench_table_models [--rows 10000] [--repeat 5]
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication, QTableView, QHeaderView
+
+from src.models.container_table_model import ContainerTableModel
+from src.models.image_table_model import ImageTableModel
+
+CONTAINER_HEADERS = ["ID", "Nome", "Imagem", "Status"]
+IMAGE_HEADERS = ["ID", "Repository", "Tag", "Tamanho"]
+TABLE_STYLE = """
+    QTableView {
+        background-color: #44475a;
+        alternate-background-color: #383c4a;
+        color: #f8f8f2;
+        selection-background-color: #bd93f9;
+        selection-color: #282a36;
+    }
+"""
+
+
+def container_rows(count):
+    return [
+        {"ID": f"{i:012x}", "Nome": f"container-{i}", "Imagem": f"image-{i % 50}:latest",
+         "Status": "running" if i % 3 else "stopped"}
+        for i in range(count)
+    ]
+
+
+def image_rows(count):
+    return [[f"{i:012x}", f"repo/image-{i}", "latest", f"{50 + i % 100} MB"] for i in range(count)]
+
+
+def one_row_changed_containers(rows):
+    new_rows = [dict(row) for row in rows]
+    middle = new_rows[len(new_rows) // 2]
+    middle["Status"] = "stopped" if middle["Status"] == "running" else "running"
+    return new_rows
+
+
+def one_row_changed_images(rows):
+    new_rows = [list(row) for row in rows]
+    new_rows[len(new_rows) // 2][3] = "999 MB"
+    return new_rows
+
+
+def time_it(action, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        QApplication.processEvents()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(name, model_cls, headers, rows, changed_rows, repeat):
+    view = QTableView()
+    view.resize(1200, 800)
+    view.show()
+
+    model = model_cls(headers, rows)
+    view.setModel(model)
+    view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    view.setStyleSheet(TABLE_STYLE)
+    view.selectRow(10)
+    view.scrollTo(model.index(len(rows) // 2, 0))
+    QApplication.processEvents()
+
+    def full_reset():
+        # Caminho anterior de load_containers/load_imagens: novo model + setModel + reconfiguração da view
+        view.setModel(model_cls(headers, changed_rows))
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        view.setStyleSheet(TABLE_STYLE)
+
+    reset_time = time_it(full_reset, repeat)
+
+    model = model_cls(headers, rows)
+    view.setModel(model)
+    view.selectRow(10)
+    QApplication.processEvents()
+
+    # Alterna entre os dois snapshots para que cada repetição tenha uma linha diferente
+    snapshots = [changed_rows, rows]
+    state = {"i": 0}
+
+    def incremental():
+        model.update_data(headers, snapshots[state["i"] % 2])
+        state["i"] += 1
+
+    diff_time = time_it(incremental, repeat)
+    selection_kept = view.selectionModel().isRowSelected(10, view.rootIndex())
+
+    print(f"{name:<22} | {len(rows):>7} | {reset_time * 1000:>14.2f} | {diff_time * 1000:>11.2f} | "
+          f"{'sim' if selection_kept else 'não':>16}")
+    view.close()
+
+
+def run(row_count, repeat):
+    print(f"{'model':<22} | {'linhas':>7} | {'setModel (ms)':>14} | {'diff (ms)':>11} | {'seleção mantida':>16}")
+    rows = container_rows(row_count)
+    bench("ContainerTableModel", ContainerTableModel, CONTAINER_HEADERS, rows,
+          one_row_changed_containers(rows), repeat)
+    rows = image_rows(row_count)
+    bench("ImageTableModel", ImageTableModel, IMAGE_HEADERS, rows, one_row_changed_images(rows), repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = QApplication([])
+    run(args.rows, args.repeat)
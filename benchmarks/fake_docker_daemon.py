@@ -0,0 +1,411 @@
+import hashlib
+import json
+import os
+import queue
+import re
+import socketserver
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qs
+
+import docker
+
+API_VERSION = "1.43"
+
+
+def _hex_id(prefix, index):
+    return hashlib.sha256(f"{prefix}-{index}".encode()).hexdigest()
+
+
+def build_images(count):
+    return [
+        {
+            "Id": f"sha256:{_hex_id('a', i)}",
+            "RepoTags": [f"bench/image-{i}:latest"] if i % 10 else ["<none>:<none>"],
+            "Size": 50 * 1024 * 1024 + i,
+            "Created": 1700000000 + i,
+            "Labels": {},
+        }
+        for i in range(count)
+    ]
+
+
+def build_containers(count, images):
+    containers = []
+    for i in range(count):
+        image = images[i % len(images)] if images else {"Id": "", "RepoTags": []}
+        running = i % 3 != 0
+        containers.append({
+            "Id": _hex_id("c", i),
+            "Names": [f"/bench-container-{i}"],
+            "Image": (image.get("RepoTags") or ["<none>"])[0],
+            "ImageID": image["Id"],
+            "Command": "sleep infinity",
+            "Created": 1700000000 + i,
+            "State": "running" if running else "exited",
+            "Status": "Up 2 hours" if running else "Exited (0) 1 hour ago",
+            "Labels": {"bench": "true"},
+            "Ports": [],
+        })
+    return containers
+
+
+def stats_sample(container, sample):
+    """Amostra sintética no formato de /containers/{id}/stats, com contadores crescentes."""
+    running = container["State"] == "running"
+    cpu = sample * 10_000_000 if running else 0
+    return {
+        "read": time.strftime("%Y-%m-%dT%H:%M:%S.000000000Z", time.gmtime()),
+        "id": container["Id"],
+        "name": container["Names"][0],
+        "cpu_stats": {
+            "cpu_usage": {"total_usage": cpu},
+            "system_cpu_usage": sample * 1_000_000_000,
+            "online_cpus": 4,
+        },
+        "precpu_stats": {
+            "cpu_usage": {"total_usage": max(0, cpu - 10_000_000) if running else 0},
+            "system_cpu_usage": (sample - 1) * 1_000_000_000,
+            "online_cpus": 4,
+        },
+        "memory_stats": {"usage": 64 * 1024 * 1024 if running else 0, "limit": 2 * 1024 ** 3, "stats": {"inactive_file": 0}},
+        "networks": {"eth0": {"rx_bytes": sample * 1500, "tx_bytes": sample * 700}},
+        "blkio_stats": {"io_service_bytes_recursive": [
+            {"op": "read", "value": sample * 4096},
+            {"op": "write", "value": sample * 8192},
+        ]},
+    }
+
+
+def frame(payload, stream=1):
+    """Frame do stream multiplexado do Docker: [stream, 0, 0, 0, tamanho (4 bytes big-endian)] + dados."""
+    return bytes([stream, 0, 0, 0]) + len(payload).to_bytes(4, "big") + payload
+
+
+class FakeDockerDaemon:
+    """API do Docker simulada num socket Unix, com dados sintéticos e contagem de chamadas."""
+
+    def __init__(self, containers=100, images=20, latency=0.0, log_lines=1000, stats_interval=1.0):
+        self.latency = latency  # segundos por requisição (float) ou dict rota -> segundos
+        self.log_lines = log_lines
+        self.stats_interval = stats_interval
+        self.images = build_images(images)
+        self.containers = build_containers(containers, self.images)
+        self.calls = Counter()
+        self.stopping = threading.Event()
+        self._subscribers = []  # uma fila por conexão aberta em /events
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self._tmpdir.name, "docker.sock")
+
+    @property
+    def base_url(self):
+        return f"unix://{self.socket_path}"
+
+    def start(self):
+        daemon = self
+
+        class Handler(FakeDockerHandler):
+            fake = daemon
+
+        class Server(socketserver.ThreadingUnixStreamServer):
+            request_queue_size = 512
+
+        self._server = Server(self.socket_path, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.stopping.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+        self._tmpdir.cleanup()
+
+    def client(self):
+        """Cliente docker-py apontando para o daemon simulado (sem negociação de versão)."""
+        return docker.DockerClient(base_url=self.base_url, version=API_VERSION)
+
+    def reset_calls(self):
+        with self._lock:
+            self.calls.clear()
+
+    def total_calls(self):
+        with self._lock:
+            return sum(self.calls.values())
+
+    def record(self, route):
+        with self._lock:
+            self.calls[route] += 1
+
+    def latency_for(self, route):
+        if isinstance(self.latency, dict):
+            return self.latency.get(route, 0.0)
+        return self.latency
+
+    def emit_event(self, container, action, **attributes):
+        """Publica um evento de container para todas as conexões abertas em /events."""
+        now = time.time()
+        event = {
+            "Type": "container",
+            "Action": action,
+            "status": action,
+            "id": container["Id"],
+            "Actor": {
+                "ID": container["Id"],
+                "Attributes": {"name": container["Names"][0].lstrip("/"), "image": container["Image"], **attributes},
+            },
+            "time": int(now),
+            "timeNano": int(now * 1e9),
+        }
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for events in subscribers:
+            events.put(event)
+
+    def subscribe_events(self):
+        events = queue.Queue()
+        with self._lock:
+            self._subscribers.append(events)
+        return events
+
+    def unsubscribe_events(self, events):
+        with self._lock:
+            if events in self._subscribers:
+                self._subscribers.remove(events)
+
+    def set_state(self, container, state):
+        """Muda o estado de um container e publica o evento correspondente, como o daemon faria."""
+        container["State"] = state
+        container["Status"] = "Up 1 second" if state == "running" else "Exited (0) 1 second ago"
+        self.emit_event(container, "start" if state == "running" else "die")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class FakeDockerHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    fake = None
+
+    routes = [
+        ("GET", re.compile(r"^/_ping$"), "ping"),
+        ("GET", re.compile(r"^/version$"), "version"),
+        ("GET", re.compile(r"^/containers/json$"), "list_containers"),
+        ("GET", re.compile(r"^/containers/(?P<id>[^/]+)/json$"), "inspect_container"),
+        ("GET", re.compile(r"^/containers/(?P<id>[^/]+)/logs$"), "container_logs"),
+        ("GET", re.compile(r"^/containers/(?P<id>[^/]+)/stats$"), "container_stats"),
+        ("POST", re.compile(r"^/containers/(?P<id>[^/]+)/start$"), "start_container"),
+        ("POST", re.compile(r"^/containers/(?P<id>[^/]+)/stop$"), "stop_container"),
+        ("POST", re.compile(r"^/containers/(?P<id>[^/]+)/kill$"), "stop_container"),
+        ("DELETE", re.compile(r"^/containers/(?P<id>[^/]+)$"), "remove_container"),
+        ("GET", re.compile(r"^/events$"), "events"),
+        ("GET", re.compile(r"^/images/json$"), "list_images"),
+        ("GET", re.compile(r"^/images/(?P<id>.+)/json$"), "inspect_image"),
+    ]
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def do_DELETE(self):
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method):
+        path, _, query = self.path.partition("?")
+        path = re.sub(r"^/v[0-9.]+", "", path)
+
+        for route_method, pattern, name in self.routes:
+            match = pattern.match(path)
+            if route_method == method and match:
+                route = f"{method} {pattern.pattern.strip('^$')}"
+                self.fake.record(route)
+                latency = self.fake.latency_for(route)
+                if latency:
+                    time.sleep(latency)
+                return getattr(self, name)(query=query, **match.groupdict())
+
+        self.fake.record(f"{method} {path}")
+        self._send_json({"message": f"page not found: {path}"}, status=404)
+
+    def _send_json(self, payload, status=200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_empty(self, status=204):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _start_chunked(self, content_type="application/json"):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_chunk(self, payload):
+        self.wfile.write(f"{len(payload):x}\r\n".encode() + payload + b"\r\n")
+        self.wfile.flush()
+
+    def _end_chunked(self):
+        self.wfile.write(b"0\r\n\r\n")
+        self.close_connection = True
+
+    def _find_container(self, container_id):
+        for c in self.fake.containers:
+            if c["Id"].startswith(container_id) or c["Names"][0] == f"/{container_id}":
+                return c
+        return None
+
+    def _find_image(self, image_id):
+        for image in self.fake.images:
+            if image["Id"] == image_id or image["Id"].startswith(f"sha256:{image_id}") or image_id in image["RepoTags"]:
+                return image
+        return None
+
+    def ping(self, query):
+        body = b"OK"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def version(self, query):
+        self._send_json({"ApiVersion": API_VERSION, "Version": "fake"})
+
+    def list_containers(self, query):
+        params = parse_qs(query)
+        filters = json.loads(params.get("filters", ["{}"])[0])
+        containers = self.fake.containers
+
+        if params.get("all") != ["1"]:
+            containers = [c for c in containers if c["State"] == "running"]
+        if "status" in filters:
+            containers = [c for c in containers if c["State"] in filters["status"]]
+        if "id" in filters:
+            containers = [c for c in containers if any(c["Id"].startswith(i) for i in filters["id"])]
+        self._send_json(containers)
+
+    def inspect_container(self, query, id):
+        c = self._find_container(id)
+        if c is None:
+            return self._send_json({"message": f"No such container: {id}"}, status=404)
+
+        self._send_json({
+            "Id": c["Id"],
+            "Name": c["Names"][0],
+            "Created": time.strftime("%Y-%m-%dT%H:%M:%S.000000000Z", time.gmtime(c["Created"])),
+            "Image": c["ImageID"],
+            "State": {"Status": c["State"], "Running": c["State"] == "running", "Pid": 0},
+            "Config": {"Image": c["Image"], "Env": ["PATH=/usr/bin"], "Labels": c["Labels"], "Tty": False},
+            "HostConfig": {"NetworkMode": "bridge"},
+            "NetworkSettings": {"Ports": {}},
+            "Platform": "linux",
+        })
+
+    def container_logs(self, query, id):
+        """Logs no formato multiplexado (cabeçalho de 8 bytes por frame), como num container sem TTY."""
+        params = parse_qs(query)
+        tail = params.get("tail", ["all"])[0]
+        count = self.fake.log_lines if tail == "all" else min(int(tail), self.fake.log_lines)
+        first = self.fake.log_lines - count
+
+        body = b"".join(
+            frame(f"2024-01-01T00:00:00Z {id[:12]} linha de log {i}\n".encode())
+            for i in range(first, self.fake.log_lines)
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.docker.multiplexed-stream")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def container_stats(self, query, id):
+        c = self._find_container(id)
+        if c is None:
+            return self._send_json({"message": f"No such container: {id}"}, status=404)
+
+        if parse_qs(query).get("stream") == ["0"]:
+            return self._send_json(stats_sample(c, 1))
+
+        self._start_chunked()
+        sample = 1
+        try:
+            while not self.fake.stopping.is_set():
+                self._write_chunk(json.dumps(stats_sample(c, sample)).encode() + b"\n")
+                sample += 1
+                self.fake.stopping.wait(self.fake.stats_interval)
+            self._end_chunked()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def start_container(self, query, id):
+        c = self._find_container(id)
+        if c is None:
+            return self._send_json({"message": f"No such container: {id}"}, status=404)
+        if c["State"] == "running":
+            return self._send_empty(304)
+        self.fake.set_state(c, "running")
+        self._send_empty()
+
+    def stop_container(self, query, id):
+        c = self._find_container(id)
+        if c is None:
+            return self._send_json({"message": f"No such container: {id}"}, status=404)
+        if c["State"] != "running":
+            return self._send_empty(304)
+        self.fake.set_state(c, "exited")
+        self._send_empty()
+
+    def remove_container(self, query, id):
+        c = self._find_container(id)
+        if c is None:
+            return self._send_json({"message": f"No such container: {id}"}, status=404)
+        self.fake.containers.remove(c)
+        self.fake.emit_event(c, "destroy")
+        self._send_empty()
+
+    def events(self, query):
+        """Stream de eventos (uma linha JSON por evento) até o cliente fechar ou o daemon parar."""
+        events = self.fake.subscribe_events()
+        self._start_chunked()
+        try:
+            while not self.fake.stopping.is_set():
+                try:
+                    event = events.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                self._write_chunk(json.dumps(event).encode() + b"\n")
+            self._end_chunked()
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        finally:
+            self.fake.unsubscribe_events(events)
+
+    def list_images(self, query):
+        self._send_json(self.fake.images)
+
+    def inspect_image(self, query, id):
+        image = self._find_image(id)
+        if image is None:
+            return self._send_json({"message": f"No such image: {id}"}, status=404)
+        self._send_json(image)
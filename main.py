@@ -1,15 +1,78 @@
 import os
 import sys
 
-from PyQt5.QtWidgets import QApplication
+PROFILE_STARTUP = "--profile-startup" in sys.argv
 
+if PROFILE_STARTUP:
+    sys.argv.remove("--profile-startup")
+    from src.utils.startup_profiler import StartupProfiler
+    profiler = StartupProfiler()
+
+# Só o mínimo é importado aqui; o pacote docker, a UI, os diálogos e os workers
+# são carregados depois do QApplication, quando a janela principal é criada
 from src.services.config_utils import load_config, log_and_notify
-from src.services.docker_utils import DockerUtils
-from src.ui.docker_monitor import DockerMonitor
-from src.utils.constantes_utils import iniciar_popup_monitoramento
+
+
+def run_app(monitoring_enabled):
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication(sys.argv)
+
+    from src.services.docker_utils import DockerUtils
+    from src.ui.docker_monitor import DockerMonitor
+
+    if monitoring_enabled:
+        from src.utils.constantes_utils import iniciar_popup_monitoramento
+        iniciar_popup_monitoramento()
+
+    log_and_notify("Aplicação iniciada...")
+    monitor = DockerMonitor(DockerUtils())
+    monitor.show()
+    return app.exec_()
+
+
+def run_profiled_app(monitoring_enabled):
+    """Mesmo fluxo de run_app, medindo cada fase; imprime o relatório ao fim da carga inicial e encerra."""
+    with profiler.phase("import PyQt5.QtWidgets"):
+        from PyQt5.QtWidgets import QApplication
+
+    with profiler.phase("QApplication"):
+        app = QApplication(sys.argv)
+
+    with profiler.phase("import DockerUtils"):
+        from src.services.docker_utils import DockerUtils
+
+    with profiler.phase("import DockerMonitor (UI)"):
+        from src.ui.docker_monitor import DockerMonitor
+
+    with profiler.phase("DockerUtils()"):
+        docker_utils = DockerUtils()
+
+    with profiler.phase("DockerMonitor.__init__"):
+        monitor = DockerMonitor(docker_utils)
+
+    with profiler.phase("show()"):
+        monitor.show()
+    profiler.mark("janela exibida")
+
+    def initial_load_finished():
+        # As listagens rodam no QThreadPool: só aqui as duas tabelas estão preenchidas
+        profiler.mark("carga inicial concluída")
+        profiler.stop()
+        print(profiler.report())
+        app.quit()
+
+    monitor.initial_load_finished.connect(initial_load_finished)
+    return app.exec_()
+
 
 if __name__ == "__main__":
 
+    # Processo do daemon de monitoramento (iniciado pela primeira janela que precisa dele)
+    if "--monitor-daemon" in sys.argv:
+        from src.services.monitor_daemon import run_daemon
+        sys.exit(run_daemon())
+
     if getattr(sys, 'frozen', False):
         base_path = os.path.dirname(sys.executable)
         os.environ['QT_QPA_PLATFORM_PLUGIN_PATH'] = os.path.join(base_path, "platforms")
@@ -20,16 +83,11 @@ if __name__ == "__main__":
     # Verifica se o argumento "monitoramento" foi passado
     if len(sys.argv) > 1 and sys.argv[1] == "monitoramento":
         if monitoring_enabled:
+            from src.utils.constantes_utils import iniciar_popup_monitoramento
             iniciar_popup_monitoramento()
         sys.exit(0)
 
-    docker_utils = DockerUtils()
-    app = QApplication(sys.argv)
+    if PROFILE_STARTUP:
+        sys.exit(run_profiled_app(False))
 
-    if monitoring_enabled:
-        iniciar_popup_monitoramento()
-
-    log_and_notify("Aplicação iniciada...")
-    monitor = DockerMonitor(docker_utils)
-    monitor.show()
-    sys.exit(app.exec_())
\ No newline at end of file
+    sys.exit(run_app(monitoring_enabled))
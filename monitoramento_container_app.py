@@ -1,9 +1,7 @@
 import socket
 import sys
 
-from PyQt5.QtWidgets import QApplication
-
-from src.dialogs.reminder_dialog import ReminderPopup
+SINGLETON_ADDRESS = '\0docker_monitor_popup_singleton'
 
 singleton_socket = None
 
@@ -12,18 +10,66 @@ def is_already_running():
     global singleton_socket
     singleton_socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
     try:
-        singleton_socket.bind('\0docker_monitor_popup_singleton')
+        singleton_socket.bind(SINGLETON_ADDRESS)
         return False
     except socket.error:
         return True
 
+def notify_running_instance(message):
+    """Manda a mensagem para a instância em execução pelo mesmo socket (sem carregar Qt nem docker)."""
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        client.sendto(message, SINGLETON_ADDRESS)
+        return True
+    except socket.error:
+        return False
+    finally:
+        client.close()
+
+def watch_activation(popup):
+    """Atende, no event loop do Qt, as mensagens enviadas por novas execuções do app."""
+    from PyQt5.QtCore import QSocketNotifier
+
+    singleton_socket.setblocking(False)
+
+    def read_messages():
+        while True:
+            try:
+                message = singleton_socket.recv(64)
+            except BlockingIOError:
+                return
+            if message == b"show":
+                popup.show_popup()
+            elif message == b"refresh":
+                popup.reconcile_state_cache()
+
+    notifier = QSocketNotifier(singleton_socket.fileno(), QSocketNotifier.Read, popup)
+    notifier.activated.connect(read_messages)
+    return notifier
+
 if __name__ == "__main__":
 
+    # Processo do daemon de monitoramento (iniciado pela primeira janela que precisa dele)
+    if "--monitor-daemon" in sys.argv:
+        from src.services.monitor_daemon import run_daemon
+        sys.exit(run_daemon())
+
     if is_already_running():
-        print("Já existe uma instância do popup em execução.")
+        # Em vez de só recusar, reativa a instância em execução: "show" traz o popup para a
+        # frente; "refresh" (usado ao reiniciar o monitoramento pelo app) só atualiza a lista
+        message = b"refresh" if "--refresh" in sys.argv else b"show"
+        if not notify_running_instance(message):
+            print("Já existe uma instância do popup em execução.")
         sys.exit(0)
 
+    # Qt e o popup só são carregados depois de confirmar que não há outra instância
+    from PyQt5.QtWidgets import QApplication
+    from src.dialogs.reminder_dialog import ReminderPopup
+
     app = QApplication(sys.argv)
     popup = ReminderPopup()
-    popup.show()
+    watch_activation(popup)
+    # Com um "Lembrar" pendente o popup fica na bandeja até o prazo vencer
+    if not popup.waiting_reminder():
+        popup.show()
     sys.exit(app.exec_())
@@ -17,7 +17,7 @@ qt_plugins_path = os.path.join(os.path.dirname(PyQt5.__file__), "Qt5", "plugins"
 build_dir = "build/DockerMonitor"
 
 # Dependências adicionais (se necessário, adicione mais aqui)
-packages = ["os", "sys", "PyQt5"]
+packages = ["os", "sys", "PyQt5", "numpy"]
 includes = [
     "PyQt5.QtCore",
     "PyQt5.QtGui",
@@ -1,13 +1,19 @@
 from PyQt5.QtWidgets import (
     QDialog, QTabWidget, QVBoxLayout, QWidget, QFormLayout,
-    QLineEdit, QMessageBox, QPushButton, QHBoxLayout, QTextEdit, QSpinBox, QFileDialog
+    QLineEdit, QMessageBox, QPushButton, QHBoxLayout, QTableView, QSpinBox, QFileDialog, QAbstractItemView,
+    QApplication, QShortcut, QHeaderView
 )
 from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QKeySequence
 import json
 
+from src.models.log_list_model import LogListModel
+
 from src.services.docker_utils import DockerUtils
 from src.services.log_updater_thread import LogUpdaterThread
 
+MAX_LOG_LINES = 1000000
+
 
 class ContainerDetailsDialog(QDialog):
     def __init__(self, dockerUtlis: DockerUtils, container_id, parent=None):
@@ -110,9 +116,10 @@ class ContainerDetailsDialog(QDialog):
 
         # Campo para definir quantidade de linhas
         self.line_count_spin = QSpinBox()
-        self.line_count_spin.setRange(10, 10000)
+        self.line_count_spin.setRange(10, MAX_LOG_LINES)
         self.line_count_spin.setValue(100)
         self.line_count_spin.setSuffix(" linhas")
+        self.line_count_spin.setKeyboardTracking(False)
         self.line_count_spin.setStyleSheet("color: #f8f8f2; background-color: #3b3d48; padding: 4px;")
         self.line_count_spin.valueChanged.connect(self.restart_log_thread)
 
@@ -126,13 +133,28 @@ class ContainerDetailsDialog(QDialog):
         config_layout.addStretch()
         config_layout.addWidget(export_button)
 
-        # Área de texto para logs
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("color: #f8f8f2; background-color: #282a36; font-family: 'Courier New';")
+        # Lista virtualizada para logs: só as linhas visíveis são desenhadas e o buffer
+        # mantém as últimas N linhas, descartando as mais antigas. QTableView com altura de
+        # linha fixa escala para milhões de linhas (QListView refaz o layout a cada inserção)
+        self.log_model = LogListModel(self.line_count_spin.value())
+        self.log_view = QTableView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setShowGrid(False)
+        self.log_view.setWordWrap(False)
+        self.log_view.horizontalHeader().hide()
+        self.log_view.horizontalHeader().setStretchLastSection(True)
+        self.log_view.verticalHeader().hide()
+        self.log_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.log_view.verticalHeader().setDefaultSectionSize(18)
+        self.log_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.log_view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.log_view.setStyleSheet("color: #f8f8f2; background-color: #282a36; font-family: 'Courier New';")
+
+        copy_shortcut = QShortcut(QKeySequence.Copy, self.log_view)
+        copy_shortcut.activated.connect(self.copy_selected_logs)
 
         log_layout.addLayout(config_layout)
-        log_layout.addWidget(self.log_text)
+        log_layout.addWidget(self.log_view)
         log_tab.setLayout(log_layout)
 
         return log_tab
@@ -141,19 +163,38 @@ class ContainerDetailsDialog(QDialog):
         if self.log_thread:
             self.log_thread.stop()
 
-        self.log_thread = LogUpdaterThread(self.container_id, self.line_count_spin.value())
+        self.log_model.clear()
+        self.log_model.set_capacity(self.line_count_spin.value())
+
+        self.log_thread = LogUpdaterThread(self.container_id, self.line_count_spin.value(), self.dockerUtlis)
         self.log_thread.new_logs.connect(self.update_logs)
+        self.log_thread.new_lines.connect(self.append_logs)
         self.log_thread.start()
 
     def restart_log_thread(self):
         self.start_log_thread()
 
     def update_logs(self, logs):
-        self.log_text.setPlainText(logs)
-        self.log_text.moveCursor(self.log_text.textCursor().End)
+        self.log_model.set_text(logs)
+        self.log_view.scrollToBottom()
+
+    def append_logs(self, lines):
+        scrollbar = self.log_view.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum() - 2
+
+        self.log_model.append_lines(lines)
+
+        # Só acompanha o final se o usuário não tiver rolado para cima
+        if at_bottom:
+            self.log_view.scrollToBottom()
+
+    def copy_selected_logs(self):
+        rows = sorted(index.row() for index in self.log_view.selectionModel().selectedRows())
+        if rows:
+            QApplication.clipboard().setText("\n".join(self.log_model.buffer.line(row) for row in rows))
 
     def export_logs(self):
-        log_text = self.log_text.toPlainText()
+        log_text = self.log_model.text()
         if not log_text.strip():
             QMessageBox.information(self, "Exportação", "Nenhum log para exportar.")
             return
@@ -1,18 +1,27 @@
 import os
 import platform
-import subprocess
 
-from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation
+from PyQt5.QtCore import Qt, QTimer, QPropertyAnimation, QThreadPool, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon, QCursor
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton, QCheckBox, QHBoxLayout, QInputDialog, \
     QMessageBox, QScrollArea, QApplication, QGraphicsOpacityEffect, QSystemTrayIcon, QMenu, QAction, QMainWindow
 
-from src.services.config_utils import load_config, log_and_notify
+from src.services.config_service import get_config_service
+from src.services.config_utils import log_and_notify
+from src.services.container_state_cache import HEADERS, RECONNECT_DELAY
+from src.services.stop_engine import format_stop_summary
 from src.services.docker_utils import DockerUtils
+from src.services.reminder_scheduler import ReminderScheduler
 from src.utils.constantes_utils import ICON_PATH
+from src.worker.stop_all_containers_worker import StopAllContainersWorker
+
+DEFAULT_REFRESH_INTERVAL = 30  # segundos, reconciliação de segurança além dos eventos
+RUNNING_LABEL = "Containers em execução encontrados.\nDeseja manter ou pará-los?"
 
 
 class ReminderPopup(QMainWindow):
+    state_cache_ready = pyqtSignal()  # cache de containers conectado (iniciado fora da thread da UI)
+    state_cache_failed = pyqtSignal(str)  # mensagem de erro da conexão
     def __init__(self):
         super().__init__()
 
@@ -21,9 +30,12 @@ class ReminderPopup(QMainWindow):
         self.docker_utlis = DockerUtils()
         self.timer_label = None
         self.checkboxes = []
+        self.running_containers = []
 
-        self.settings = load_config()
+        self.config_service = get_config_service()
+        self.settings = self.config_service.settings()
         self.timeout_seconds = int(self.settings.get("timeout", 1800))
+        self.refresh_interval = int(self.settings.get("running_refresh_interval", DEFAULT_REFRESH_INTERVAL))
         self.remaining_time = self.timeout_seconds
 
         self.setWindowTitle("Monitoramento de Container")
@@ -34,18 +46,39 @@ class ReminderPopup(QMainWindow):
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.update_timer)
 
+        self.reminder_scheduler = ReminderScheduler()
+        self.reminder_scheduler.due.connect(self.on_reminder_due)
+
         self.init_icon()
         self.init_ui()
-        self.start_timer()
+        self.reminder_scheduler.start()
+        if not self.waiting_reminder():
+            self.start_timer()
         self.center_on_screen()
         self.init_tray_icon()
+        self.config_service.config_changed.connect(self.apply_config)
         # self.hide()
 
+    def apply_config(self, settings):
+        """Novo timeout ajusta a contagem em andamento; monitoramento desativado encerra o popup."""
+        self.settings = settings
+        if not settings.get("monitoring_enabled", False):
+            log_and_notify("Monitoramento desativado nas configurações. Popup encerrado.")
+            self.timer.stop()
+            QApplication.quit()
+            return
+
+        timeout_seconds = int(settings.get("timeout", 1800))
+        if timeout_seconds != self.timeout_seconds:
+            self.remaining_time = max(1, self.remaining_time + timeout_seconds - self.timeout_seconds)
+            self.timeout_seconds = timeout_seconds
+            self.update_timer_display()
+
     def init_ui(self):
         central_widget = QWidget()
         layout = QVBoxLayout(central_widget)
 
-        self.label = QLabel("Containers em execução encontrados.\nDeseja manter ou pará-los?")
+        self.label = QLabel(RUNNING_LABEL)
         self.label.setAlignment(Qt.AlignCenter)
         self.label.setStyleSheet("font-weight: bold; font-size: 18px; margin-bottom: 20px;")
         layout.addWidget(self.label)
@@ -135,13 +168,48 @@ class ReminderPopup(QMainWindow):
         self.setCentralWidget(central_widget)
 
 
-        # Cria os checkboxes iniciais
-        self.update_checkboxes()
+        # Checkboxes iniciais a partir do último snapshot salvo; o cache conecta ao daemon em segundo plano
+        self.state_cache = None
+        self.show_saved_snapshot()
+        self.state_cache_ready.connect(self.on_state_cache_ready)
+        self.state_cache_failed.connect(self.on_state_cache_failed)
+        self.connect_state_cache()
 
         #manter na ultima posição
         self.exec_refresh_checkboxes()
         self.update_timer_display()
 
+    def show_saved_snapshot(self):
+        snapshot = self.docker_utlis.snapshot_store.load("containers")
+        if snapshot is None:
+            return
+        headers, rows, saved_at = snapshot
+        self.running_containers = [row for row in rows if row.get("Status") == "running"]
+        self.update_checkboxes()
+        self.label.setText(f"{RUNNING_LABEL}\n(lista da última verificação, atualizando...)")
+
+    def connect_state_cache(self):
+        QThreadPool.globalInstance().start(self.start_state_cache_task)
+
+    def start_state_cache_task(self):
+        try:
+            self.docker_utlis.get_state_cache()
+            self.state_cache_ready.emit()
+        except Exception as e:
+            log_and_notify(f"Erro ao conectar ao Docker: {e}")
+            self.state_cache_failed.emit(str(e))
+
+    def on_state_cache_failed(self, message):
+        # A lista exibida (snapshot salvo ou vazia) não é confirmada até a conexão dar certo
+        self.label.setText(f"{RUNNING_LABEL}\n(erro ao conectar ao Docker: {message}; tentando novamente...)")
+        QTimer.singleShot(int(RECONNECT_DELAY * 1000), self.connect_state_cache)
+
+    def on_state_cache_ready(self):
+        self.state_cache = self.docker_utlis.get_state_cache()
+        self.state_cache.subscribe(self.refresh_running_containers)
+        self.refresh_running_containers()
+        self.label.setText(RUNNING_LABEL)
+
     def init_icon(self):
         if os.path.exists(ICON_PATH):
             self.setWindowIcon(QIcon(ICON_PATH))
@@ -163,7 +231,6 @@ class ReminderPopup(QMainWindow):
         if self.remaining_time <= 0:
             self.timer.stop()
             self.auto_stop()
-            self.close()
 
     def update_timer_display(self):
         minutes = 00
@@ -184,6 +251,17 @@ class ReminderPopup(QMainWindow):
             time_str_zerado = f"{minutes:02}:{seconds:02}"
             self.label_tempo.setText(time_str_zerado)
 
+    def refresh_running_containers(self):
+        """Atualiza o conjunto de containers em execução a partir do cache (sem I/O)."""
+        headers, self.running_containers = self.state_cache.running()
+        # Sem daemon a política de ociosidade roda aqui; com ele, o daemon já acompanha os containers
+        self.docker_utlis.sync_idle_policy(self.running_containers)
+
+        names = [container['Nome'] for container in self.running_containers]
+        if names != [cb.text() for cb in self.checkboxes]:
+            self.update_checkboxes()
+        self.update_timer_display()
+
     def update_checkboxes(self):
         # Armazena os nomes dos checkboxes marcados atualmente
         checked_names = set(cb.text() for cb in self.checkboxes if cb.isChecked())
@@ -196,8 +274,7 @@ class ReminderPopup(QMainWindow):
         self.checkboxes.clear()
 
         # Recria checkboxes com containers atuais
-        headers, containers = self.get_containers_running()
-        for container in containers:
+        for container in self.running_containers:
             checkbox = QCheckBox(container['Nome'])
 
             # Marca checkbox se ele estava marcado anteriormente
@@ -239,8 +316,36 @@ class ReminderPopup(QMainWindow):
             self.checkboxes.append(checkbox)
 
     def auto_stop(self):
-        self.docker_utlis.stop_containers()
-        log_and_notify("Tempo esgotado. Containers foram parados automaticamente.")
+        # Só para os containers ociosos há mais que "idle_window"; os ocupados e os isentos continuam
+        idle = set()
+        if self.state_cache is not None:
+            try:
+                idle = self.docker_utlis.idle_containers()
+            except Exception as e:
+                log_and_notify(f"Erro ao consultar containers ociosos: {e}")
+        containers = [c for c in self.running_containers if c.get("Id") in idle]
+        if not containers:
+            log_and_notify("Tempo esgotado, mas nenhum container está ocioso. Contagem reiniciada.")
+            self.restart_countdown()
+            return
+
+        # Calculado antes da parada: os eventos de "die" atualizam running_containers no meio
+        busy_left = len(containers) < len(self.running_containers)
+
+        def on_finished(results):
+            nome_formatados = ', '.join(r['Nome'] for r in results)
+            log_and_notify(f"Tempo esgotado. Containers ociosos parados automaticamente: [{nome_formatados}]")
+            if busy_left:
+                self.restart_countdown()
+            else:
+                self.close()
+
+        self.run_stop_worker(containers, on_finished)
+
+    def restart_countdown(self):
+        self.remaining_time = self.timeout_seconds
+        self.update_timer_display()
+        self.start_timer()
 
     def keep_containers(self):
         log_and_notify("Usuário optou por manter os containers em execução.")
@@ -253,16 +358,36 @@ class ReminderPopup(QMainWindow):
             QMessageBox.warning(self, "Aviso", "Selecione pelo menos um container.")
             return
 
-        container_names = []
-        for name in selected:
-            container_names.append(name)
-            self.docker_utlis.stop_container_by_name_or_id(name)
+        containers = [c for c in self.running_containers if c['Nome'] in selected]
+
+        def on_finished(results):
+            nome_formatados = ', '.join(r['Nome'] for r in results)
+            msg = f'Os seguintes containers foram parados: \n[{nome_formatados}]'
+            QMessageBox.information(self, "Resultado", f"{msg}\n\n{format_stop_summary(results)}")
+            log_and_notify(msg)
+            self.verify_containers()
+
+        self.run_stop_worker(containers, on_finished)
+
+    def run_stop_worker(self, containers, on_finished):
+        """Para os containers (None = todos em execução) numa thread, chamando on_finished(resultados) ao final."""
+        self.stop_button.setEnabled(False)
+
+        self.thread_stop_containers = QThread()
+        self.worker_stop_containers = StopAllContainersWorker(self.docker_utlis, containers)
+        self.worker_stop_containers.moveToThread(self.thread_stop_containers)
 
-        nome_formatados = ', '.join(container_names)
-        msg = f'Os seguintes containers foram parados: \n[{nome_formatados}]'
-        QMessageBox.information(self, "Resultado", msg)
-        log_and_notify(msg)
-        self.verify_containers()
+        self.thread_stop_containers.started.connect(self.worker_stop_containers.run)
+        self.worker_stop_containers.finished.connect(self.thread_stop_containers.quit)
+        self.worker_stop_containers.finished.connect(self.worker_stop_containers.deleteLater)
+        self.thread_stop_containers.finished.connect(self.thread_stop_containers.deleteLater)
+
+        def finished(results):
+            self.stop_button.setEnabled(True)
+            on_finished(results)
+
+        self.worker_stop_containers.finished.connect(finished)
+        self.thread_stop_containers.start()
 
     def remind_later(self):
         minutes, ok = QInputDialog.getInt(
@@ -274,10 +399,20 @@ class ReminderPopup(QMainWindow):
             log_and_notify(f"Usuário escolheu ser lembrado em {minutes} minutos.")
             QMessageBox.information(self, "Agendado",
                                     f"Você será lembrado novamente em {minutes} minutos.")
-            subprocess.Popen(["bash", "-c",
-                              f"sleep {delay_seconds} && python3 {os.path.abspath(__file__)} &"],
-                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            self.close_app()
+            # O próprio processo (na bandeja) reabre o popup no prazo; a contagem atual é suspensa
+            self.reminder_scheduler.schedule(delay_seconds)
+            self.timer.stop()
+            self.hide_to_tray()
+
+    def on_reminder_due(self, reminder):
+        """Prazo do "Lembrar" vencido: reinicia a contagem e mostra o popup de novo."""
+        log_and_notify("Lembrete agendado: verificando containers em execução.")
+        self.restart_countdown()
+        self.show_popup()
+
+    def waiting_reminder(self):
+        """Há um "Lembrar" pendente (de uma execução anterior): o popup começa escondido até o prazo."""
+        return bool(self.reminder_scheduler.pending())
 
     def center_on_screen(self):
         screen = QApplication.primaryScreen()
@@ -350,37 +485,51 @@ class ReminderPopup(QMainWindow):
         else:
             event.ignore()
 
-    def close_app(self):
-        if self.tray_icon and platform.system() in ["Linux", "Windows"]:
-            self.hide()
+    def hide_to_tray(self):
+        self.hide()
+        if self.tray_icon:
             self.tray_icon.showMessage(
                 "Docker Monitor",
                 "O monitor está rodando minimizado na bandeja.",
                 QSystemTrayIcon.Information,
                 2000
             )
+
+    def close_app(self):
+        if self.tray_icon and platform.system() in ["Linux", "Windows"]:
+            self.hide_to_tray()
         else:
             QApplication.quit()
 
     def exec_refresh_checkboxes(self):
-        self.timer_refresh_checkboxes = QTimer()
-        self.timer_refresh_checkboxes.timeout.connect(self.update_checkboxes)
-        self.timer_refresh_checkboxes.start(5000)  # 5000 ms = 5 segundos
+        # Os eventos do Docker mantêm o cache atualizado; este timer apenas reconcilia em segundo plano
+        self.timer_refresh_checkboxes = QTimer(self)
+        self.timer_refresh_checkboxes.timeout.connect(self.reconcile_state_cache)
+        if self.refresh_interval > 0:
+            self.timer_refresh_checkboxes.start(self.refresh_interval * 1000)
+
+    def reconcile_state_cache(self):
+        QThreadPool.globalInstance().start(self.reconcile_state_cache_task)
+
+    def reconcile_state_cache_task(self):
+        if self.state_cache is None:
+            return
+        try:
+            self.state_cache.refresh()
+        except Exception as e:
+            log_and_notify(f"Erro ao atualizar containers em execução: {e}")
 
     def verify_containers(self):
+        # Ação do usuário: sincroniza o cache antes de decidir se ainda há containers rodando
+        self.state_cache = self.docker_utlis.get_state_cache()
+        self.state_cache.refresh()
+        self.refresh_running_containers()
         if not self.exist_containers_running():
             QMessageBox.information(self, "Resultado", "Todos os containers foram parados.")
             self.close_app()
-        else:
-            self.update_checkboxes()
 
     def exist_containers_running(self):
-        headers, containers = self.get_containers_running()
-        if len(containers) >= 1:
-            return True
-
-        return False
+        return len(self.running_containers) >= 1
 
     def get_containers_running(self):
-        headers, containers = self.docker_utlis.get_running_containers_details()
-        return headers, containers
\ No newline at end of file
+        return HEADERS, list(self.running_containers)
\ No newline at end of file
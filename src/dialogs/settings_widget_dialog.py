@@ -28,6 +28,14 @@ class SettingsWidgetDialog(QWidget):
 
         self.setLayout(layout)
 
+    def set_values(self, monitor_enabled, timeout_seconds):
+        """Atualiza os campos sem emitir settings_changed (configuração alterada fora desta tela)."""
+        self.monitor_enabled_checkbox.blockSignals(True)
+        self.monitor_enabled_checkbox.setChecked(monitor_enabled)
+        self.monitor_enabled_checkbox.blockSignals(False)
+        self.timeout_input.setValue(timeout_seconds // 60)
+        self.timeout_input.setVisible(monitor_enabled)
+
     def emit_settings(self):
         monitor_ativo = self.monitor_enabled_checkbox.isChecked()
         try:
@@ -1,26 +1,72 @@
+from operator import itemgetter
+
 from PyQt5.QtCore import Qt, QAbstractTableModel
 
+from src.models.table_diff import apply_keyed_diff
+
+SPARKLINE_ROLE = Qt.UserRole + 1  # série de valores desenhada pelo SparklineDelegate
+
 
 class ContainerTableModel(QAbstractTableModel):
-    def __init__(self, headers, data):
+    def __init__(self, headers, data, stats_headers=()):
         super().__init__()
         self.headers = headers
-        self.data = data
+        self.data_list = list(data)
+        # Colunas de estatísticas ficam depois das do snapshot, com valores por ID (update_stats)
+        self.stats_headers = list(stats_headers)
+        self.stats = {}
+        self.sparklines = {}  # ID -> valores recentes, por SPARKLINE_ROLE
 
     def rowCount(self, parent=None):
-        return len(self.data)
+        return len(self.data_list)
 
     def columnCount(self, parent=None):
-        return len(self.headers)
+        return len(self.headers) + len(self.stats_headers)
 
     def data(self, index, role=Qt.DisplayRole):
         if role == Qt.DisplayRole:
-            row = self.data[index.row()]
-            col = self.headers[index.column()]
-            return row.get(col, '')
+            row = self.data_list[index.row()]
+            column = index.column()
+            if column >= len(self.headers):
+                return self.stats.get(row.get("ID"), {}).get(self.stats_headers[column - len(self.headers)], '')
+            return row.get(self.headers[column], '')
+        if role == SPARKLINE_ROLE:
+            return self.sparklines.get(self.data_list[index.row()].get("ID"))
         return None
 
     def headerData(self, section, orientation, role=Qt.DisplayRole):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            return self.headers[section]
-        return None
\ No newline at end of file
+            return (self.headers + self.stats_headers)[section]
+        return None
+
+    def update_stats(self, stats, sparklines=None):
+        """Troca os valores das colunas de estatísticas (ID -> {coluna: texto}) com um único dataChanged."""
+        self.stats = stats
+        if sparklines is not None:
+            self.sparklines = sparklines
+        if self.data_list and self.stats_headers:
+            first = len(self.headers)
+            self.dataChanged.emit(self.index(0, first),
+                                  self.index(len(self.data_list) - 1, first + len(self.stats_headers) - 1),
+                                  [Qt.DisplayRole, SPARKLINE_ROLE])
+
+    def update_data(self, headers, data):
+        """Aplica um novo snapshot por diff (chave = ID), notificando só as linhas alteradas."""
+        if headers != self.headers:
+            self.beginResetModel()
+            self.headers = headers
+            self.data_list = list(data)
+            self.endResetModel()
+            return
+
+        apply_keyed_diff(self, self.data_list, data, itemgetter("ID"))
+
+    def get_container_id(self, row):
+        if 0 <= row < len(self.data_list):
+            return self.data_list[row].get("ID")
+        return None
+
+    def get_container_name(self, row):
+        if 0 <= row < len(self.data_list):
+            return self.data_list[row].get("Nome")
+        return None
@@ -1,11 +1,15 @@
+from operator import itemgetter
+
 from PyQt5.QtCore import QAbstractTableModel, Qt, QVariant
 
+from src.models.table_diff import apply_keyed_diff
+
 
 class ImageTableModel(QAbstractTableModel):
     def __init__(self, headers, data):
         super().__init__()
         self.headers = headers
-        self.data_list = data
+        self.data_list = list(data)
 
     def rowCount(self, parent=None):
         return len(self.data_list)
@@ -31,6 +35,17 @@ class ImageTableModel(QAbstractTableModel):
         else:
             return str(section + 1)
 
+    def update_data(self, headers, data):
+        """Aplica um novo snapshot por diff (chave = ID + Repository + Tag, já que uma imagem pode ter várias tags)."""
+        if headers != self.headers:
+            self.beginResetModel()
+            self.headers = headers
+            self.data_list = list(data)
+            self.endResetModel()
+            return
+
+        apply_keyed_diff(self, self.data_list, data, itemgetter(0, 1, 2))
+
     def get_image_name(self, row):
         """Retorna o nome da imagem (coluna 'Name') da linha especificada"""
         if 0 <= row < len(self.data_list):
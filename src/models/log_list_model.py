@@ -0,0 +1,56 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from src.models.log_ring_buffer import LogRingBuffer
+
+
+class LogListModel(QAbstractListModel):
+    """Model de linhas de log sobre um LogRingBuffer; a view só pede as linhas visíveis."""
+
+    def __init__(self, capacity):
+        super().__init__()
+        self.buffer = LogRingBuffer(capacity)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.buffer)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.buffer.line(index.row())
+        return None
+
+    def append_lines(self, lines):
+        if not lines:
+            return
+
+        dropped = self.buffer.overflow(len(lines))
+        if dropped:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            self.buffer.drop_front(dropped)
+            self.endRemoveRows()
+
+        lines = lines[-self.buffer.capacity:]
+        start = len(self.buffer)
+        self.beginInsertRows(QModelIndex(), start, start + len(lines) - 1)
+        self.buffer.append(lines)
+        self.endInsertRows()
+
+    def set_text(self, text):
+        self.beginResetModel()
+        self.buffer.clear()
+        self.buffer.append(text.splitlines())
+        self.endResetModel()
+
+    def set_capacity(self, capacity):
+        self.beginResetModel()
+        self.buffer.set_capacity(capacity)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.buffer.clear()
+        self.endResetModel()
+
+    def text(self):
+        return self.buffer.text()
@@ -0,0 +1,75 @@
+from array import array
+from itertools import accumulate, islice
+
+COMPACT_MIN_LINES = 4096
+
+
+class LogRingBuffer:
+    """Buffer de capacidade fixa para linhas de log.
+
+    As linhas ficam num único bytearray (UTF-8) indexado por offsets, em vez de um str
+    por linha. Linhas descartadas do início só liberam memória na compactação, que
+    acontece quando a parte descartada passa a ser maior que a parte viva.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = max(1, capacity)
+        self.clear()
+
+    def clear(self):
+        self._data = bytearray()
+        self._offsets = array("Q", [0])  # linha i ocupa _data[_offsets[i]:_offsets[i + 1]]
+        self._first = 0
+
+    def __len__(self):
+        return len(self._offsets) - 1 - self._first
+
+    def nbytes(self):
+        return len(self._data) + self._offsets.itemsize * len(self._offsets)
+
+    def line(self, index):
+        i = self._first + index
+        return self._data[self._offsets[i]:self._offsets[i + 1]].decode("utf-8", errors="replace")
+
+    def lines(self, start=0, stop=None):
+        stop = len(self) if stop is None else min(stop, len(self))
+        return [self.line(i) for i in range(start, stop)]
+
+    def text(self):
+        return "\n".join(self.lines())
+
+    def overflow(self, count):
+        """Quantas linhas do início seriam descartadas ao anexar `count` linhas."""
+        return max(0, len(self) + min(count, self.capacity) - self.capacity)
+
+    def append(self, lines):
+        """Anexa as linhas e descarta as mais antigas além da capacidade; retorna quantas caíram."""
+        if len(lines) > self.capacity:
+            lines = lines[-self.capacity:]
+
+        encoded = [line.encode("utf-8", errors="replace") for line in lines]
+        base = len(self._data)
+        self._data += b"".join(encoded)
+        # O offset inicial (base) já é o último da lista
+        self._offsets.extend(islice(accumulate((len(e) for e in encoded), initial=base), 1, None))
+
+        dropped = max(0, len(self) - self.capacity)
+        self.drop_front(dropped)
+        return dropped
+
+    def drop_front(self, count):
+        self._first += min(count, len(self))
+        self._compact()
+
+    def set_capacity(self, capacity):
+        self.capacity = max(1, capacity)
+        self.drop_front(max(0, len(self) - self.capacity))
+
+    def _compact(self):
+        if self._first < COMPACT_MIN_LINES or self._first < len(self):
+            return
+
+        base = self._offsets[self._first]
+        del self._data[:base]
+        self._offsets = array("Q", (offset - base for offset in self._offsets[self._first:]))
+        self._first = 0
@@ -0,0 +1,168 @@
+import threading
+
+import numpy as np
+
+METRICS = ("cpu_percent", "memory_usage", "memory_limit", "net_rx", "net_tx", "block_read", "block_write")
+# (resolução em segundos, posições): 5 min a 1 s, 1 h a 10 s e 24 h a 1 min
+TIERS = ((1, 300), (10, 360), (60, 1440))
+
+
+class _Ring:
+    """Janela circular de uma resolução: instantes (float64) e uma coluna float32 por métrica."""
+
+    def __init__(self, resolution, slots):
+        self.resolution = resolution
+        self.slots = slots
+        self.times = np.zeros(slots, dtype=np.float64)
+        self.values = np.zeros((slots, len(METRICS)), dtype=np.float32)
+        self.head = 0  # próxima posição a escrever
+        self.count = 0
+        # Média em andamento do balde atual, que vira um ponto da resolução seguinte
+        self.bucket = None
+        self.bucket_sum = np.zeros(len(METRICS), dtype=np.float64)
+        self.bucket_count = 0
+
+    def append(self, timestamp, values):
+        self.times[self.head] = timestamp
+        self.values[self.head] = values
+        self.head = (self.head + 1) % self.slots
+        self.count = min(self.count + 1, self.slots)
+
+    def ordered(self):
+        """Índices das posições preenchidas, da mais antiga para a mais recente."""
+        return (self.head - self.count + np.arange(self.count)) % self.slots
+
+    def oldest(self):
+        return self.times[(self.head - self.count) % self.slots] if self.count else None
+
+    def fill(self, times, values):
+        """Preenche a janela vazia com um histórico já ordenado (mantém os mais recentes)."""
+        count = min(len(times), self.slots)
+        self.times[:count] = times[len(times) - count:]
+        self.values[:count] = values[len(values) - count:]
+        self.head = count % self.slots
+        self.count = count
+
+
+class _Series:
+    def __init__(self):
+        self.rings = [_Ring(resolution, slots) for resolution, slots in TIERS]
+        self.last_time = 0.0
+
+    def append(self, timestamp, values):
+        """Retorna os pontos [(instante, valores)] que chegaram à resolução mais grossa."""
+        self.last_time = timestamp
+        coarse = []
+        self._append(0, timestamp, values, coarse)
+        return coarse
+
+    def _append(self, tier, timestamp, values, coarse):
+        ring = self.rings[tier]
+        ring.append(timestamp, values)
+        if tier + 1 == len(self.rings):
+            coarse.append((timestamp, values))
+            return
+
+        # Reamostragem: fecha o balde da resolução seguinte quando a amostra cai num balde novo
+        resolution = self.rings[tier + 1].resolution
+        bucket = int(timestamp // resolution)
+        if ring.bucket is not None and bucket != ring.bucket and ring.bucket_count:
+            mean = ring.bucket_sum / ring.bucket_count
+            self._append(tier + 1, (ring.bucket + 1) * resolution, mean.astype(np.float32), coarse)
+            ring.bucket_sum[:] = 0
+            ring.bucket_count = 0
+        ring.bucket = bucket
+        ring.bucket_sum += values
+        ring.bucket_count += 1
+
+
+class MetricsStore:
+    """Histórico das métricas por container em janelas circulares NumPy de tamanho fixo.
+
+    Cada amostra entra na resolução de 1 s; as mais antigas sobrevivem como médias de 10 s
+    e de 1 min (TIERS). As consultas escolhem a resolução mais fina que cobre o período e
+    calculam os agregados de forma vetorizada. Pode ser alimentado por outra thread.
+
+    `sink(container, instante, valores)` recebe cada ponto da resolução mais grossa
+    (usado para gravar o histórico em disco), fora do lock.
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+        self._series = {}  # ID curto -> _Series
+        self._lock = threading.Lock()
+
+    def append(self, container_id, timestamp, metrics):
+        values = np.array([metrics.get(name, 0) for name in METRICS], dtype=np.float32)
+        with self._lock:
+            coarse = self._get_series(container_id).append(timestamp, values)
+        # O sink pode fazer I/O em disco: chamado depois de soltar o lock, sem travar as consultas da UI
+        if self.sink is not None:
+            for point_time, point in coarse:
+                self.sink(container_id, point_time, point)
+
+    def restore(self, history):
+        """Carrega na resolução mais grossa o histórico salvo ({container: (instantes, valores)})."""
+        with self._lock:
+            for container_id, (times, values) in history.items():
+                series = self._get_series(container_id)
+                ring = series.rings[-1]
+                if not ring.count and len(times):
+                    ring.fill(times, values)
+                    series.last_time = max(series.last_time, float(times[-1]))
+
+    def _get_series(self, container_id):
+        series = self._series.get(container_id)
+        if series is None:
+            series = self._series[container_id] = _Series()
+        return series
+
+    def container_ids(self):
+        with self._lock:
+            return list(self._series)
+
+    def remove(self, container_id):
+        with self._lock:
+            self._series.pop(container_id, None)
+
+    def prune(self, now):
+        """Descarta containers sem amostras há mais tempo que a janela mais longa."""
+        resolution, slots = TIERS[-1]
+        with self._lock:
+            for container_id in [i for i, s in self._series.items() if now - s.last_time > resolution * slots]:
+                del self._series[container_id]
+
+    def query(self, container_id, metric, seconds, now):
+        """(instantes, valores) dos últimos `seconds` segundos na resolução mais fina que os cobre."""
+        column = METRICS.index(metric)
+        start = now - seconds
+        with self._lock:
+            series = self._series.get(container_id)
+            if series is None:
+                return np.empty(0), np.empty(0, dtype=np.float32)
+
+            ring = series.rings[-1]
+            for candidate in series.rings:
+                if candidate.count and (candidate.count < candidate.slots
+                                        or candidate.oldest() <= start + candidate.resolution):
+                    ring = candidate
+                    break
+
+            order = ring.ordered()
+            times = ring.times[order]
+            keep = times >= start
+            return times[keep], ring.values[order[keep], column]
+
+    def aggregate(self, container_id, metric, seconds, now, percentiles=(95,)):
+        """min/max/média (e percentis) do período; None se não há amostras."""
+        times, values = self.query(container_id, metric, seconds, now)
+        if not len(values):
+            return None
+        result = {"min": float(values.min()), "max": float(values.max()), "avg": float(values.mean())}
+        for q, value in zip(percentiles, np.percentile(values, percentiles)):
+            result[f"p{q}"] = float(value)
+        return result
+
+    def nbytes(self):
+        with self._lock:
+            return sum(r.times.nbytes + r.values.nbytes for s in self._series.values() for r in s.rings)
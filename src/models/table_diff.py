@@ -0,0 +1,64 @@
+from PyQt5.QtCore import QModelIndex
+
+
+def apply_keyed_diff(model, rows, new_rows, key):
+    """Atualiza `rows` (lista interna do model) para `new_rows` emitindo apenas os sinais necessários.
+
+    Linhas removidas usam beginRemoveRows, alteradas usam dataChanged e novas são
+    inseridas no final com beginInsertRows, preservando seleção e scroll da view.
+    """
+    old_keys = list(map(key, rows))
+    new_keys = list(map(key, new_rows))
+
+    # Caso comum: mesmas linhas na mesma ordem, basta comparar posição a posição
+    if old_keys == new_keys:
+        changed = [i for i, (old, new) in enumerate(zip(rows, new_rows)) if old != new]
+        for i in changed:
+            rows[i] = new_rows[i]
+        _emit_changed(model, changed)
+        return
+
+    new_by_key = dict(zip(new_keys, new_rows))
+
+    # Remoções, de baixo para cima, agrupadas em faixas contíguas
+    removed = [i for i, row_key in enumerate(old_keys) if row_key not in new_by_key]
+    for first, last in reversed(_ranges(removed)):
+        model.beginRemoveRows(QModelIndex(), first, last)
+        del rows[first:last + 1]
+        del old_keys[first:last + 1]
+        model.endRemoveRows()
+
+    # Alterações
+    changed = []
+    for i, row_key in enumerate(old_keys):
+        new_row = new_by_key[row_key]
+        if new_row != rows[i]:
+            rows[i] = new_row
+            changed.append(i)
+    _emit_changed(model, changed)
+
+    # Inserções no final
+    existing = set(old_keys)
+    added = [row for row_key, row in zip(new_keys, new_rows) if row_key not in existing]
+    if added:
+        start = len(rows)
+        model.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+        rows.extend(added)
+        model.endInsertRows()
+
+
+def _emit_changed(model, changed):
+    last_column = model.columnCount() - 1
+    for first, last in _ranges(changed):
+        model.dataChanged.emit(model.index(first, 0), model.index(last, last_column))
+
+
+def _ranges(indexes):
+    """Agrupa índices ordenados em faixas contíguas [(inicio, fim), ...]."""
+    ranges = []
+    for i in indexes:
+        if ranges and ranges[-1][1] == i - 1:
+            ranges[-1][1] = i
+        else:
+            ranges.append([i, i])
+    return ranges
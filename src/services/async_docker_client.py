@@ -0,0 +1,246 @@
+import asyncio
+import json
+import os
+import threading
+from urllib.parse import urlencode, quote
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+DEFAULT_SOCKET = "/var/run/docker.sock"
+MAX_CONNECTIONS = 64  # aberturas de conexão simultâneas no socket do daemon
+STREAM_HEADER_SIZE = 8
+
+
+class AsyncDockerError(Exception):
+    def __init__(self, status, message):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+        self.message = message
+
+
+class AsyncDockerClient:
+    """Cliente asyncio da API do Docker falando HTTP/1.1 direto no socket Unix.
+
+    Cada requisição usa sua própria conexão, então várias podem ficar em andamento ao
+    mesmo tempo no mesmo event loop, sem uma thread por operação.
+    """
+
+    def __init__(self, socket_path=None, max_connections=MAX_CONNECTIONS):
+        self.socket_path = socket_path or socket_path_from_env()
+        self.max_connections = max_connections
+        self._connections = None
+
+    # --- Containers ---
+
+    async def list_containers(self, all=False, filters=None):
+        params = {"all": 1 if all else 0}
+        if filters:
+            params["filters"] = json.dumps(filters)
+        return await self._json("GET", "/containers/json", params)
+
+    async def inspect_container(self, container_id):
+        return await self._json("GET", f"/containers/{quote(container_id)}/json")
+
+    async def start(self, container_id):
+        await self._json("POST", f"/containers/{quote(container_id)}/start")
+
+    async def stop(self, container_id, timeout=10):
+        await self._json("POST", f"/containers/{quote(container_id)}/stop", {"t": timeout})
+
+    async def kill(self, container_id):
+        await self._json("POST", f"/containers/{quote(container_id)}/kill")
+
+    async def logs(self, container_id, follow=False, tail="all", stdout=True, stderr=True):
+        """Gera as linhas de log (bytes, sem o \\n) conforme chegam."""
+        params = {"follow": int(follow), "tail": tail, "stdout": int(stdout), "stderr": int(stderr)}
+        headers, reader, writer = await self._open("GET", f"/containers/{quote(container_id)}/logs", params)
+        multiplexed = "multiplexed" in headers.get("content-type", "")
+
+        pending = b""
+        try:
+            async for chunk in self._iter_payload(headers, reader, multiplexed):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    yield line
+            if pending:
+                yield pending
+        finally:
+            writer.close()
+
+    async def stats(self, container_id, stream=True):
+        """Gera as amostras de /containers/{id}/stats (dicts)."""
+        params = {"stream": int(stream)}
+        async for sample in self._json_stream("GET", f"/containers/{quote(container_id)}/stats", params):
+            yield sample
+
+    async def events(self, since=None, filters=None):
+        """Gera os eventos do daemon (dicts) até a conexão ser encerrada."""
+        params = {}
+        if since is not None:
+            params["since"] = since
+        if filters:
+            params["filters"] = json.dumps(filters)
+        async for event in self._json_stream("GET", "/events", params):
+            yield event
+
+    # --- Imagens ---
+
+    async def list_images(self):
+        return await self._json("GET", "/images/json")
+
+    # --- HTTP ---
+
+    async def _json(self, method, path, params=None):
+        headers, reader, writer = await self._open(method, path, params)
+        try:
+            body = b"".join([chunk async for chunk in self._iter_body(headers, reader)])
+        finally:
+            writer.close()
+        return json.loads(body) if body.strip() else None
+
+    async def _json_stream(self, method, path, params=None):
+        headers, reader, writer = await self._open(method, path, params)
+        pending = b""
+        try:
+            async for chunk in self._iter_body(headers, reader):
+                lines = (pending + chunk).split(b"\n")
+                pending = lines.pop()
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+            # Respostas não-stream (stream=0) podem terminar sem a quebra de linha
+            if pending.strip():
+                yield json.loads(pending)
+        finally:
+            writer.close()
+
+    async def _open(self, method, path, params=None):
+        if params:
+            path = f"{path}?{urlencode(params)}"
+
+        # Limita apenas a abertura das conexões (evita estourar o backlog do socket); streams
+        # longos como logs, stats e eventos não seguram o semáforo depois de conectados
+        if self._connections is None:
+            self._connections = asyncio.Semaphore(self.max_connections)
+        async with self._connections:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        request = f"{method} {path} HTTP/1.1\r\nHost: docker\r\nConnection: close\r\n"
+        if method == "POST":
+            request += "Content-Type: application/json\r\nContent-Length: 0\r\n"
+        writer.write(f"{request}\r\n".encode())
+        await writer.drain()
+
+        status_line = await reader.readline()
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if status >= 400:
+            try:
+                body = b"".join([chunk async for chunk in self._iter_body(headers, reader)])
+                message = json.loads(body).get("message", body.decode(errors="replace"))
+            except Exception:
+                message = status_line.decode(errors="replace").strip()
+            finally:
+                writer.close()
+            raise AsyncDockerError(status, message)
+
+        return headers, reader, writer
+
+    async def _iter_body(self, headers, reader):
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size_line = await reader.readline()
+                if not size_line:
+                    return
+                size = int(size_line.split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    await reader.readline()
+                    return
+                yield await reader.readexactly(size)
+                await reader.readline()
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            if length:
+                yield await reader.readexactly(length)
+        else:
+            while True:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def _iter_payload(self, headers, reader, multiplexed):
+        """Remove os cabeçalhos de 8 bytes (stdout/stderr) do stream multiplexado de logs."""
+        if not multiplexed:
+            async for chunk in self._iter_body(headers, reader):
+                yield chunk
+            return
+
+        buffer = b""
+        async for chunk in self._iter_body(headers, reader):
+            buffer += chunk
+            while len(buffer) >= STREAM_HEADER_SIZE:
+                size = int.from_bytes(buffer[4:8], "big")
+                if len(buffer) < STREAM_HEADER_SIZE + size:
+                    break
+                yield buffer[STREAM_HEADER_SIZE:STREAM_HEADER_SIZE + size]
+                buffer = buffer[STREAM_HEADER_SIZE + size:]
+
+
+class QtAsyncBridge(QObject):
+    """Executa um event loop asyncio numa thread e entrega os resultados no event loop do Qt.
+
+    `submit` agenda uma coroutine e chama callback/errback na thread da UI;
+    `run_sync` bloqueia até o resultado (usado pelos wrappers síncronos).
+    """
+    _done = pyqtSignal(object, object)
+
+    def __init__(self):
+        super().__init__()
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+        self._done.connect(self._deliver)
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, callback=None, errback=None):
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def done(f):
+            if f.cancelled():
+                return
+            error = f.exception()
+            if error is not None:
+                if errback:
+                    self._done.emit(errback, error)
+            elif callback:
+                self._done.emit(callback, f.result())
+
+        future.add_done_callback(done)
+        return future
+
+    def run_sync(self, coro, timeout=None):
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def stop(self):
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _deliver(self, function, value):
+        function(value)
+
+
+def socket_path_from_env():
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host.startswith("unix://"):
+        return docker_host[len("unix://"):]
+    return DEFAULT_SOCKET
@@ -0,0 +1,177 @@
+import os
+import time
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+PROC_ROOT = "/proc"
+V1_CONTROLLERS = ("cpuacct", "memory", "blkio")
+
+
+class CgroupStatsReader:
+    """Lê CPU, memória e I/O de um container direto dos arquivos do cgroup (v1 ou v2).
+
+    Só funciona com o daemon Docker na mesma máquina. Os diretórios aceitos são os dos
+    drivers cgroupfs (docker/<id>) e systemd (system.slice/docker-<id>.scope); a rede vem
+    de /proc/<pid>/net/dev de um processo do container. `read` retorna None quando o
+    container não é encontrado, para o chamador usar a API.
+    """
+
+    def __init__(self, root=CGROUP_ROOT, proc_root=PROC_ROOT):
+        self.root = root
+        self.proc_root = proc_root
+        self.version = detect_version(root)
+        self._host_memory = None
+        self._paths = {}  # ID completo -> diretório (v2) ou {controlador: diretório} (v1)
+
+    def available(self):
+        return self.version is not None
+
+    def find(self, container_id):
+        """Diretórios do cgroup do container (com cache); None se não existem."""
+        paths = self._paths.get(container_id)
+        if paths is not None:
+            return paths
+        if self.version == 2:
+            paths = self._first_existing(self.root, container_id)
+        elif self.version == 1:
+            paths = {}
+            for controller in V1_CONTROLLERS:
+                path = self._first_existing(os.path.join(self.root, controller), container_id)
+                if path is None:
+                    return None
+                paths[controller] = path
+        if paths:
+            self._paths[container_id] = paths
+        return paths
+
+    def forget(self, container_id):
+        self._paths.pop(container_id, None)
+
+    def read(self, container_id):
+        """Contadores brutos: cpu_usage (ns), memória, limite, cache, bytes lidos/escritos e rede."""
+        paths = self.find(container_id)
+        if paths is None:
+            return None
+        try:
+            counters = self._read_v2(paths) if self.version == 2 else self._read_v1(paths)
+            procs_dir = paths if self.version == 2 else paths["memory"]
+            counters["net_rx"], counters["net_tx"] = self._read_network(procs_dir)
+        except (OSError, ValueError):
+            # O container parou entre o find e a leitura
+            self.forget(container_id)
+            return None
+        counters["time"] = time.monotonic()
+        return counters
+
+    def _read_v2(self, path):
+        cpu = read_key_values(os.path.join(path, "cpu.stat"))
+        memory_stat = read_key_values(os.path.join(path, "memory.stat"))
+        limit = read_text(os.path.join(path, "memory.max"))
+        block_read = block_write = 0
+        for line in read_text(os.path.join(path, "io.stat")).splitlines():
+            fields = dict(item.split("=", 1) for item in line.split()[1:] if "=" in item)
+            block_read += int(fields.get("rbytes", 0))
+            block_write += int(fields.get("wbytes", 0))
+        return {
+            "cpu_usage": cpu.get("usage_usec", 0) * 1000,
+            "memory_usage": int(read_text(os.path.join(path, "memory.current"))),
+            "memory_limit": self.host_memory() if limit == "max" else int(limit),
+            "memory_cache": memory_stat.get("inactive_file", 0),
+            "block_read": block_read,
+            "block_write": block_write,
+        }
+
+    def _read_v1(self, paths):
+        memory_stat = read_key_values(os.path.join(paths["memory"], "memory.stat"))
+        limit = int(read_text(os.path.join(paths["memory"], "memory.limit_in_bytes")))
+        block_read = block_write = 0
+        for line in read_text(os.path.join(paths["blkio"], "blkio.throttle.io_service_bytes")).splitlines():
+            fields = line.split()
+            if len(fields) == 3 and fields[1] == "Read":
+                block_read += int(fields[2])
+            elif len(fields) == 3 and fields[1] == "Write":
+                block_write += int(fields[2])
+        return {
+            "cpu_usage": int(read_text(os.path.join(paths["cpuacct"], "cpuacct.usage"))),
+            "memory_usage": int(read_text(os.path.join(paths["memory"], "memory.usage_in_bytes"))),
+            # Sem limite o v1 informa um valor enorme (PAGE_COUNTER_MAX)
+            "memory_limit": self.host_memory() if limit >= 2 ** 62 else limit,
+            "memory_cache": memory_stat.get("total_inactive_file", memory_stat.get("cache", 0)),
+            "block_read": block_read,
+            "block_write": block_write,
+        }
+
+    def host_memory(self):
+        """Memória total da máquina, usada como limite de containers sem limite (como o `docker stats`)."""
+        if self._host_memory is None:
+            self._host_memory = 0
+            try:
+                for line in read_text(os.path.join(self.proc_root, "meminfo")).splitlines():
+                    if line.startswith("MemTotal:"):
+                        self._host_memory = int(line.split()[1]) * 1024
+                        break
+            except (OSError, ValueError):
+                pass
+        return self._host_memory
+
+    def _read_network(self, cgroup_dir):
+        pids = read_text(os.path.join(cgroup_dir, "cgroup.procs")).split()
+        if not pids:
+            return 0, 0
+        rx = tx = 0
+        # Formato: "iface: rx_bytes rx_packets ... (8 campos de rx) tx_bytes ..."
+        for line in read_text(os.path.join(self.proc_root, pids[0], "net", "dev")).splitlines()[2:]:
+            interface, _, data = line.partition(":")
+            if interface.strip() == "lo":
+                continue
+            fields = data.split()
+            rx += int(fields[0])
+            tx += int(fields[8])
+        return rx, tx
+
+    @staticmethod
+    def _first_existing(base, container_id):
+        for candidate in (os.path.join(base, "docker", container_id),
+                          os.path.join(base, "system.slice", f"docker-{container_id}.scope")):
+            if os.path.isdir(candidate):
+                return candidate
+        return None
+
+
+def detect_version(root):
+    if os.path.exists(os.path.join(root, "cgroup.controllers")):
+        return 2
+    if all(os.path.isdir(os.path.join(root, controller)) for controller in V1_CONTROLLERS):
+        return 1
+    return None
+
+
+def metrics_from_counters(counters, previous=None):
+    """Converte duas leituras seguidas no mesmo formato de reduce_stats (CPU % precisa da anterior)."""
+    cpu_percent = 0.0
+    if previous is not None:
+        elapsed = counters["time"] - previous["time"]
+        if elapsed > 0:
+            cpu_percent = max(0, counters["cpu_usage"] - previous["cpu_usage"]) / (elapsed * 1e9) * 100
+    return {
+        "cpu_percent": cpu_percent,
+        "memory_usage": max(0, counters["memory_usage"] - counters["memory_cache"]),
+        "memory_limit": counters["memory_limit"],
+        "net_rx": counters["net_rx"],
+        "net_tx": counters["net_tx"],
+        "block_read": counters["block_read"],
+        "block_write": counters["block_write"],
+    }
+
+
+def read_text(path):
+    with open(path, "r") as f:
+        return f.read().strip()
+
+
+def read_key_values(path):
+    values = {}
+    for line in read_text(path).splitlines():
+        key, _, value = line.partition(" ")
+        if value.strip().lstrip("-").isdigit():
+            values[key] = int(value)
+    return values
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+from src.services.config_utils import get_config_path, load_config
+
+RELOAD_DELAY = 200  # ms; agrupa as notificações de uma mesma gravação (temporário + rename)
+
+_config_service = None
+
+
+class ConfigService(QObject):
+    """Observa o arquivo de configuração e emite `config_changed` quando o conteúdo muda.
+
+    Como a gravação é atômica (rename), o watch do arquivo se perde a cada escrita; por isso
+    o diretório também é observado e o arquivo é registrado de novo a cada recarga.
+    """
+    config_changed = pyqtSignal(dict)
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = str(path or get_config_path())
+        self._settings = load_config()
+
+        self._reload_timer = QTimer(self)
+        self._reload_timer.setSingleShot(True)
+        self._reload_timer.setInterval(RELOAD_DELAY)
+        self._reload_timer.timeout.connect(self._reload)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._schedule_reload)
+        self._watcher.directoryChanged.connect(self._schedule_reload)
+        self._watch()
+
+    def settings(self):
+        return dict(self._settings)
+
+    def _schedule_reload(self, path):
+        self._reload_timer.start()
+
+    def _watch(self):
+        directory = str(Path(self.path).parent)
+        if directory not in self._watcher.directories():
+            self._watcher.addPath(directory)
+        if self.path not in self._watcher.files():
+            self._watcher.addPath(self.path)
+
+    def _reload(self):
+        self._watch()
+        settings = load_config()
+        if settings != self._settings:
+            self._settings = settings
+            self.config_changed.emit(dict(settings))
+
+
+def get_config_service():
+    """Instância compartilhada do processo (criar só depois do QApplication, na thread da UI)."""
+    global _config_service
+    if _config_service is None:
+        _config_service = ConfigService()
+    return _config_service
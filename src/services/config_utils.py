@@ -1,11 +1,15 @@
+import atexit
 import json
 import os
+import tempfile
+import threading
+from datetime import datetime
 from os import path
 import sys
 import platform
 from pathlib import Path
 
-from PyQt5.QtCore import QDateTime
+from src.services.log_writer import BufferedLogWriter, DEFAULT_LOG_MAX_BYTES, DEFAULT_LOG_BACKUP_COUNT
 
 
 def get_path(levels_up: int = 1) -> Path:
@@ -18,19 +22,49 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 DEFAULT_TIMEOUT = 1800  # 30 minutos
+DEFAULT_BULK_PARALLELISM = 4  # containers processados ao mesmo tempo nas ações em lote
+DEFAULT_STOP_GRACE_TIMEOUT = 10  # segundos entre o SIGTERM e o SIGKILL ao parar containers
+DEFAULT_MONITOR_DAEMON = True  # janela principal e popup compartilham um único processo de monitoramento
+DEFAULT_STATS_INTERVAL = 2  # segundos entre atualizações das colunas de CPU/memória/rede/disco (0 desativa)
+DEFAULT_STATS_FROM_CGROUPS = True  # com o daemon local, lê CPU/memória/I/O direto de /sys/fs/cgroup
+DEFAULT_METRICS_RETENTION_DAYS = 7  # dias de histórico de métricas mantidos em ~/docker_monitor/metrics
+DEFAULT_IDLE_WINDOW = 900  # segundos sem atividade para um container ser parado pelo tempo esgotado
+DEFAULT_IDLE_CPU_PERCENT = 2.0  # CPU acima disso conta como atividade
+DEFAULT_IDLE_NETWORK_RATE = 2048  # bytes/s de rede (rx + tx) acima disso contam como atividade
+DEFAULT_IDLE_LOG_RATE = 10  # linhas de log por minuto que contam como atividade (0 não segue os logs)
 LOG_FILE = "docker_monitor/docker-monitor.log"
 CONFIG_FILE = "docker_monitor/docker_monitor_config.json"
 
-def log_and_notify(message):
-    timestamp = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-    log_path = get_log_path()
-
-    path = Path(log_path)
-    if not path.exists():
-        log_path = criate_folder(path)
+_log_writer = None
+_log_writer_lock = threading.Lock()
+_config_path = None
+_config_cache = None  # (caminho, (inode, mtime_ns, tamanho), configurações)
+_config_lock = threading.Lock()
 
-    with open(log_path, "a") as log_file:
-        log_file.write(f"{timestamp} - {message}\n")
+def log_and_notify(message):
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    get_log_writer().write(f"{timestamp} - {message}\n")
+
+def get_log_writer():
+    """Writer do log compartilhado pelo processo (caminho e rotação resolvidos uma única vez)."""
+    global _log_writer
+    if _log_writer is None:
+        with _log_writer_lock:
+            if _log_writer is None:
+                settings = load_config()
+                _log_writer = BufferedLogWriter(
+                    get_log_path(),
+                    max_bytes=int(settings.get("log_max_bytes", DEFAULT_LOG_MAX_BYTES)),
+                    backup_count=int(settings.get("log_backup_count", DEFAULT_LOG_BACKUP_COUNT)),
+                    compress=bool(settings.get("log_gzip", False))
+                )
+                atexit.register(_log_writer.close)
+    return _log_writer
+
+def flush_log():
+    """Garante que as mensagens já enviadas estejam no arquivo (antes de lê-lo, por exemplo)."""
+    if _log_writer is not None:
+        _log_writer.flush()
 
 def get_log_path():
     """Define o caminho do arquivo de log."""
@@ -45,16 +79,20 @@ def get_log_path():
     return default_path  # fallback
 
 def get_config_path():
-    """Define o caminho do arquivo de configuração."""
+    """Define o caminho do arquivo de configuração (resolvido uma vez por processo)."""
+    global _config_path
+    if _config_path is not None:
+        return _config_path
+
     default_path = Path(CONFIG_FILE)
     if default_path.exists():
-        return default_path
-
+        _config_path = default_path
     # Alternativa para Linux: salvar no diretório home
-    if get_operating_system() == 'Linux':
-        return get_folder_home(CONFIG_FILE)
-
-    return default_path  # fallback
+    elif get_operating_system() == 'Linux':
+        _config_path = get_folder_home(CONFIG_FILE)
+    else:
+        _config_path = default_path  # fallback
+    return _config_path
 
 def get_folder_home(path_file):
     home_path = Path(os.path.expanduser("~")) / path_file
@@ -69,15 +107,24 @@ def ensure_config_file(path, timeout=DEFAULT_TIMEOUT, monitoring=False):
         print(f"[ERRO] Não foi possível criar o arquivo de configuração: {e}")
 
 def load_config():
+    """Retorna uma cópia das configurações; o JSON só é relido quando o arquivo muda (inode, mtime ou tamanho)."""
+    global _config_cache
     path_config = get_config_path()
 
-    path = Path(path_config)
-    if not path.exists():
+    signature = _file_signature(path_config)
+    if signature is None:
         ensure_config_file(path_config)
+        signature = _file_signature(path_config)
+
+    cached = _config_cache
+    if signature is not None and cached and cached[0] == path_config and cached[1] == signature:
+        return dict(cached[2])
 
     try:
         with open(path_config, "r") as f:
-            return json.load(f)
+            settings = json.load(f)
+        _config_cache = (path_config, signature, settings)
+        return dict(settings)
     except Exception as e:
         print(f"[ERRO] Falha ao ler informações do arquivo {path_config}: {e}")
 
@@ -86,20 +133,61 @@ def load_config():
         "monitoring_enabled": False
     }
 
+def _file_signature(path_file):
+    try:
+        stat = os.stat(path_file)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
 def get_operating_system():
     return platform.system()
 
-def save_config(timeout_value, monitoring=False, path_file=CONFIG_FILE):
+def save_config(timeout_value, monitoring=False, path_file=None):
+    update_config({
+        "timeout": timeout_value,
+        "monitoring_enabled": monitoring
+    }, path_file)
+
+def update_config(values, path_file=None):
+    """Grava as chaves informadas preservando as demais (intervalos, paralelismo, etc.)."""
+    path_file = Path(path_file or get_config_path())
     try:
-        path_file = Path(path_file)
-        with open(path_file, "w") as f:
-            json.dump({
-                "timeout": timeout_value,
-                "monitoring_enabled": monitoring
-            }, f, indent=4)
+        with _config_lock:
+            settings = {}
+            if path_file.exists():
+                try:
+                    with open(path_file, "r") as f:
+                        settings = json.load(f)
+                except ValueError:
+                    settings = {}
+
+            settings.update(values)
+            write_json_atomic(path_file, settings)
     except Exception as e:
         print(f"[ERRO] Falha ao salvar configurações em {path_file}: {e}")
 
+def write_json_atomic(path_file, data):
+    """Grava num arquivo temporário no mesmo diretório e troca com os.replace: quem lê nunca vê o arquivo pela metade."""
+    write_text_atomic(path_file, json.dumps(data, indent=4))
+
+def write_text_atomic(path_file, text):
+    path_file = Path(path_file)
+    path_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path_file.name}.", suffix=".tmp", dir=path_file.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path_file)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 def exist_file(pathFile: str):
     return path.exists(pathFile)
 
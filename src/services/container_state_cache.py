@@ -0,0 +1,227 @@
+import threading
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from src.services.config_utils import log_and_notify
+
+HEADERS = ["ID", "Nome", "Imagem", "Status"]
+SNAPSHOT_KEYS = HEADERS + ["Id", "State", "Health"]  # campos guardados no snapshot em disco
+RECONNECT_DELAY = 2  # segundos
+
+
+class ContainerStateCache(QObject):
+    """Estado dos containers mantido em memória e atualizado pelo stream /events do Docker."""
+    changed = pyqtSignal()
+
+    def __init__(self, api_client, image_index=None, snapshot_store=None):
+        super().__init__()
+        self.api_client = api_client
+        self.image_index = image_index
+        self.snapshot_store = snapshot_store
+        self.ready = False
+
+        self._containers = {}  # ID completo -> linha no formato das tabelas
+        self._lock = threading.Lock()
+        self._thread = None
+        self._events = None
+        self._running = False
+
+    def start(self):
+        """Faz a listagem inicial e passa a acompanhar os eventos em segundo plano."""
+        if self._thread:
+            return
+
+        self._running = True
+        since = int(time.time())
+        self.refresh()
+
+        self._thread = threading.Thread(target=self._watch_events, args=(since,), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._events is not None:
+            self._events.close()
+
+    def refresh(self):
+        """Recarrega todos os containers com uma única listagem e notifica se algo mudou."""
+        containers = self.api_client.containers(all=True)
+        new_state = {c["Id"]: row_from_listing(c) for c in containers}
+
+        with self._lock:
+            changed = new_state != self._containers or not self.ready
+            self._containers = new_state
+            self.ready = True
+
+        if changed:
+            self._notify()
+
+    def snapshot(self):
+        """Retorna (headers, linhas) de todos os containers sem consultar o daemon."""
+        with self._lock:
+            data = [dict(c) for c in self._containers.values()]
+        return HEADERS, data
+
+    def running(self):
+        """Retorna (headers, linhas) apenas dos containers em execução."""
+        with self._lock:
+            data = [dict(c) for c in self._containers.values() if c["Status"] == "running"]
+        return HEADERS, data
+
+    def subscribe(self, callback):
+        """Registra um callback chamado a cada mudança (use métodos de QObject para rodar na thread da UI)."""
+        self.changed.connect(callback)
+
+    def unsubscribe(self, callback):
+        try:
+            self.changed.disconnect(callback)
+        except TypeError:
+            pass
+
+    def _watch_events(self, since):
+        while self._running:
+            try:
+                event_types = ["container", "image"] if self.image_index else ["container"]
+                self._events = self.api_client.events(since=since, filters={"type": event_types}, decode=True)
+                for event in self._events:
+                    since = event.get("time", since)
+                    if event.get("Type") == "image":
+                        self.image_index.handle_event(event)
+                    else:
+                        self._apply_event(event)
+            except Exception as e:
+                if not self._running:
+                    break
+                log_and_notify(f"Conexão com eventos do Docker perdida: {e}")
+
+            if not self._running:
+                break
+
+            # Reconecta e reconcilia o estado perdido durante a desconexão
+            time.sleep(RECONNECT_DELAY)
+            since = int(time.time())
+            try:
+                self.refresh()
+            except Exception as e:
+                log_and_notify(f"Erro ao recarregar containers: {e}")
+
+    def _apply_event(self, event):
+        action = event.get("Action") or event.get("status") or ""
+        actor = event.get("Actor", {})
+        container_id = actor.get("ID") or event.get("id")
+        attributes = actor.get("Attributes", {})
+        if not container_id:
+            return
+
+        with self._lock:
+            container = self._containers.get(container_id)
+
+            if action == "destroy":
+                changed = self._containers.pop(container_id, None) is not None
+            elif action == "create":
+                self._containers[container_id] = self._from_event(container_id, attributes, "created")
+                changed = True
+            elif container is None:
+                changed = None  # container desconhecido, busca abaixo
+            elif action in ("start", "unpause", "restart"):
+                changed = self._set_state(container, "running")
+            elif action == "pause":
+                changed = self._set_state(container, "paused")
+            elif action == "die":
+                changed = self._set_state(container, "exited")
+            elif action == "rename":
+                name = attributes.get("name", container["Nome"]).lstrip("/")
+                changed = container["Nome"] != name
+                container["Nome"] = name
+            elif action.startswith("health_status"):
+                health = action.split(":", 1)[1].strip() if ":" in action else ""
+                changed = container.get("Health") != health
+                container["Health"] = health
+            else:
+                changed = False
+
+        if changed is None:
+            changed = self._load_container(container_id)
+
+        if changed:
+            self._notify()
+
+    def _notify(self):
+        self.changed.emit()
+        if self.snapshot_store is not None:
+            self.snapshot_store.save("containers", self.compact_snapshot)
+
+    def compact_snapshot(self):
+        """Snapshot só com os campos exibidos, para o cache em disco."""
+        with self._lock:
+            data = [{key: c.get(key) for key in SNAPSHOT_KEYS} for c in self._containers.values()]
+        return HEADERS, data
+
+    def _load_container(self, container_id):
+        containers = self.api_client.containers(all=True, filters={"id": container_id})
+        if not containers:
+            return False
+
+        with self._lock:
+            for c in containers:
+                self._containers[c["Id"]] = row_from_listing(c)
+        return True
+
+    @staticmethod
+    def _set_state(container, state):
+        if container["State"] == state:
+            return False
+        container["State"] = state
+        container["Status"] = status_from_state(state)
+        return True
+
+    @staticmethod
+    def _from_event(container_id, attributes, state):
+        labels = {k: v for k, v in attributes.items() if k not in ("name", "image")}
+        return {
+            "ID": container_id[:12],
+            "Nome": attributes.get("name", "").lstrip("/"),
+            "Imagem": attributes.get("image", ""),
+            "Status": status_from_state(state),
+            "State": state,
+            "Health": "",
+            "Id": container_id,
+            "ImageID": "",
+            "Labels": labels,
+            "Created": int(time.time()),
+        }
+
+
+def row_from_listing(c):
+    """Converte um item de /containers/json na linha usada pelas tabelas."""
+    names = c.get("Names") or [""]
+    state = c.get("State", "")
+    return {
+        "ID": c["Id"][:12],
+        "Nome": names[0].lstrip("/"),
+        "Imagem": c.get("Image", ""),
+        "Status": status_from_state(state),
+        "State": state,
+        "Health": health_from_status(c.get("Status", "")),
+        "Id": c["Id"],
+        "ImageID": c.get("ImageID", ""),
+        "Labels": c.get("Labels") or {},
+        "Created": c.get("Created", 0),
+    }
+
+
+def status_from_state(state):
+    """Converte o State do Docker no status exibido pelas tabelas (running/stopped)."""
+    return "running" if state in ("running", "paused") else "stopped"
+
+
+def health_from_status(status_text):
+    """Extrai o health check do texto de status da listagem, ex: 'Up 2 hours (healthy)'."""
+    if "(health: starting)" in status_text:
+        return "starting"
+    if "(unhealthy)" in status_text:
+        return "unhealthy"
+    if "(healthy)" in status_text:
+        return "healthy"
+    return ""
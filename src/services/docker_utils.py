@@ -1,128 +1,307 @@
 import json
-import subprocess
+import os
+import threading
+import time
+from datetime import datetime, timezone
 
-import docker
+from PyQt5.QtCore import QCoreApplication
+
+from src.services.config_utils import log_and_notify, load_config, DEFAULT_BULK_PARALLELISM, \
+    DEFAULT_STOP_GRACE_TIMEOUT, DEFAULT_MONITOR_DAEMON, DEFAULT_STATS_INTERVAL, \
+    DEFAULT_METRICS_RETENTION_DAYS, DEFAULT_STATS_FROM_CGROUPS
+from src.services.container_state_cache import ContainerStateCache, HEADERS, row_from_listing
+from src.services.image_tag_index import ImageTagIndex
+from src.services.snapshot_store import SnapshotStore
+from src.services.stop_engine import ContainerStopEngine
+
+IMAGE_HEADERS = ["ID", "Repository", "Tag", "Tamanho"]
 
-from src.services.config_utils import log_and_notify
 
 class DockerUtils:
-    def __init__(self):
-        self.client_docker = docker.from_env()
-        self.api_client = self.client_docker.api
+    def __init__(self, client_docker=None, monitor_daemon=None):
+        self._client_docker = client_docker
+        # Com um cliente injetado (benchmarks, o próprio daemon) o cache usa essa conexão diretamente
+        self.monitor_daemon = client_docker is None if monitor_daemon is None else monitor_daemon
+        self._image_index = None
+        self._client_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self.snapshot_store = SnapshotStore()
+        self.state_cache = None
+        self.async_client = None
+        self.async_bridge = None
+        self.stats_collector = None
+        self.metrics_store = None
+        self.metrics_history = None
+        self.idle_policy = None
+        self.idle_collector = None
+        self.log_watcher = None
+        self._idle_settings = None
+        self._idle_lock = threading.Lock()
 
-    def get_all_containers_details_subprocess(self):
-        result = subprocess.run(
-            ["docker", "ps", "-a", "--format", "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}"],
-            capture_output=True, text=True
-        )
-        lines = result.stdout.strip().split('\n')
-        headers = ["ID", "Nome", "Imagem", "Status"]
-        data = []
+    @property
+    def client_docker(self):
+        """Cliente docker-py criado no primeiro uso: o import do docker e a conexão ao daemon saem da inicialização."""
+        if self._client_docker is None:
+            with self._client_lock:
+                if self._client_docker is None:
+                    import docker
+                    self._client_docker = docker.from_env()
+        return self._client_docker
 
-        for line in lines:
-            if not line:
-                continue
-            values = line.split('\t')
-            status_text = values[3].lower()
-            status = "running" if "up" in status_text else "stopped"
-            container_info = dict(zip(headers, values))
-            container_info["Status"] = status
-            data.append(container_info)
+    @property
+    def api_client(self):
+        return self.client_docker.api
 
-        return headers, data
+    @property
+    def image_index(self):
+        if self._image_index is None:
+            api_client = self.api_client  # fora do lock: client_docker usa o mesmo lock
+            with self._client_lock:
+                if self._image_index is None:
+                    self._image_index = ImageTagIndex(api_client)
+        return self._image_index
+
+    def get_state_cache(self):
+        """Retorna o cache de estado dos containers, iniciando-o no primeiro uso (pode ser chamado fora da thread da UI)."""
+        if self.state_cache is None:
+            with self._cache_lock:
+                if self.state_cache is None:
+                    self.state_cache = self._start_state_cache()
+        return self.state_cache
+
+    def _start_state_cache(self):
+        if self.monitor_daemon and load_config().get("monitor_daemon", DEFAULT_MONITOR_DAEMON):
+            # Um único processo conversa com o Docker; esta instância só recebe as atualizações
+            from src.services.monitor_daemon import RemoteStateCache
+            from src.utils.constantes_utils import iniciar_daemon_monitoramento
+            state_cache = RemoteStateCache(self.image_index, spawn=iniciar_daemon_monitoramento)
+            try:
+                self._move_to_app_thread(state_cache).start()
+                return state_cache
+            except (OSError, ValueError) as e:
+                log_and_notify(f"Daemon de monitoramento indisponível, usando conexão própria: {e}")
+
+        state_cache = ContainerStateCache(self.api_client, self.image_index, self.snapshot_store)
+        self._move_to_app_thread(state_cache).start()
+        return state_cache
+
+    @staticmethod
+    def _move_to_app_thread(state_cache):
+        # Criado numa thread do pool, o QObject passa a pertencer à thread da aplicação
+        app = QCoreApplication.instance()
+        if app is not None and state_cache.thread() != app.thread():
+            state_cache.moveToThread(app.thread())
+        return state_cache
+
+    def get_async_client(self):
+        """Cliente asyncio no mesmo socket Unix do daemon, para muitas requisições simultâneas."""
+        if self.async_client is None:
+            from src.services.async_docker_client import AsyncDockerClient
+            self.async_client = AsyncDockerClient()
+        return self.async_client
+
+    def get_async_bridge(self):
+        """Event loop asyncio compartilhado, com entrega dos resultados na thread do Qt."""
+        if self.async_bridge is None:
+            from src.services.async_docker_client import QtAsyncBridge
+            self.async_bridge = QtAsyncBridge()
+        return self.async_bridge
+
+    def get_stats_collector(self):
+        """Coletor de CPU/memória/rede/disco dos containers em execução (criar na thread da UI)."""
+        if self.stats_collector is None:
+            from src.models.metrics_store import MetricsStore, TIERS
+            from src.services.metrics_history import MetricsHistory
+            from src.services.stats_collector import StatsCollector
+            settings = load_config()
+            interval = float(settings.get("stats_interval", DEFAULT_STATS_INTERVAL))
+            retention = float(settings.get("metrics_retention_days", DEFAULT_METRICS_RETENTION_DAYS))
+
+            # As médias de 1 min vão para o disco; ao abrir, as últimas 24 h voltam para a memória
+            self.metrics_history = MetricsHistory(retention_days=retention)
+            self.metrics_store = MetricsStore(sink=self.metrics_history.append)
+            resolution, slots = TIERS[-1]
+            now = time.time()
+            self.metrics_store.restore(self.metrics_history.read_all(now - resolution * slots, now))
+            self.stats_collector = StatsCollector(self.get_async_client(), self.get_async_bridge(), interval,
+                                                  self.metrics_store, self._cgroup_reader(settings))
+        return self.stats_collector
+
+    def get_idle_policy(self):
+        """Política de ociosidade do auto-stop, alimentada por um coletor de estatísticas próprio e pelos logs.
+
+        Roda no daemon de monitoramento (ou no popup, sem daemon). O coletor não grava o
+        MetricsHistory: o histórico em disco continua sendo escrito só pela janela principal.
+        """
+        if self.idle_policy is None:
+            from src.services.idle_policy import IdlePolicy, LogActivityWatcher
+            from src.services.stats_collector import StatsCollector
+            self._idle_settings = load_config()
+            self.idle_policy = IdlePolicy(self._idle_settings)
+            # Intervalo 0: ninguém lê stats_updated, só o listener da política
+            self.idle_collector = StatsCollector(self.get_async_client(), self.get_async_bridge(), 0,
+                                                 cgroup_reader=self._cgroup_reader(self._idle_settings))
+            self.idle_collector.add_listener(self.idle_policy.observe)
+            self.log_watcher = LogActivityWatcher(self.get_async_client(), self.get_async_bridge(), self.idle_policy)
+        return self.idle_policy
+
+    def sync_idle_policy(self, rows):
+        """Atualiza os containers acompanhados pela política a partir das linhas do cache.
+
+        Com o daemon de monitoramento não faz nada: o daemon acompanha os containers sozinho.
+        """
+        if self._uses_monitor_daemon():
+            return
+        policy = self.get_idle_policy()
+        with self._idle_lock:
+            self.idle_collector.sync([row["Id"] for row in rows if row.get("State", "running") == "running"])
+            policy.sync(rows)
+            self.log_watcher.sync(policy.tracked())
+
+    def idle_containers(self):
+        """IDs completos dos containers ociosos para o auto-stop (avaliados pelo daemon, se houver)."""
+        if self._uses_monitor_daemon():
+            return self.state_cache.idle_containers()
+        policy = self.get_idle_policy()
+        # Releitura barata (cache por mtime); o heap só é refeito quando algo mudou
+        settings = load_config()
+        if settings != self._idle_settings:
+            self._idle_settings = settings
+            policy.configure(settings)
+        return policy.idle_containers()
+
+    def _uses_monitor_daemon(self):
+        from src.services.monitor_daemon import RemoteStateCache
+        return isinstance(self.state_cache, RemoteStateCache)
+
+    @staticmethod
+    def _cgroup_reader(settings):
+        # Os arquivos do cgroup só são os do daemon quando ele roda nesta máquina (socket Unix)
+        if not settings.get("stats_from_cgroups", DEFAULT_STATS_FROM_CGROUPS):
+            return None
+        if not os.environ.get("DOCKER_HOST", "unix://").startswith("unix://"):
+            return None
+        from src.services.cgroup_stats import CgroupStatsReader
+        reader = CgroupStatsReader()
+        return reader if reader.available() else None
+
+    def run_async(self, coro, callback=None, errback=None):
+        return self.get_async_bridge().submit(coro, callback, errback)
+
+    def get_all_containers_details_subprocess(self):
+        # Mantém o nome antigo; agora usa a API (campo State estruturado) em vez de 'docker ps -a'
+        containers = self.api_client.containers(all=True)
+        return HEADERS, [row_from_listing(c) for c in containers]
 
     def get_running_containers_details(self):
-        result = subprocess.run(
-            ["docker", "ps", "--format", "{{.ID}}\t{{.Names}}\t{{.Image}}\t{{.Status}}"],
-            capture_output=True, text=True
-        )
-        lines = result.stdout.strip().split('\n')
-        headers = ["ID", "Nome", "Imagem", "Status"]
-        data = [dict(zip(headers, line.split('\t'))) for line in lines if line]
-        return headers, data
+        containers = self.api_client.containers()
+        return HEADERS, [row_from_listing(c) for c in containers]
 
     def get_all_containers_details(self):
-        containers = self.client_docker.containers.list(all=True)
+        # Uma listagem de containers + uma de imagens, sem inspect por container/imagem
+        containers = self.api_client.containers(all=True)
         headers = ["ID", "Nome", "Imagem", "Status", "Criado em"]
-        data = [
-            [
-                c.short_id,
-                c.name,
-                c.image.tags[0] if c.image.tags else "<sem tag>",
-                c.status,
-                c.attrs['Created'][:19].replace("T", " ")
-            ]
-            for c in containers
-        ]
+        data = []
+
+        for c in containers:
+            tags = self.image_index.tags(c.get("ImageID", ""))
+            names = c.get("Names") or [""]
+            created = datetime.fromtimestamp(c.get("Created", 0), timezone.utc)
+            data.append([
+                c["Id"][:12],
+                names[0].lstrip("/"),
+                tags[0] if tags else "<sem tag>",
+                c.get("State", ""),
+                created.strftime("%Y-%m-%d %H:%M:%S")
+            ])
+
         return headers, data
 
     def get_docker_images_details(self):
-        images = self.client_docker.images.list()
+        images = self.image_index.images()
 
-        headers = ["ID", "Repository", "Tag", "Tamanho"]
+        headers = list(IMAGE_HEADERS)
         data = []
 
         for image in images:
             # Algumas imagens podem não ter tags
-            tags = image.tags if image.tags else ["<none>:<none>"]
+            tags = self.image_index.tags(image["Id"]) or ["<none>:<none>"]
+            size_mb = round(image["Size"] / (1024 * 1024), 2)
 
             for tag in tags:
-                repo, tag_value = tag.split(":") if ":" in tag else (tag, "<none>")
-                size_mb = round(image.attrs["Size"] / (1024 * 1024), 2)
+                repo, tag_value = tag.rsplit(":", 1) if ":" in tag else (tag, "<none>")
 
                 data.append([
-                    image.short_id.replace("sha256:", ""),
+                    image["Id"].replace("sha256:", "")[:12],
                     repo,
                     tag_value,
                     f"{size_mb} MB"
                 ])
 
+        self.snapshot_store.save("images", lambda: (headers, data))
         return headers, data
 
     def get_container_details(self, container_id):
-        result = subprocess.run(
-            ["docker", "inspect", container_id],
-            capture_output=True, text=True
-        )
         try:
-            details = json.loads(result.stdout)[0]
+            details = self.api_client.inspect_container(container_id)
             formatted_details = json.dumps(details, indent=4)
             return formatted_details
-        except (json.JSONDecodeError, IndexError):
+        except Exception:
             return "Detalhes não encontrados."
 
-    def stop_containers(self):
+    def stop_containers(self, containers=None, on_result=None):
+        """Para os containers informados (ou todos em execução) em paralelo e retorna o resultado de cada um."""
         try:
-            running_ids = subprocess.check_output(["docker", "ps", "-q"]).decode().split()
-            if running_ids:
-                subprocess.run(["docker", "stop"] + running_ids)
-                log_and_notify("Containers parados automaticamente.")
-            else:
+            if containers is None:
+                headers, containers = self.get_state_cache().running()
+
+            if not containers:
                 log_and_notify("Nenhum container em execução.")
+                return []
+
+            results = self.get_stop_engine().stop(containers, on_result=on_result)
+            log_and_notify("Containers parados automaticamente.")
+            return results
         except Exception as e:
             log_and_notify(f"Erro ao parar containers: {str(e)}")
+            return []
+
+    def get_stop_engine(self):
+        settings = load_config()
+        return ContainerStopEngine(
+            self.api_client,
+            grace_timeout=int(settings.get("stop_grace_timeout", DEFAULT_STOP_GRACE_TIMEOUT)),
+            max_workers=int(settings.get("bulk_parallelism", DEFAULT_BULK_PARALLELISM))
+        )
 
-    def start_container_by_name_or_id(self, name_or_id):
+    def start_container_by_name_or_id(self, name_or_id, raise_errors=False):
         try:
-            self.client_docker.containers.get(name_or_id).start()
+            self.api_client.start(name_or_id)
         except Exception as e:
+            if raise_errors:
+                raise
             print("Erro", f"Erro ao iniciar container:\n{str(e)}")
 
-    def stop_container_by_name_or_id(self, name_or_id):
+    def stop_container_by_name_or_id(self, name_or_id, raise_errors=False):
         try:
-            self.client_docker.containers.get(name_or_id).stop()
+            self.api_client.stop(name_or_id)
         except Exception as e:
+            if raise_errors:
+                raise
             print("Erro", f"Erro ao parar container:\n{str(e)}")
 
-    def remove_container_by_name_or_id(self, name_or_id):
+    def remove_container_by_name_or_id(self, name_or_id, raise_errors=False):
         try:
-            self.client_docker.containers.get(name_or_id).remove(force=True)
+            self.api_client.remove_container(name_or_id, force=True)
         except Exception as e:
+            if raise_errors:
+                raise
             print("Erro", f"Erro ao remover container:\n{str(e)}")
 
     def pull_image(self, image_name):
         try:
             self.client_docker.images.pull(image_name)
+            self.image_index.invalidate()
         except Exception as e:
             # Fecha a janela de progresso após a conclusão
             print("Erro", f"Erro ao baixar imagem:\n{str(e)}")
@@ -131,10 +310,12 @@ class DockerUtils:
         response = self.api_client.pull(image_name, stream=True, decode=True)
         for line in response:
             yield line  # linha com progresso, status, id, etc.
+        self.image_index.invalidate()
 
     def remove_image(self, image_name):
         try:
             self.client_docker.images.remove(image=image_name)
+            self.image_index.invalidate()
         except Exception as e:
             print("Erro", f"Erro ao remover imagem:\n{str(e)}")
 
@@ -157,5 +338,7 @@ class DockerUtils:
                                               ports={port.split(':')[1]: port.split(':')[0]}, network=network,
                                               environment=environment,
                                               detach=True)
+            # O run pode ter baixado a imagem implicitamente
+            self.image_index.invalidate()
         except Exception as e:
             print("Erro", f"Erro ao criar container:\n{str(e)}")
\ No newline at end of file
@@ -0,0 +1,239 @@
+import asyncio
+import heapq
+import threading
+import time
+
+from src.services.config_utils import (log_and_notify, DEFAULT_IDLE_WINDOW, DEFAULT_IDLE_CPU_PERCENT,
+                                       DEFAULT_IDLE_NETWORK_RATE, DEFAULT_IDLE_LOG_RATE)
+
+LOG_RATE_WINDOW = 60  # segundos; idle_log_rate é contado em linhas por minuto
+SAMPLE_GAP = 30  # segundos sem amostra de CPU/rede que interrompem a evidência de ociosidade
+
+
+class IdlePolicy:
+    """Decide quais containers estão ociosos há mais que `idle_window` segundos.
+
+    Cada amostra (CPU, rede e linhas de log) só atualiza o instante da última atividade do
+    container. Os prazos ficam num heap com uma entrada por container: `idle_containers`
+    retira apenas as entradas vencidas e reagenda as que tiveram atividade no meio, então
+    cada verificação custa O(containers que mudaram), sem varrer todos. Containers isentos
+    (por nome, ID ou label) nunca entram no heap. Pode ser alimentado por outra thread.
+
+    Falta de dados não é ociosidade: um container só entra no heap na primeira amostra de
+    CPU/rede, e o recomeço das amostras depois de um intervalo maior que SAMPLE_GAP conta
+    como atividade, então só vence o prazo quem teve amostras durante a janela inteira.
+    Containers sem amostras recentes (agrupados por faixa de SAMPLE_GAP segundos) ou cujo
+    stream de logs falhou ficam fora do resultado.
+    """
+
+    def __init__(self, settings=None):
+        self._lock = threading.Lock()
+        self._tracked = {}  # ID completo -> instante da última atividade
+        self._heap = []  # (prazo, ID completo)
+        self._deadlines = {}  # ID completo -> prazo da entrada válida no heap
+        self._idle = set()  # prazo vencido e sem atividade desde então
+        self._network = {}  # ID completo -> (instante, bytes de rede acumulados)
+        self._logs = {}  # ID completo -> (início da janela, linhas)
+        self._seen = {}  # ID completo -> linha dos containers em execução na última sincronização
+        self._last_sample = {}  # ID completo -> instante da última amostra de CPU/rede
+        self._sample_slots = {}  # faixa de SAMPLE_GAP segundos da última amostra -> IDs completos
+        self._log_failed = set()  # containers sem dados de log: nunca são considerados ociosos
+        self.configure(settings or {})
+
+    def configure(self, settings):
+        """Lê janela, limiares e isenções das configurações (docker_monitor_config.json)."""
+        with self._lock:
+            self.idle_window = float(settings.get("idle_window", DEFAULT_IDLE_WINDOW))
+            self.cpu_threshold = float(settings.get("idle_cpu_percent", DEFAULT_IDLE_CPU_PERCENT))
+            self.network_threshold = float(settings.get("idle_network_rate", DEFAULT_IDLE_NETWORK_RATE))
+            self.log_threshold = float(settings.get("idle_log_rate", DEFAULT_IDLE_LOG_RATE))
+            self.exempt_containers = set(settings.get("auto_stop_exempt_containers", []))
+            self.exempt_labels = list(settings.get("auto_stop_exempt_labels", []))
+            # Isenções novas (ou removidas) valem também para os containers já em execução
+            now = time.time()
+            for container_id, row in self._seen.items():
+                if self.is_exempt(row):
+                    self._forget(container_id)
+                elif container_id not in self._tracked:
+                    self._tracked[container_id] = now
+            # Mudar a janela muda todos os prazos: único caso em que o heap é refeito por inteiro
+            self._deadlines = {i: last + self.idle_window for i, last in self._tracked.items()
+                               if i not in self._idle and i in self._last_sample}
+            self._heap = [(deadline, i) for i, deadline in self._deadlines.items()]
+            heapq.heapify(self._heap)
+
+    def sync(self, rows, now=None):
+        """Acompanha os containers em execução (linhas do cache); só os que mudaram são processados."""
+        now = time.time() if now is None else now
+        running = {row["Id"]: row for row in rows if row.get("State", "running") == "running"}
+        with self._lock:
+            for container_id in self._seen.keys() - running.keys():
+                self._forget(container_id)
+            for container_id in running.keys() - self._seen.keys():
+                if not self.is_exempt(running[container_id]):
+                    # Iniciar conta como atividade; o prazo só é agendado na primeira amostra
+                    self._tracked[container_id] = now
+            self._seen = running
+
+    def is_exempt(self, row):
+        if {row.get("Nome"), row.get("ID"), row.get("Id")} & self.exempt_containers:
+            return True
+        labels = row.get("Labels") or {}
+        for exemption in self.exempt_labels:
+            key, separator, value = exemption.partition("=")
+            if key in labels and (not separator or labels[key] == value):
+                return True
+        return False
+
+    def observe(self, container_id, timestamp, metrics):
+        """Amostra do StatsCollector: CPU ou taxa de rede acima do limiar contam como atividade."""
+        network = metrics.get("net_rx", 0) + metrics.get("net_tx", 0)
+        with self._lock:
+            if container_id in self._tracked:
+                self._sample(container_id, timestamp)
+            previous = self._network.get(container_id)
+            self._network[container_id] = (timestamp, network)
+            active = metrics.get("cpu_percent", 0) >= self.cpu_threshold
+            if not active and previous is not None and timestamp > previous[0]:
+                active = (network - previous[1]) / (timestamp - previous[0]) >= self.network_threshold
+            if active:
+                self._activity(container_id, timestamp)
+
+    def observe_logs(self, container_id, timestamp, lines=1):
+        """Linhas de log novas: `idle_log_rate` linhas dentro de um minuto contam como atividade."""
+        with self._lock:
+            start, count = self._logs.get(container_id, (timestamp, 0))
+            if timestamp - start >= LOG_RATE_WINDOW:
+                start, count = timestamp, 0
+            count += lines
+            self._logs[container_id] = (start, count)
+            if count >= self.log_threshold:
+                self._activity(container_id, timestamp)
+
+    def logs_unavailable(self, container_id):
+        """O stream de logs do container falhou: sem como medir a atividade, ele não é parado."""
+        with self._lock:
+            if container_id in self._tracked:
+                self._log_failed.add(container_id)
+
+    def idle_containers(self, now=None):
+        """IDs completos dos containers com evidência de inatividade há pelo menos `idle_window` segundos."""
+        now = time.time() if now is None else now
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                deadline, container_id = heapq.heappop(self._heap)
+                if self._deadlines.get(container_id) != deadline:
+                    continue  # entrada antiga de um container que parou ou foi reagendado
+                last = self._tracked[container_id]
+                if last + self.idle_window > now:
+                    self._schedule(container_id, last + self.idle_window)
+                else:
+                    del self._deadlines[container_id]
+                    self._idle.add(container_id)
+            # Sem amostras nas duas últimas faixas (entre SAMPLE_GAP e 2 * SAMPLE_GAP segundos) não há evidência
+            current = int(now // SAMPLE_GAP)
+            stale = [ids for slot, ids in self._sample_slots.items() if slot < current - 1]
+            if self.log_threshold > 0:
+                stale.append(self._log_failed)
+            return self._idle.difference(*stale)
+
+    def tracked(self):
+        """IDs completos dos containers em execução que não são isentos."""
+        with self._lock:
+            return list(self._tracked)
+
+    def last_activity(self, container_id):
+        with self._lock:
+            return self._tracked.get(container_id)
+
+    def _sample(self, container_id, timestamp):
+        last = self._last_sample.get(container_id)
+        self._last_sample[container_id] = timestamp if last is None else max(last, timestamp)
+        slot, previous_slot = int(self._last_sample[container_id] // SAMPLE_GAP), self._slot_of(last)
+        if slot != previous_slot:
+            self._move_slot(container_id, previous_slot, slot)
+        if last is None or timestamp - last > SAMPLE_GAP:
+            # Primeira amostra ou fim de um intervalo sem dados: a evidência recomeça daqui
+            self._activity(container_id, timestamp)
+
+    @staticmethod
+    def _slot_of(timestamp):
+        return None if timestamp is None else int(timestamp // SAMPLE_GAP)
+
+    def _move_slot(self, container_id, old, new):
+        if old is not None:
+            ids = self._sample_slots[old]
+            ids.discard(container_id)
+            if not ids:
+                del self._sample_slots[old]
+        if new is not None:
+            self._sample_slots.setdefault(new, set()).add(container_id)
+
+    def _activity(self, container_id, timestamp):
+        # Amostras de containers isentos ou não sincronizados são ignoradas
+        if container_id not in self._tracked:
+            return
+        self._tracked[container_id] = max(self._tracked[container_id], timestamp)
+        if container_id in self._idle or container_id not in self._deadlines:
+            # Voltou a ter atividade (ou teve a primeira amostra): entra no heap
+            self._idle.discard(container_id)
+            if container_id in self._last_sample:
+                self._schedule(container_id, self._tracked[container_id] + self.idle_window)
+
+    def _schedule(self, container_id, deadline):
+        self._deadlines[container_id] = deadline
+        heapq.heappush(self._heap, (deadline, container_id))
+
+    def _forget(self, container_id):
+        # A entrada no heap fica órfã e é descartada quando vencer (remoção preguiçosa)
+        self._tracked.pop(container_id, None)
+        self._deadlines.pop(container_id, None)
+        self._idle.discard(container_id)
+        self._logs.pop(container_id, None)
+        self._network.pop(container_id, None)
+        self._move_slot(container_id, self._slot_of(self._last_sample.pop(container_id, None)), None)
+        self._log_failed.discard(container_id)
+
+
+class LogActivityWatcher:
+    """Segue os logs (a partir de agora) dos containers acompanhados, contando linhas para o IdlePolicy.
+
+    Os streams rodam no event loop asyncio compartilhado, como os do StatsCollector.
+    """
+
+    def __init__(self, async_client, bridge, policy):
+        self.client = async_client
+        self.bridge = bridge
+        self.policy = policy
+        self._streams = {}  # ID completo -> future do stream
+        self._failed = set()  # streams com erro: só reabrem depois que o container parar
+        self._lock = threading.Lock()
+
+    def sync(self, container_ids):
+        wanted = set(container_ids) if self.policy.log_threshold > 0 else set()
+        for container_id in list(self._streams):
+            if container_id not in wanted:
+                self._streams.pop(container_id).cancel()
+        with self._lock:
+            self._failed &= wanted
+            failed = set(self._failed)
+
+        for container_id in wanted - failed:
+            stream = self._streams.get(container_id)
+            if stream is None or stream.done():
+                self._streams[container_id] = self.bridge.submit(self._follow(container_id))
+
+    def stop(self):
+        self.sync([])
+
+    async def _follow(self, container_id):
+        try:
+            async for _ in self.client.logs(container_id, follow=True, tail=0):
+                self.policy.observe_logs(container_id, time.time())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            with self._lock:
+                self._failed.add(container_id)
+            self.policy.logs_unavailable(container_id)
+            log_and_notify(f"Erro ao acompanhar logs do container {container_id[:12]}: {e}")
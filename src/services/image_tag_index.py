@@ -0,0 +1,44 @@
+import threading
+
+IMAGE_ACTIONS = ("pull", "tag", "untag", "delete", "import", "load")
+
+
+class ImageTagIndex:
+    """Índice ID da imagem -> tags, montado com uma única chamada /images/json."""
+
+    def __init__(self, api_client):
+        self.api_client = api_client
+        self._images = None
+        self._tags = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Descarta o índice; a próxima consulta refaz a listagem (após pull/remoção de imagens)."""
+        with self._lock:
+            self._images = None
+            self._tags = {}
+
+    def images(self):
+        """Retorna a listagem crua de /images/json, carregando-a se necessário."""
+        with self._lock:
+            if self._images is None:
+                self._build()
+            return self._images
+
+    def tags(self, image_id):
+        with self._lock:
+            if self._images is None:
+                self._build()
+            return self._tags.get(image_id, [])
+
+    def handle_event(self, event):
+        """Invalida o índice em eventos de imagem que alteram tags (pull, tag, untag, delete...)."""
+        if event.get("Type") == "image" and event.get("Action") in IMAGE_ACTIONS:
+            self.invalidate()
+
+    def _build(self):
+        self._images = self.api_client.images()
+        self._tags = {
+            image["Id"]: [tag for tag in (image.get("RepoTags") or []) if tag != "<none>:<none>"]
+            for image in self._images
+        }
@@ -0,0 +1,98 @@
+import mmap
+import os
+import re
+from array import array
+
+TIMESTAMP_SIZE = 19  # "yyyy-MM-dd HH:mm:ss" no início de cada linha do log
+TIMESTAMP_PATTERN = re.compile(rb"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}")
+NEWLINE = re.compile(b"\n")
+
+
+class LogFileIndex:
+    """Índice de linhas do arquivo de log sobre um mmap, atualizado incrementalmente.
+
+    Guarda só o offset de início de cada linha; `refresh` indexa apenas os bytes que
+    chegaram desde a última chamada e recomeça do zero se o arquivo foi rotacionado
+    (inode diferente ou tamanho menor). As linhas são lidas do mmap sob demanda.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._reset()
+
+    def _reset(self):
+        self.close()
+        self._offsets = array("Q")  # início de cada linha completa
+        self._indexed = 0  # bytes já indexados (até o último \n)
+        self._inode = None
+
+    def close(self):
+        mapped = getattr(self, "_mmap", None)
+        if mapped is not None:
+            mapped.close()
+        self._mmap = None
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def refresh(self):
+        """Indexa o que foi anexado ao arquivo; retorna quantas linhas novas entraram."""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            self._reset()
+            return 0
+
+        if stat.st_ino != self._inode or stat.st_size < self._indexed:
+            self._reset()
+            self._inode = stat.st_ino
+
+        if stat.st_size == 0:
+            return 0
+        if self._mmap is None or len(self._mmap) != stat.st_size:
+            self.close()
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), stat.st_size, access=mmap.ACCESS_READ)
+
+        # Fim de cada linha nova = início da seguinte; a linha incompleta no fim fica para depois
+        ends = array("Q", (match.end() for match in NEWLINE.finditer(self._mmap, self._indexed)))
+        if not ends:
+            return 0
+        self._offsets.append(self._indexed)
+        self._offsets.extend(ends[:-1])
+        self._indexed = ends[-1]
+        return len(ends)
+
+    def line(self, index):
+        start = self._offsets[index]
+        stop = self._offsets[index + 1] - 1 if index + 1 < len(self._offsets) else self._indexed - 1
+        return self._mmap[start:stop].decode("utf-8", errors="replace")
+
+    def lines(self, start, stop):
+        start = max(0, start)
+        stop = min(stop, len(self._offsets))
+        if start >= stop:
+            return []
+        end = self._offsets[stop] - 1 if stop < len(self._offsets) else self._indexed - 1
+        return self._mmap[self._offsets[start]:end].decode("utf-8", errors="replace").split("\n")
+
+    def timestamp(self, index):
+        """Timestamp da linha, ou da anterior mais próxima que tenha um (mensagens de várias linhas)."""
+        while index >= 0:
+            start = self._offsets[index]
+            prefix = self._mmap[start:start + TIMESTAMP_SIZE]
+            if TIMESTAMP_PATTERN.fullmatch(prefix):
+                return prefix.decode()
+            index -= 1
+        return ""
+
+    def find_time(self, timestamp):
+        """Índice da primeira linha com timestamp >= `timestamp` ("yyyy-MM-dd HH:mm:ss"), por busca binária."""
+        low, high = 0, len(self._offsets)
+        while low < high:
+            middle = (low + high) // 2
+            if self.timestamp(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
@@ -1,30 +1,95 @@
-import subprocess
+import queue
+import threading
 import time
 from PyQt5.QtCore import QThread, pyqtSignal
 
+BATCH_INTERVAL = 0.25  # segundos entre lotes de linhas no modo follow
+BATCH_MAX_LINES = 2000
+
 
 class LogUpdaterThread(QThread):
     new_logs = pyqtSignal(str)
+    new_lines = pyqtSignal(list)  # modo follow: apenas as linhas novas, em lotes
 
-    def __init__(self, container_id, line_count):
+    def __init__(self, container_id, line_count, docker_utils, follow=True):
         super().__init__()
         self.container_id = container_id
         self.line_count = line_count
+        self.docker_utils = docker_utils
+        self.follow = follow
         self.running = True
+        self._stream = None
 
     def run(self):
+        if self.follow:
+            self.run_follow()
+        else:
+            self.run_poll()
+
+    def run_poll(self):
         while self.running:
             try:
-                result = subprocess.run(
-                    ["docker", "logs", "--tail", str(self.line_count), self.container_id],
-                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                )
-                logs = result.stdout if result.returncode == 0 else result.stderr
-                self.new_logs.emit(logs)  # <-- Aqui o sinal é emitido corretamente
+                logs = self.docker_utils.api_client.logs(self.container_id, tail=self.line_count)
+                self.new_logs.emit(logs.decode("utf-8", errors="replace"))
             except Exception as e:
                 self.new_logs.emit(f"Erro ao obter logs: {str(e)}")
             self.msleep(2000)
 
+    def run_follow(self):
+        """Uma única conexão de logs em streaming; emite só as linhas novas, agrupadas em lotes."""
+        chunks = queue.Queue()
+
+        try:
+            self._stream = self.docker_utils.api_client.logs(
+                self.container_id, stream=True, follow=True, tail=self.line_count
+            )
+        except Exception as e:
+            self.new_lines.emit([f"Erro ao obter logs: {str(e)}"])
+            return
+
+        reader = threading.Thread(target=self._read_stream, args=(chunks,), daemon=True)
+        reader.start()
+
+        pending = b""
+        batch = []
+        last_emit = time.monotonic()
+        finished = False
+
+        while self.running and not finished:
+            try:
+                chunk = chunks.get(timeout=BATCH_INTERVAL)
+                if chunk is None:
+                    finished = True
+                else:
+                    lines = (pending + chunk).split(b"\n")
+                    pending = lines.pop()
+                    batch.extend(line.decode("utf-8", errors="replace") for line in lines)
+            except queue.Empty:
+                pass
+
+            now = time.monotonic()
+            if batch and (finished or len(batch) >= BATCH_MAX_LINES or now - last_emit >= BATCH_INTERVAL):
+                self.new_lines.emit(batch)
+                batch = []
+                last_emit = now
+
+        if pending and self.running:
+            self.new_lines.emit([pending.decode("utf-8", errors="replace")])
+
+    def _read_stream(self, chunks):
+        try:
+            for chunk in self._stream:
+                chunks.put(chunk)
+        except Exception:
+            pass
+        finally:
+            chunks.put(None)
+
     def stop(self):
         self.running = False
-        self.wait()
\ No newline at end of file
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except Exception:
+                pass
+        self.wait()
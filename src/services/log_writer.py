@@ -0,0 +1,153 @@
+import gzip
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+
+FLUSH_INTERVAL = 1.0  # segundos máximos entre a mensagem e a escrita em disco
+FLUSH_BYTES = 64 * 1024
+DEFAULT_LOG_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_LOG_BACKUP_COUNT = 5
+
+
+class BufferedLogWriter:
+    """Escreve linhas de log num arquivo a partir de uma thread própria.
+
+    `write` só enfileira; a thread mantém um único handle aberto e grava em lote quando
+    acumula FLUSH_BYTES ou passa FLUSH_INTERVAL. Ao passar de `max_bytes` o arquivo é
+    rotacionado (docker-monitor.log.1, .2, ...), opcionalmente comprimindo com gzip.
+    """
+
+    def __init__(self, path, max_bytes=DEFAULT_LOG_MAX_BYTES, backup_count=DEFAULT_LOG_BACKUP_COUNT,
+                 compress=False, flush_interval=FLUSH_INTERVAL, flush_bytes=FLUSH_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+        self.flush_interval = flush_interval
+        self.flush_bytes = flush_bytes
+
+        self._queue = queue.Queue()
+        self._file = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, line):
+        if self._closed:
+            # Mensagens tardias (depois do close na saída do processo) vão direto para o arquivo
+            with open(self.path, "a", encoding="utf-8") as log_file:
+                log_file.write(line)
+            return
+        self._queue.put(line)
+
+    def flush(self, timeout=5):
+        """Bloqueia até tudo que foi enfileirado antes desta chamada estar no disco."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self, timeout=5):
+        if self._closed:
+            return
+        self._queue.put(None)
+        self._closed = True
+        self._thread.join(timeout)
+
+    def _run(self):
+        pending = []
+        pending_bytes = 0
+        deadline = None
+
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ""  # prazo de flush vencido
+
+            if isinstance(item, str) and item:
+                pending.append(item)
+                pending_bytes += len(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if pending_bytes < self.flush_bytes:
+                    continue
+
+            if pending:
+                self._write(pending)
+                pending = []
+                pending_bytes = 0
+            deadline = None
+
+            if item is None:
+                self._close_file()
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+
+    def _write(self, lines):
+        try:
+            handle = self._open()
+            # Rotaciona antes de escrever, para o lote novo ficar sempre no arquivo atual
+            if self.max_bytes and handle.tell() >= self.max_bytes:
+                self._rotate()
+                handle = self._open()
+            handle.write("".join(lines))
+            handle.flush()
+        except Exception as e:
+            print(f"[ERRO] Falha ao gravar o log em {self.path}: {e}")
+            self._close_file()
+
+    def _open(self):
+        # Outro processo (o popup roda separado) pode ter rotacionado o arquivo: reabre se o inode mudou
+        if self._file is not None:
+            try:
+                if os.stat(self.path).st_ino == os.fstat(self._file.fileno()).st_ino:
+                    return self._file
+            except FileNotFoundError:
+                pass
+            self._close_file()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        return self._file
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+    def _rotate(self):
+        self._close_file()
+        if self.backup_count <= 0:
+            os.truncate(self.path, 0)
+            return
+
+        # Descarta o backup mais antigo e desloca os demais (.1 -> .2, ...)
+        for ext in (".gz", ""):
+            oldest = self._backup_path(self.backup_count, ext)
+            if oldest.exists():
+                oldest.unlink()
+        for index in range(self.backup_count - 1, 0, -1):
+            for ext in (".gz", ""):
+                source = self._backup_path(index, ext)
+                if source.exists():
+                    os.replace(source, self._backup_path(index + 1, ext))
+
+        first = self._backup_path(1, "")
+        os.replace(self.path, first)
+        if self.compress:
+            with open(first, "rb") as source, gzip.open(self._backup_path(1, ".gz"), "wb") as target:
+                shutil.copyfileobj(source, target)
+            first.unlink()
+
+    def _backup_path(self, index, ext):
+        return self.path.with_name(f"{self.path.name}.{index}{ext}")
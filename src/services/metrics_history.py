@@ -0,0 +1,216 @@
+import atexit
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from src.models.metrics_store import METRICS
+from src.services.config_utils import get_config_path, DEFAULT_METRICS_RETENTION_DAYS
+
+SEGMENT_SECONDS = 3600  # um arquivo por hora: a retenção apaga arquivos inteiros
+SEGMENT_SUFFIX = ".seg"
+MAGIC = b"DMMS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI4x")  # magic, versão, número de métricas, tamanho do registro
+# O ID curto (12 dígitos hex) vira um inteiro: registros menores e agrupamento por ordenação numérica
+RECORD = np.dtype([("time", "<f8"), ("container", "<u8"), ("values", "<f4", (len(METRICS),))])
+BUFFER_RECORDS = 4096
+FLUSH_INTERVAL = 60  # segundos
+
+
+class MetricsHistory:
+    """Histórico das métricas em disco, em segmentos binários de registros fixos (RECORD).
+
+    Cada segmento cobre SEGMENT_SECONDS e só recebe registros no final; a leitura mapeia os
+    arquivos com np.memmap e filtra de forma vetorizada, sem carregar o período inteiro na
+    memória. Segmentos mais antigos que a retenção são apagados ao abrir um novo segmento.
+    """
+
+    def __init__(self, directory=None, retention_days=DEFAULT_METRICS_RETENTION_DAYS):
+        self.directory = Path(directory) if directory else get_config_path().parent / "metrics"
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.retention = retention_days * 86400
+        self._buffer = np.zeros(BUFFER_RECORDS, dtype=RECORD)
+        self._buffered = 0
+        self._segment = None  # início do segmento dos registros no buffer
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def append(self, container_id, timestamp, values):
+        """Registra uma amostra (valores na ordem de METRICS); gravada no disco em lotes."""
+        segment = segment_start(timestamp)
+        with self._lock:
+            if self._buffered and (segment != self._segment or self._buffered == BUFFER_RECORDS):
+                self._flush_locked()
+            self._segment = segment
+            self._buffer[self._buffered] = (timestamp, container_key(container_id), values)
+            self._buffered += 1
+            if time.monotonic() - self._last_flush > FLUSH_INTERVAL:
+                self._flush_locked()
+
+    def write_records(self, records):
+        """Anexa um array RECORD (ordenado por tempo) aos segmentos correspondentes."""
+        if not len(records):
+            return
+        segments = (records["time"] // SEGMENT_SECONDS).astype(np.int64) * SEGMENT_SECONDS
+        boundaries = np.flatnonzero(np.diff(segments)) + 1
+        with self._lock:
+            self._flush_locked()
+            for chunk in np.split(records, boundaries):
+                self._write_segment(segment_start(chunk["time"][0]), chunk)
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._buffered:
+            return
+        self._write_segment(self._segment, self._buffer[:self._buffered])
+        self._buffered = 0
+
+    def _write_segment(self, segment, records):
+        path = self._path(segment)
+        new_file = not path.exists()
+        with open(path, "ab") as f:
+            if new_file:
+                f.write(HEADER.pack(MAGIC, VERSION, len(METRICS), RECORD.itemsize))
+            else:
+                # Um registro pela metade (queda no meio da escrita) desalinharia os seguintes
+                size = f.tell()
+                valid = HEADER.size + (size - HEADER.size) // RECORD.itemsize * RECORD.itemsize
+                if valid != size:
+                    f.truncate(valid)
+                    f.seek(valid)
+            f.write(records.tobytes())
+        if new_file:
+            self.prune(segment)
+
+    def prune(self, now):
+        """Apaga os segmentos que terminaram antes do início da retenção."""
+        for segment, path in self.segments():
+            if segment + SEGMENT_SECONDS < now - self.retention:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def segments(self, start=None, end=None):
+        """(início, caminho) dos segmentos que cruzam [start, end), em ordem."""
+        found = []
+        for path in self.directory.glob(f"*{SEGMENT_SUFFIX}"):
+            try:
+                segment = int(path.stem)
+            except ValueError:
+                continue
+            if (start is None or segment + SEGMENT_SECONDS > start) and (end is None or segment < end):
+                found.append((segment, path))
+        return sorted(found)
+
+    def open_segment(self, path):
+        """Registros de um segmento mapeados em memória (somente leitura); None se inválido."""
+        try:
+            size = os.path.getsize(path)
+            with open(path, "rb") as f:
+                magic, version, metrics, record_size = HEADER.unpack(f.read(HEADER.size))
+        except (OSError, struct.error):
+            return None
+        if (magic, version, metrics, record_size) != (MAGIC, VERSION, len(METRICS), RECORD.itemsize):
+            return None
+        count = (size - HEADER.size) // RECORD.itemsize
+        if count <= 0:
+            return np.zeros(0, dtype=RECORD)
+        return np.memmap(path, dtype=RECORD, mode="r", offset=HEADER.size, shape=(count,))
+
+    def read(self, container_id, start, end, metric=None):
+        """(instantes, valores) de um container em [start, end); `metric` escolhe uma coluna."""
+        self.flush()
+        key = container_key(container_id)
+        times, values = [], []
+        for segment, path in self.segments(start, end):
+            records = self.open_segment(path)
+            if records is None:
+                continue
+            mask = records["container"] == key
+            if segment < start or segment + SEGMENT_SECONDS > end:
+                mask &= (records["time"] >= start) & (records["time"] < end)
+            selected = records[mask]
+            times.append(np.array(selected["time"]))
+            values.append(np.array(selected["values"]))
+        if times:
+            times, values = np.concatenate(times), np.concatenate(values)
+        else:
+            times, values = np.empty(0), np.empty((0, len(METRICS)), dtype=np.float32)
+        return times, values[:, METRICS.index(metric)] if metric else values
+
+    def read_all(self, start, end):
+        """{container: (instantes, valores)} de todos os containers em [start, end)."""
+        self.flush()
+        chunks = []
+        for segment, path in self.segments(start, end):
+            records = self.open_segment(path)
+            if records is not None and len(records):
+                chunks.append(np.array(records[(records["time"] >= start) & (records["time"] < end)]))
+        if not chunks:
+            return {}
+
+        records = np.concatenate(chunks)
+        order = np.argsort(records["container"], kind="stable")  # mantém a ordem de tempo em cada container
+        records = records[order]
+        containers, first = np.unique(records["container"], return_index=True)
+        return {
+            container_name(container): (group["time"], group["values"])
+            for container, group in zip(containers, np.split(records, first[1:]))
+        }
+
+    def summary(self, metric, start, end):
+        """{container: {"min", "max", "avg", "count"}} de uma métrica, processando um segmento por vez."""
+        self.flush()
+        column = METRICS.index(metric)
+        totals = {}
+        for segment, path in self.segments(start, end):
+            records = self.open_segment(path)
+            if records is None or not len(records):
+                continue
+            mask = (records["time"] >= start) & (records["time"] < end)
+            keys = records["container"][mask]
+            values = records["values"][mask, column].astype(np.float64)
+
+            # Agrupa por container ordenando as chaves e reduzindo cada trecho contíguo
+            order = np.argsort(keys, kind="stable")
+            keys, values = keys[order], values[order]
+            first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            counts = np.diff(np.r_[first, len(keys)])
+            sums = np.add.reduceat(values, first)
+            minimums = np.minimum.reduceat(values, first)
+            maximums = np.maximum.reduceat(values, first)
+            for key, minimum, maximum, total, count in zip(keys[first], minimums, maximums, sums, counts):
+                entry = totals.setdefault(container_name(key), [np.inf, -np.inf, 0.0, 0])
+                entry[0] = min(entry[0], minimum)
+                entry[1] = max(entry[1], maximum)
+                entry[2] += total
+                entry[3] += int(count)
+        return {
+            container: {"min": float(t[0]), "max": float(t[1]), "avg": float(t[2] / t[3]), "count": t[3]}
+            for container, t in totals.items()
+        }
+
+    def _path(self, segment):
+        return self.directory / f"{segment:010d}{SEGMENT_SUFFIX}"
+
+
+def segment_start(timestamp):
+    return int(timestamp // SEGMENT_SECONDS) * SEGMENT_SECONDS
+
+
+def container_key(container_id):
+    return int(container_id[:12], 16)
+
+
+def container_name(key):
+    return f"{int(key):012x}"
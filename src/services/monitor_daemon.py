@@ -0,0 +1,353 @@
+import json
+import os
+import queue
+import socket
+import struct
+import threading
+import time
+
+from PyQt5.QtCore import Qt
+
+from src.services.config_utils import log_and_notify
+from src.services.container_state_cache import ContainerStateCache, RECONNECT_DELAY
+
+DAEMON_ADDRESS = "\0docker_monitor_daemon"  # socket Unix abstrato; o bind também garante uma única instância
+CONNECT_TIMEOUT = 5  # segundos esperando o daemon recém-iniciado aceitar conexões
+INITIAL_TIMEOUT = 15  # segundos esperando o primeiro snapshot (listagem inicial do daemon)
+IDLE_EXIT = 30  # segundos sem nenhum cliente antes do daemon encerrar
+
+
+def encode(message):
+    """Protocolo: um objeto JSON por linha."""
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def peer_uid(conn):
+    """UID do processo do outro lado do socket Unix (SO_PEERCRED: pid, uid, gid)."""
+    credentials = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    return struct.unpack("3i", credentials)[1]
+
+
+class _ImageEventForwarder:
+    """Ocupa o lugar do ImageTagIndex no cache do daemon: repassa os eventos de imagem aos clientes."""
+
+    def __init__(self, daemon):
+        self.daemon = daemon
+
+    def handle_event(self, event):
+        self.daemon.broadcast({"event": "image", "data": event})
+
+
+class MonitorDaemon:
+    """Processo único que mantém a conexão com o Docker e o cache de estado dos containers.
+
+    A janela principal e o popup se conectam pelo socket Unix, mandam {"cmd": "subscribe"} e
+    recebem o estado completo a cada mudança ({"event": "containers", "rows": [...]}), além dos
+    eventos de imagem. A política de ociosidade do auto-stop também roda aqui, uma vez para
+    todos os clientes: {"cmd": "idle"} responde {"event": "idle", "ids": [...]}. O daemon
+    encerra sozinho após IDLE_EXIT segundos sem clientes. O socket abstrato não tem
+    permissões de arquivo, então só são aceitos clientes do mesmo usuário.
+    """
+
+    def __init__(self, docker_utils, address=DAEMON_ADDRESS, idle_exit=IDLE_EXIT):
+        self.docker_utils = docker_utils
+        self.address = address
+        self.idle_exit = idle_exit
+        self.cache = None
+        self._server = None
+        self._clients = {}  # socket -> lock de escrita
+        self._clients_lock = threading.Lock()
+        self._idle_since = time.monotonic()
+        self._running = False
+
+    def bind(self):
+        """Reserva o endereço; retorna False se outro daemon já está rodando."""
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.address)
+        except OSError:
+            server.close()
+            return False
+        server.listen(16)
+        server.settimeout(1)
+        self._server = server
+        return True
+
+    def serve_forever(self):
+        try:
+            self.cache = ContainerStateCache(self.docker_utils.api_client, _ImageEventForwarder(self),
+                                             self.docker_utils.snapshot_store)
+            # Sem event loop do Qt neste processo: o sinal chama o broadcast na própria thread de eventos
+            self.cache.changed.connect(self._broadcast_containers, Qt.DirectConnection)
+            self.cache.start()
+            self._sync_idle_policy()
+            self._running = True
+            log_and_notify("Daemon de monitoramento iniciado.")
+
+            while self._running:
+                try:
+                    conn, _ = self._server.accept()
+                except socket.timeout:
+                    if self._idle_expired():
+                        break
+                    continue
+                if not self._same_user(conn):
+                    conn.close()
+                    continue
+                conn.settimeout(None)
+                threading.Thread(target=self._serve_client, args=(conn,), daemon=True).start()
+        finally:
+            self.stop()
+        log_and_notify("Daemon de monitoramento encerrado (sem clientes).")
+
+    def stop(self):
+        self._running = False
+        if self.cache is not None:
+            self.cache.stop()
+        if self.docker_utils.idle_collector is not None:
+            self.docker_utils.idle_collector.stop()
+            self.docker_utils.log_watcher.stop()
+        if self._server is not None:
+            self._server.close()
+        with self._clients_lock:
+            clients, self._clients = list(self._clients), {}
+        for conn in clients:
+            conn.close()
+
+    def broadcast(self, message):
+        data = encode(message)
+        with self._clients_lock:
+            clients = list(self._clients.items())
+        for conn, lock in clients:
+            self._send(conn, lock, data)
+
+    def _broadcast_containers(self):
+        self.broadcast(self._containers_message())
+        self._sync_idle_policy()
+
+    def _sync_idle_policy(self):
+        headers, rows = self.cache.snapshot()
+        try:
+            self.docker_utils.sync_idle_policy(rows)
+        except Exception as e:
+            log_and_notify(f"Erro ao atualizar a política de ociosidade: {e}")
+
+    def _containers_message(self):
+        headers, rows = self.cache.snapshot()
+        return {"event": "containers", "rows": rows}
+
+    @staticmethod
+    def _same_user(conn):
+        try:
+            uid = peer_uid(conn)
+        except OSError as e:
+            log_and_notify(f"Conexão recusada pelo daemon de monitoramento: {e}")
+            return False
+        if uid != os.getuid():
+            log_and_notify(f"Conexão recusada pelo daemon de monitoramento: usuário {uid}.")
+            return False
+        return True
+
+    def _serve_client(self, conn):
+        lock = threading.Lock()
+        try:
+            for line in conn.makefile("rb"):
+                message = json.loads(line)
+                if not isinstance(message, dict):
+                    continue  # JSON válido mas fora do protocolo
+                command = message.get("cmd")
+                if command == "subscribe":
+                    # Registra antes de tirar o snapshot: uma mudança no meio ainda gera um broadcast
+                    # para este cliente, que espera o lock e chega depois do snapshot
+                    with lock:
+                        with self._clients_lock:
+                            self._clients[conn] = lock
+                        conn.sendall(encode(self._containers_message()))
+                elif command == "idle":
+                    ids = sorted(self.docker_utils.idle_containers())
+                    with lock:
+                        conn.sendall(encode({"event": "idle", "ids": ids}))
+                elif command == "refresh":
+                    try:
+                        self.cache.refresh()
+                    except Exception as e:
+                        log_and_notify(f"Erro ao recarregar containers: {e}")
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._drop(conn)
+
+    def _send(self, conn, lock, data):
+        try:
+            with lock:
+                conn.sendall(data)
+        except OSError:
+            self._drop(conn)
+
+    def _drop(self, conn):
+        with self._clients_lock:
+            self._clients.pop(conn, None)
+            if not self._clients:
+                self._idle_since = time.monotonic()
+        conn.close()
+
+    def _idle_expired(self):
+        with self._clients_lock:
+            return not self._clients and time.monotonic() - self._idle_since > self.idle_exit
+
+
+class RemoteStateCache(ContainerStateCache):
+    """Mesma interface do ContainerStateCache, alimentada pelo daemon de monitoramento.
+
+    `start` conecta (iniciando o daemon com `spawn` se ninguém atende no endereço) e espera o
+    primeiro snapshot; depois uma thread recebe as atualizações enviadas pelo daemon.
+    """
+
+    def __init__(self, image_index=None, address=DAEMON_ADDRESS, spawn=None):
+        super().__init__(None, image_index)
+        self.address = address
+        self.spawn = spawn
+        self._sock = None
+        self._reader = None
+        self._send_lock = threading.Lock()
+        self._idle_replies = queue.Queue()
+        self._idle_request_lock = threading.Lock()
+
+    def start(self):
+        if self._thread:
+            return
+
+        self._running = True
+        self._connect()
+        self._thread = threading.Thread(target=self._receive, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def refresh(self):
+        """Pede ao daemon uma nova listagem; a mudança, se houver, chega como atualização."""
+        try:
+            with self._send_lock:
+                self._sock.sendall(encode({"cmd": "refresh"}))
+        except (OSError, AttributeError) as e:
+            log_and_notify(f"Erro ao pedir atualização ao daemon de monitoramento: {e}")
+
+    def idle_containers(self, timeout=CONNECT_TIMEOUT):
+        """IDs dos containers ociosos segundo a política que roda no daemon."""
+        with self._idle_request_lock:
+            # Descarta uma resposta atrasada de uma consulta anterior que expirou
+            while not self._idle_replies.empty():
+                self._idle_replies.get_nowait()
+            with self._send_lock:
+                self._sock.sendall(encode({"cmd": "idle"}))
+            try:
+                return set(self._idle_replies.get(timeout=timeout))
+            except queue.Empty:
+                raise TimeoutError("daemon de monitoramento não respondeu") from None
+
+    def _connect(self):
+        sock = connect_daemon(self.address, self.spawn)
+        try:
+            sock.settimeout(INITIAL_TIMEOUT)
+            sock.sendall(encode({"cmd": "subscribe"}))
+            reader = sock.makefile("rb")
+            first = reader.readline()
+            if not first:
+                raise ConnectionError("daemon de monitoramento encerrou a conexão")
+            sock.settimeout(None)
+            self._apply_message(json.loads(first))
+        except (OSError, ValueError):
+            sock.close()
+            raise
+
+        # Numa reconexão o par antigo (conexão com o daemon que caiu) é fechado na troca
+        with self._send_lock:
+            old_sock, old_reader = self._sock, self._reader
+            self._sock, self._reader = sock, reader
+        for stale in (old_reader, old_sock):
+            if stale is not None:
+                try:
+                    stale.close()
+                except OSError:
+                    pass
+
+    def _receive(self):
+        while self._running:
+            try:
+                for line in self._reader:
+                    self._apply_message(json.loads(line))
+            except (OSError, ValueError) as e:
+                if self._running:
+                    log_and_notify(f"Conexão com o daemon de monitoramento perdida: {e}")
+
+            if not self._running:
+                break
+
+            # O daemon pode ter encerrado ou caído: reconecta (iniciando outro se preciso)
+            time.sleep(RECONNECT_DELAY)
+            try:
+                self._connect()
+            except (OSError, ValueError) as e:
+                log_and_notify(f"Erro ao reconectar ao daemon de monitoramento: {e}")
+
+    def _apply_message(self, message):
+        event = message.get("event")
+        if event == "containers":
+            new_state = {c["Id"]: c for c in message.get("rows", [])}
+            with self._lock:
+                changed = new_state != self._containers or not self.ready
+                self._containers = new_state
+                self.ready = True
+            if changed:
+                self._notify()
+        elif event == "idle":
+            self._idle_replies.put(message.get("ids", []))
+        elif event == "image" and self.image_index is not None:
+            self.image_index.handle_event(message.get("data", {}))
+
+
+def connect_daemon(address=DAEMON_ADDRESS, spawn=None):
+    """Conecta ao daemon; se ninguém atende e `spawn` foi informado, inicia o daemon e aguarda."""
+    process = None
+    deadline = None
+    while True:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(address)
+            return sock
+        except (ConnectionRefusedError, FileNotFoundError):
+            sock.close()
+            if spawn is None:
+                raise
+            if deadline is None:
+                process = spawn()
+                deadline = time.monotonic() + CONNECT_TIMEOUT
+            elif time.monotonic() > deadline:
+                raise
+            elif process is not None and process.poll():
+                # Código 0 é outro daemon que ganhou a corrida; diferente disso o daemon falhou ao iniciar
+                raise ConnectionRefusedError("daemon de monitoramento não iniciou")
+            time.sleep(0.1)
+
+
+def run_daemon():
+    """Ponto de entrada do processo daemon (main.py --monitor-daemon)."""
+    from src.services.docker_utils import DockerUtils
+
+    daemon = MonitorDaemon(DockerUtils(monitor_daemon=False))
+    if not daemon.bind():
+        print("Já existe um daemon de monitoramento em execução.")
+        return 0
+
+    try:
+        daemon.serve_forever()
+    except Exception as e:
+        log_and_notify(f"Erro no daemon de monitoramento: {e}")
+        return 1
+    return 0
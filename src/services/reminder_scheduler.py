@@ -0,0 +1,79 @@
+import json
+import time
+import uuid
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from src.services.config_utils import get_config_path, write_json_atomic
+
+REMINDERS_FILE = "reminders.json"
+MAX_TIMER_INTERVAL = 60  # segundos; o timer é rearmado em etapas para acompanhar o relógio (suspensão, ajuste de hora)
+
+
+class ReminderScheduler(QObject):
+    """Lembretes do botão "Lembrar" agendados dentro do próprio processo.
+
+    Cada lembrete é um prazo absoluto (epoch) salvo em reminders.json, ao lado do arquivo de
+    configuração; um único QTimer é armado para o prazo mais próximo. Lembretes que venceram
+    com o processo fechado disparam logo depois de `start`.
+    """
+    due = pyqtSignal(dict)  # lembrete vencido
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = path or get_config_path().parent / REMINDERS_FILE
+        self._reminders = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire_due)
+
+    def start(self):
+        self._reminders = self._load()
+        self._arm()
+
+    def schedule(self, delay_seconds):
+        now = time.time()
+        reminder = {"id": uuid.uuid4().hex, "created": now, "due": now + delay_seconds}
+        self._reminders.append(reminder)
+        self._save()
+        self._arm()
+        return reminder
+
+    def pending(self):
+        return sorted(self._reminders, key=lambda r: r["due"])
+
+    def cancel_all(self):
+        self._reminders = []
+        self._save()
+        self._timer.stop()
+
+    def _arm(self):
+        self._timer.stop()
+        if not self._reminders:
+            return
+        wait = min(r["due"] for r in self._reminders) - time.time()
+        self._timer.start(int(max(0, min(wait, MAX_TIMER_INTERVAL)) * 1000))
+
+    def _fire_due(self):
+        now = time.time()
+        expired = [r for r in self._reminders if r["due"] <= now]
+        if expired:
+            self._reminders = [r for r in self._reminders if r["due"] > now]
+            self._save()
+        self._arm()
+        for reminder in expired:
+            self.due.emit(reminder)
+
+    def _load(self):
+        try:
+            with open(self.path, "r") as f:
+                reminders = json.load(f)
+            return [r for r in reminders if isinstance(r, dict) and "due" in r]
+        except (OSError, ValueError):
+            return []
+
+    def _save(self):
+        try:
+            write_json_atomic(self.path, self._reminders)
+        except Exception as e:
+            print(f"[ERRO] Falha ao salvar lembretes em {self.path}: {e}")
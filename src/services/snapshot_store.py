@@ -0,0 +1,83 @@
+import atexit
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+from src.services.config_utils import get_config_path, write_text_atomic
+
+WRITE_DELAY = 2.0  # segundos; várias mudanças seguidas viram uma única gravação
+SNAPSHOT_FILES = {
+    "containers": "containers_snapshot.json",
+    "images": "images_snapshot.json",
+}
+
+
+class SnapshotStore:
+    """Último snapshot de containers/imagens em disco, ao lado do arquivo de configuração.
+
+    `save` não serializa nada: só registra de onde tirar os dados. Uma thread de timer
+    monta o JSON compacto depois de WRITE_DELAY e só grava o arquivo se o hash mudou,
+    então o caminho de atualização das tabelas não paga pelo cache.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else get_config_path().parent
+        self._pending = {}  # nome -> função que retorna (headers, linhas)
+        self._hashes = {}
+        self._timer = None
+        self._lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def load(self, name):
+        """Retorna (headers, linhas, instante da gravação) ou None se não há snapshot válido."""
+        try:
+            with open(self._path(name), "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            headers, rows = payload["headers"], payload["rows"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        # Um snapshot igual ao do disco não precisa ser regravado nesta execução
+        self._hashes[name] = self._digest(self._serialize(headers, rows))
+        return headers, rows, payload.get("saved_at", 0)
+
+    def save(self, name, producer):
+        """Agenda a gravação de `name`; `producer()` é chamado na thread de gravação."""
+        with self._lock:
+            self._pending[name] = producer
+            if self._timer is None:
+                self._timer = threading.Timer(WRITE_DELAY, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        for name, producer in pending.items():
+            try:
+                data = self._serialize(*producer())
+                digest = self._digest(data)
+                if self._hashes.get(name) == digest:
+                    continue
+                # O saved_at fica fora do hash para que snapshots idênticos não regravem o arquivo
+                write_text_atomic(self._path(name), f'{{"saved_at":{time.time():.0f},{data[1:]}')
+                self._hashes[name] = digest
+            except Exception as e:
+                print(f"[ERRO] Falha ao gravar o snapshot de {name}: {e}")
+
+    @staticmethod
+    def _serialize(headers, rows):
+        return json.dumps({"headers": headers, "rows": rows}, separators=(",", ":"), ensure_ascii=False)
+
+    @staticmethod
+    def _digest(data):
+        return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
+
+    def _path(self, name):
+        return self.directory / SNAPSHOT_FILES[name]
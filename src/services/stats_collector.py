@@ -0,0 +1,188 @@
+import asyncio
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from src.services.cgroup_stats import metrics_from_counters
+from src.services.config_utils import log_and_notify, DEFAULT_STATS_INTERVAL
+
+CGROUP_POLL_INTERVAL = 1  # segundos, o mesmo ritmo do stream /stats
+CGROUP_READ_ATTEMPTS = 3  # leituras seguidas sem resultado antes de passar o container para a API
+
+
+class StatsCollector(QObject):
+    """Amostras de CPU, memória, rede e disco de todos os containers em execução.
+
+    Cada container tem um stream /stats aberto no event loop asyncio compartilhado (as
+    conexões ficam multiplexadas numa única thread). As amostras só atualizam um dicionário;
+    um QTimer publica `stats_updated` no máximo uma vez por intervalo, qualquer que seja
+    o número de containers.
+
+    Com um `cgroup_reader` (daemon local), os containers cujo cgroup é encontrado são lidos
+    direto dos arquivos por uma única tarefa periódica, sem stream; os demais usam a API,
+    assim como os containers cujo cgroup existe mas não pôde ser lido.
+    """
+    stats_updated = pyqtSignal(dict)  # ID curto -> métricas (ver reduce_stats)
+
+    def __init__(self, async_client, bridge, interval=DEFAULT_STATS_INTERVAL, metrics_store=None,
+                 cgroup_reader=None):
+        super().__init__()
+        self.client = async_client
+        self.bridge = bridge
+        self.metrics_store = metrics_store  # histórico (MetricsStore), alimentado a cada amostra
+        self.cgroup_reader = cgroup_reader
+        self._cgroup_ids = frozenset()  # containers lidos pelo cgroup (trocado inteiro, lido na outra thread)
+        self._cgroup_poll = None
+        self._cgroup_failed = set()  # cgroup encontrado mas ilegível: seguem pela API até o container parar
+        self._listeners = []  # callback(ID completo, instante, métricas) a cada amostra, na thread do loop
+        self._streams = {}  # ID completo -> future do stream
+        self._failed = set()  # streams com erro: só reabrem depois que o container parar
+        self._latest = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._publish)
+        self.set_interval(interval)
+
+    def set_interval(self, seconds):
+        if seconds > 0:
+            self._timer.start(int(seconds * 1000))
+        else:
+            self._timer.stop()
+
+    def sync(self, container_ids):
+        """Abre streams para os containers que passaram a rodar e fecha os dos que pararam."""
+        wanted = set(container_ids)
+        found = set()
+        if self.cgroup_reader is not None:
+            found = {i for i in wanted if self.cgroup_reader.find(i) is not None}
+
+        # A tarefa de cgroup também abre streams (leitura falhou), então tudo aqui fica sob o lock
+        with self._lock:
+            self._cgroup_failed &= wanted
+            self._cgroup_ids = frozenset(found - self._cgroup_failed)
+            if self._cgroup_ids and (self._cgroup_poll is None or self._cgroup_poll.done()):
+                self._cgroup_poll = self.bridge.submit(self._poll_cgroups())
+            streamed = wanted - self._cgroup_ids
+
+            for container_id in list(self._streams):
+                if container_id not in streamed:
+                    self._streams.pop(container_id).cancel()
+            self._failed &= streamed
+            for container_id in streamed - self._failed:
+                self._open_stream(container_id)
+
+        short_ids = {container_id[:12] for container_id in wanted}
+        with self._lock:
+            for short_id in [i for i in self._latest if i not in short_ids]:
+                del self._latest[short_id]
+                self._dirty = True
+        if self.metrics_store is not None:
+            self.metrics_store.prune(time.time())
+
+    def add_listener(self, callback):
+        self._listeners.append(callback)
+
+    def stop(self):
+        self.sync([])
+        self._timer.stop()
+
+    def latest(self):
+        with self._lock:
+            return dict(self._latest)
+
+    async def _follow(self, container_id):
+        try:
+            async for sample in self.client.stats(container_id):
+                self._record(container_id, reduce_stats(sample), time.time())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            with self._lock:
+                self._failed.add(container_id)
+            log_and_notify(f"Erro ao acompanhar estatísticas do container {container_id[:12]}: {e}")
+
+    async def _poll_cgroups(self):
+        previous = {}
+        misses = {}  # ID completo -> leituras seguidas que retornaram None
+        while self._cgroup_ids:
+            now = time.time()
+            current = {}
+            for container_id in self._cgroup_ids:
+                counters = self.cgroup_reader.read(container_id)
+                if counters is None:
+                    # Uma falha isolada costuma ser o container parando; se persiste, segue pela API
+                    misses[container_id] = misses.get(container_id, 0) + 1
+                    if misses[container_id] < CGROUP_READ_ATTEMPTS:
+                        continue
+                    with self._lock:
+                        if container_id in self._cgroup_ids:
+                            self._cgroup_failed.add(container_id)
+                            self._cgroup_ids = self._cgroup_ids - {container_id}
+                            self._open_stream(container_id)
+                    continue
+                misses.pop(container_id, None)
+                self._record(container_id, metrics_from_counters(counters, previous.get(container_id)), now)
+                current[container_id] = counters
+            previous = current
+            misses = {i: count for i, count in misses.items() if i in self._cgroup_ids}
+            await asyncio.sleep(CGROUP_POLL_INTERVAL)
+
+    def _open_stream(self, container_id):
+        # Chamado com self._lock adquirido
+        stream = self._streams.get(container_id)
+        if stream is None or stream.done():
+            self._streams[container_id] = self.bridge.submit(self._follow(container_id))
+
+    def _record(self, container_id, metrics, timestamp):
+        if self.metrics_store is not None:
+            self.metrics_store.append(container_id[:12], timestamp, metrics)
+        for listener in self._listeners:
+            listener(container_id, timestamp, metrics)
+        with self._lock:
+            self._latest[container_id[:12]] = metrics
+            self._dirty = True
+
+    def _publish(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            stats = dict(self._latest)
+        self.stats_updated.emit(stats)
+
+
+def reduce_stats(sample):
+    """Reduz uma amostra de /containers/{id}/stats a CPU %, memória, rede e disco."""
+    cpu = sample.get("cpu_stats") or {}
+    precpu = sample.get("precpu_stats") or {}
+    cpu_percent = 0.0
+    # Na primeira amostra do stream o precpu vem zerado; sem ele não há intervalo para medir
+    if precpu.get("system_cpu_usage"):
+        cpu_delta = cpu.get("cpu_usage", {}).get("total_usage", 0) - precpu.get("cpu_usage", {}).get("total_usage", 0)
+        system_delta = cpu.get("system_cpu_usage", 0) - precpu["system_cpu_usage"]
+        online_cpus = cpu.get("online_cpus") or len(cpu.get("cpu_usage", {}).get("percpu_usage") or []) or 1
+        if cpu_delta > 0 and system_delta > 0:
+            cpu_percent = cpu_delta / system_delta * online_cpus * 100
+
+    memory = sample.get("memory_stats") or {}
+    memory_detail = memory.get("stats") or {}
+    # Como o `docker stats`: desconta o cache de página (cgroup v1: cache; v2: inactive_file)
+    cache = memory_detail.get("inactive_file", memory_detail.get("cache", 0))
+    memory_usage = max(0, memory.get("usage", 0) - cache)
+
+    networks = (sample.get("networks") or {}).values()
+    block_io = (sample.get("blkio_stats") or {}).get("io_service_bytes_recursive") or []
+
+    return {
+        "cpu_percent": cpu_percent,
+        "memory_usage": memory_usage,
+        "memory_limit": memory.get("limit", 0),
+        "net_rx": sum(n.get("rx_bytes", 0) for n in networks),
+        "net_tx": sum(n.get("tx_bytes", 0) for n in networks),
+        "block_read": sum(e.get("value", 0) for e in block_io if e.get("op", "").lower() == "read"),
+        "block_write": sum(e.get("value", 0) for e in block_io if e.get("op", "").lower() == "write"),
+    }
+
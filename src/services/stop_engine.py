@@ -0,0 +1,106 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from src.services.config_utils import DEFAULT_BULK_PARALLELISM, DEFAULT_STOP_GRACE_TIMEOUT
+
+KILL_MARGIN = 5  # segundos além do timeout de graça antes de forçar o kill
+POLL_INTERVAL = 0.5
+
+RESULT_STOPPED = "parado"
+RESULT_KILLED = "forçado"
+RESULT_GONE = "não encontrado"
+RESULT_ERROR = "erro"
+
+
+class ContainerStopEngine:
+    """Para containers em paralelo, com timeout de graça e kill para quem ultrapassar o prazo.
+
+    Cada container recebe um `stop` com o timeout de graça (o daemon envia SIGTERM e,
+    depois do prazo, SIGKILL). Se a chamada não retornar em grace + KILL_MARGIN segundos,
+    o engine envia um `kill` explícito. Retorna um resultado por container com o tempo gasto.
+    """
+
+    def __init__(self, api_client, grace_timeout=DEFAULT_STOP_GRACE_TIMEOUT, max_workers=DEFAULT_BULK_PARALLELISM):
+        self.api_client = api_client
+        self.grace_timeout = grace_timeout
+        self.max_workers = max(1, max_workers)
+
+    def stop(self, containers, on_result=None):
+        """Para os containers informados (dicts com 'Id'/'ID' e 'Nome') e retorna a lista de resultados."""
+        if not containers:
+            return []
+
+        started = {}
+        killed = set()
+        lock = threading.Lock()
+        results = []
+
+        def send_stop(container):
+            with lock:
+                started[container_key(container)] = time.monotonic()
+            self.api_client.stop(container_key(container), timeout=self.grace_timeout)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(send_stop, c): c for c in containers}
+
+            while pending:
+                done, _ = wait(pending, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    container = pending.pop(future)
+                    result = self._result(container, future, started, killed)
+                    results.append(result)
+                    if on_result:
+                        on_result(result)
+
+                # Escalona para kill quem passou do prazo
+                now = time.monotonic()
+                for container in pending.values():
+                    key = container_key(container)
+                    with lock:
+                        start = started.get(key)
+                    if start and key not in killed and now - start > self.grace_timeout + KILL_MARGIN:
+                        killed.add(key)
+                        try:
+                            self.api_client.kill(key)
+                        except Exception:
+                            pass
+
+        return results
+
+    def _result(self, container, future, started, killed):
+        from docker.errors import NotFound  # import tardio: o pacote docker só é carregado quando o cliente é criado
+
+        key = container_key(container)
+        elapsed = time.monotonic() - started.get(key, time.monotonic())
+        result = {
+            "ID": key[:12],
+            "Nome": container.get("Nome", key[:12]),
+            "resultado": RESULT_KILLED if key in killed else RESULT_STOPPED,
+            "tempo": round(elapsed, 2),
+            "erro": "",
+        }
+
+        error = future.exception()
+        if isinstance(error, NotFound):
+            result["resultado"] = RESULT_GONE
+        elif error is not None and key not in killed:
+            result["resultado"] = RESULT_ERROR
+            result["erro"] = str(error)
+        return result
+
+
+def container_key(container):
+    return container.get("Id") or container.get("ID") or container.get("Nome")
+
+
+def format_stop_summary(results):
+    """Resumo legível dos resultados, uma linha por container."""
+    lines = []
+    for r in sorted(results, key=lambda r: r["tempo"], reverse=True):
+        line = f"{r['Nome']} ({r['ID']}): {r['resultado']} em {r['tempo']:.2f}s"
+        if r["erro"]:
+            line += f" - {r['erro']}"
+        lines.append(line)
+    return "\n".join(lines)
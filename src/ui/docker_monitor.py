@@ -1,13 +1,14 @@
 import os
 import platform
+import time
 
-from PyQt5.QtCore import Qt, QThread
+from PyQt5.QtCore import Qt, QThread, QDateTime, QThreadPool, pyqtSignal
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QHBoxLayout, QMessageBox, QInputDialog,
     QMainWindow, QAction, QSystemTrayIcon,
     QMenu, QTableView, QListWidget, QTextEdit, QStackedWidget, QListWidgetItem, QHeaderView,
-    QTabWidget, QDialog, QProgressDialog
+    QTabWidget, QDialog, QProgressDialog, QLabel, QDateTimeEdit
 )
 
 from src.dialogs.container_details_dialog import ContainerDetailsDialog
@@ -15,18 +16,32 @@ from src.dialogs.create_container_dialog import CreateContainerDialog
 from src.dialogs.settings_widget_dialog import SettingsWidgetDialog
 from src.models.container_table_model import ContainerTableModel
 from src.models.image_table_model import ImageTableModel
-from src.services.config_utils import load_config, log_and_notify, save_config, get_config_path, get_log_path
-from src.services.docker_utils import DockerUtils
+from src.services.config_utils import log_and_notify, save_config, get_config_path, get_log_path, \
+    flush_log, DEFAULT_STATS_INTERVAL
+from src.services.config_service import get_config_service
+from src.services.container_state_cache import HEADERS
+from src.services.docker_utils import DockerUtils, IMAGE_HEADERS
+from src.services.log_file_index import LogFileIndex
 from src.ui.center_delegate import CenterDelegate
+from src.ui.sparkline_delegate import SparklineDelegate
 from src.ui.status_delegate import StatusDelegate
 from src.utils.constantes_utils import ICON_PATH, ICON_HOME_PATH, ICON_SETTINGS_PATH, ICON_REPORT_PATH
+from src.utils.stats_format import STATS_HEADERS, SPARKLINE_HEADER, SPARKLINE_SECONDS, stats_columns
 from src.worker.pulll_image_worker import PullImageWorker
 from src.worker.remove_containers_worker import RemoveContainersWorker
 from src.worker.start_containers_worker import StartContainersWorker
+from src.worker.stop_all_containers_worker import StopAllContainersWorker
 from src.worker.stop_containers_worker import StopContainersWorker
 
 
+REPORT_PAGE_LINES = 1000
+
+
 class DockerMonitor(QMainWindow):
+    containers_loaded = pyqtSignal()  # cache de containers pronto (carga inicial em segundo plano)
+    images_loaded = pyqtSignal(list, list)  # headers, linhas
+    initial_load_failed = pyqtSignal(str, str)  # qual listagem, mensagem
+    initial_load_finished = pyqtSignal()  # containers e imagens carregados (ou com erro)
     def __init__(self, dockerUtils: DockerUtils):
         super().__init__()
         self.progress_dialog = None
@@ -36,6 +51,8 @@ class DockerMonitor(QMainWindow):
         self.menu_list = None
         self.timer_label = None
         self.model = None
+        self.image_model = None
+        self.stats_collector = None
         self.later_button = None
         self.containers_table = None
         self.details_tabs = None
@@ -45,11 +62,16 @@ class DockerMonitor(QMainWindow):
 
         self.center_delegate = CenterDelegate()
         self.composite_delegate = StatusDelegate()
+        self.sparkline_delegate = SparklineDelegate(minimum_scale=10.0)
 
-        self.settings = load_config()
+        self.config_service = get_config_service()
+        self.settings = self.config_service.settings()
         self.timeout_seconds = int(self.settings.get("timeout", 1800))
         self.monitoring_enabled = self.settings.get("monitoring_enabled", False)
 
+        self.log_index = None
+        self.report_page_start = None  # None = acompanhando o fim do log
+
         self.tray_icon = None
         self.container_data = []
         self.container_headers = []
@@ -129,6 +151,19 @@ class DockerMonitor(QMainWindow):
                     }
                 """
 
+        self.report_button_style = """
+            QPushButton {
+                background-color: #6272a4;
+                color: #f8f8f2;
+                font-weight: bold;
+                padding: 6px 16px;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #7082b6;
+            }
+        """
+
         # Estilo cinza para botões desabilitados
         self.disabled_button_style = """
             QPushButton {
@@ -142,8 +177,139 @@ class DockerMonitor(QMainWindow):
         """
 
         self.init_ui()
+        self.config_service.config_changed.connect(self.apply_config)
+
+        self.containers_loaded.connect(self.on_containers_loaded)
+        self.images_loaded.connect(self.on_images_loaded)
+        self.initial_load_failed.connect(self.on_initial_load_failed)
+        self.init_retry_load_button()
+        self.load_initial_data()
+
+    def load_initial_data(self):
+        """Mostra na hora o último snapshot salvo (desatualizado) e atualiza cada tabela quando a sua listagem chegar."""
+        store = self.dockerUtils.snapshot_store
+        saved_at = []
+        for name, table, show, headers in (("containers", self.containers_table, self.show_containers, HEADERS),
+                                           ("images", self.images_table, self.show_images, IMAGE_HEADERS)):
+            snapshot = store.load(name)
+            if snapshot is None:
+                show(headers, [])
+                continue
+            show(snapshot[0], snapshot[1])
+            saved_at.append(snapshot[2])
+            # Tabela desabilitada (acinzentada) enquanto mostra dados antigos: nenhuma ação sobre eles
+            table.setEnabled(False)
+
+        self.pending_initial_loads = {"containers", "imagens"}
+        self.failed_initial_loads = {}  # listagem -> mensagem de erro (até uma nova tentativa dar certo)
+        self.saved_data_message = None
+        if saved_at:
+            saved = QDateTime.fromSecsSinceEpoch(int(min(saved_at))).toString("dd/MM HH:mm")
+            self.saved_data_message = f"Exibindo dados salvos em {saved} (desatualizados)."
+        self.update_load_status()
+
+        # Tarefas independentes: uma listagem de imagens lenta não atrasa a tabela de containers
+        pool = QThreadPool.globalInstance()
+        pool.start(self.load_containers_task)
+        pool.start(self.load_images_task)
+
+    def init_retry_load_button(self):
+        self.retry_load_button = QPushButton("Tentar novamente")
+        self.retry_load_button.setStyleSheet("padding: 2px 10px;")
+        self.retry_load_button.clicked.connect(self.retry_initial_load)
+        self.retry_load_button.hide()
+        self.statusBar().addPermanentWidget(self.retry_load_button)
+
+    def retry_initial_load(self):
+        """Repete só as listagens que falharam; a tabela continua desabilitada até uma delas dar certo."""
+        failed = list(self.failed_initial_loads)
+        self.failed_initial_loads.clear()
+        self.pending_initial_loads.update(failed)
+        self.update_load_status()
+        pool = QThreadPool.globalInstance()
+        for name in failed:
+            pool.start(self.load_containers_task if name == "containers" else self.load_images_task)
+
+    def load_containers_task(self):
+        try:
+            self.dockerUtils.get_state_cache()
+            self.containers_loaded.emit()
+        except Exception as e:
+            self.initial_load_failed.emit("containers", str(e))
+
+    def load_images_task(self):
+        try:
+            self.images_loaded.emit(*self.dockerUtils.get_docker_images_details())
+        except Exception as e:
+            self.initial_load_failed.emit("imagens", str(e))
+
+    def on_containers_loaded(self):
+        # Inscreve antes de ler o snapshot para não perder mudanças entre a carga e a inscrição
+        self.dockerUtils.get_state_cache().subscribe(self.load_containers)
+        self.start_stats_collector()
         self.load_containers()
-        self.load_imagens()
+        self.finish_initial_load("containers")
+
+    def start_stats_collector(self):
+        self.stats_collector = self.dockerUtils.get_stats_collector()
+        self.stats_collector.stats_updated.connect(self.show_stats)
+
+    def sync_stats(self):
+        # Um stream de estatísticas por container em execução; os que pararam são fechados
+        if self.stats_collector is not None:
+            self.stats_collector.sync([row["Id"] for row in self.container_data if row.get("State") == "running"])
+
+    def show_stats(self, stats):
+        if self.model is None:
+            return
+        now = time.time()
+        store = self.dockerUtils.metrics_store
+        sparklines = {container_id: store.query(container_id, "cpu_percent", SPARKLINE_SECONDS, now)[1]
+                      for container_id in stats}
+        self.model.update_stats({container_id: stats_columns(metrics) for container_id, metrics in stats.items()},
+                                sparklines)
+
+    def on_images_loaded(self, headers, data):
+        self.show_images(headers, data)
+        self.finish_initial_load("imagens")
+
+    def on_initial_load_failed(self, name, message):
+        log_and_notify(f"Erro ao carregar {name}: {message}")
+        # A tabela fica desabilitada: o que ela mostra (snapshot salvo ou nada) não é o estado atual
+        self.failed_initial_loads[name] = message
+        self.finish_initial_load(name, succeeded=False)
+
+    def finish_initial_load(self, name, succeeded=True):
+        self.pending_initial_loads.discard(name)
+        if succeeded:
+            table = self.containers_table if name == "containers" else self.images_table
+            table.setEnabled(True)
+        self.update_load_status()
+        if not self.pending_initial_loads:
+            self.initial_load_finished.emit()
+
+    def update_load_status(self):
+        """Mensagem da carga inicial: listagens pendentes, erros (com a opção de repetir) ou nada."""
+        parts = []
+        if self.saved_data_message and (self.pending_initial_loads or self.failed_initial_loads):
+            parts.append(self.saved_data_message)
+        parts += [f"Erro ao carregar {name}: {message}" for name, message in sorted(self.failed_initial_loads.items())]
+        if self.pending_initial_loads:
+            parts.append(f"Carregando {' e '.join(sorted(self.pending_initial_loads))}...")
+        self.retry_load_button.setVisible(bool(self.failed_initial_loads) and not self.pending_initial_loads)
+        if parts:
+            self.statusBar().showMessage(" ".join(parts))
+        else:
+            self.statusBar().clearMessage()
+
+    def apply_config(self, settings):
+        """Aplica alterações feitas no arquivo de configuração (por esta janela ou pelo popup)."""
+        self.settings = settings
+        self.timeout_seconds = int(settings.get("timeout", 1800))
+        self.monitoring_enabled = settings.get("monitoring_enabled", False)
+        self.settings_widget.set_values(self.monitoring_enabled, self.timeout_seconds)
+        if self.stats_collector is not None:
+            self.stats_collector.set_interval(float(settings.get("stats_interval", DEFAULT_STATS_INTERVAL)))
 
     def init_icon(self):
         if os.path.exists(ICON_PATH):
@@ -390,7 +556,38 @@ class DockerMonitor(QMainWindow):
         report_layout = QVBoxLayout()
         self.report_text = QTextEdit()
         self.report_text.setReadOnly(True)
+        self.report_text.setLineWrapMode(QTextEdit.NoWrap)
         report_layout.addWidget(self.report_text)
+
+        # Navegação por páginas (a partir do fim) e salto por data
+        report_controls = QHBoxLayout()
+        self.report_older_button = QPushButton("◀ Mais antigos")
+        self.report_older_button.clicked.connect(lambda: self.move_report_page(-REPORT_PAGE_LINES))
+        self.report_newer_button = QPushButton("Mais recentes ▶")
+        self.report_newer_button.clicked.connect(lambda: self.move_report_page(REPORT_PAGE_LINES))
+        self.report_tail_button = QPushButton("Últimos")
+        self.report_tail_button.clicked.connect(self.show_report_tail)
+
+        self.report_date_edit = QDateTimeEdit(QDateTime.currentDateTime().addDays(-1))
+        self.report_date_edit.setDisplayFormat("yyyy-MM-dd HH:mm")
+        self.report_date_edit.setCalendarPopup(True)
+        self.report_date_button = QPushButton("Ir para data")
+        self.report_date_button.clicked.connect(self.jump_report_to_date)
+
+        self.report_position_label = QLabel()
+        for button in (self.report_older_button, self.report_newer_button, self.report_tail_button,
+                       self.report_date_button):
+            button.setStyleSheet(self.report_button_style)
+
+        report_controls.addWidget(self.report_older_button)
+        report_controls.addWidget(self.report_newer_button)
+        report_controls.addWidget(self.report_tail_button)
+        report_controls.addStretch()
+        report_controls.addWidget(self.report_position_label)
+        report_controls.addStretch()
+        report_controls.addWidget(self.report_date_edit)
+        report_controls.addWidget(self.report_date_button)
+        report_layout.addLayout(report_controls)
         self.report_widget.setLayout(report_layout)
 
         # === Tela Settings ===
@@ -409,9 +606,16 @@ class DockerMonitor(QMainWindow):
         self.setCentralWidget(central_widget)
 
     def load_imagens(self):
-        image_headers, image_data = self.dockerUtils.get_docker_images_details()
-        image_model = ImageTableModel(image_headers, image_data)
-        self.images_table.setModel(image_model)
+        self.show_images(*self.dockerUtils.get_docker_images_details())
+
+    def show_images(self, image_headers, image_data):
+        # Depois da primeira carga o model é atualizado por diff, mantendo seleção e scroll
+        if self.image_model is not None:
+            self.image_model.update_data(image_headers, image_data)
+            return
+
+        self.image_model = ImageTableModel(image_headers, image_data)
+        self.images_table.setModel(self.image_model)
         self.images_table.selectionModel().selectionChanged.connect(self.update_imagens_buttons)
 
         # Seleciona a linha inteira ao clicar em uma célula
@@ -457,8 +661,18 @@ class DockerMonitor(QMainWindow):
         self.images_table.verticalHeader().setDefaultSectionSize(30)
 
     def load_containers(self):
-        self.container_headers, self.container_data = self.dockerUtils.get_all_containers_details_subprocess()
-        self.model = ContainerTableModel(self.container_headers, self.container_data)
+        self.show_containers(*self.dockerUtils.get_state_cache().snapshot())
+
+    def show_containers(self, headers, data):
+        self.container_headers, self.container_data = headers, data
+        self.sync_stats()
+
+        # Depois da primeira carga o model é atualizado por diff, mantendo seleção e scroll
+        if self.model is not None:
+            self.model.update_data(self.container_headers, self.container_data)
+            return
+
+        self.model = ContainerTableModel(self.container_headers, self.container_data, STATS_HEADERS)
         self.containers_table.setModel(self.model)
         self.containers_table.selectionModel().selectionChanged.connect(self.update_container_buttons)
 
@@ -487,9 +701,11 @@ class DockerMonitor(QMainWindow):
                 }
             """)
 
-        for i, column_name in enumerate(self.container_headers):
+        for i, column_name in enumerate(self.container_headers + STATS_HEADERS):
             if column_name.lower() == "status":
                 self.containers_table.setItemDelegateForColumn(i, self.composite_delegate)
+            elif column_name == SPARKLINE_HEADER:
+                self.containers_table.setItemDelegateForColumn(i, self.sparkline_delegate)
             else:
                 self.containers_table.setItemDelegateForColumn(i, self.center_delegate)
 
@@ -500,8 +716,7 @@ class DockerMonitor(QMainWindow):
         if not index.isValid():
             return
 
-        row = index.row()
-        container_id = self.container_data[row].get("ID")
+        container_id = self.model.get_container_id(index.row())
         if container_id:
             dialog = ContainerDetailsDialog(self.dockerUtils, container_id, self)
             dialog.exec_()
@@ -514,16 +729,35 @@ class DockerMonitor(QMainWindow):
 
     def stop_containers_action(self):
         self.timer.stop()
-        self.dockerUtils.stop_containers()
-        log_and_notify("Usuário optou por parar os containers.")
-        QMessageBox.information(self, "Resultado", "Todos os containers foram parados.")
-        self.close_app()
+
+        def on_finished(results):
+            log_and_notify("Usuário optou por parar os containers.")
+            QMessageBox.information(self, "Resultado", "Todos os containers foram parados.")
+            self.close_app()
+
+        self.run_stop_all_worker(on_finished)
 
     def auto_stop(self):
-        self.dockerUtils.stop_containers()
-        log_and_notify("Tempo esgotado. Containers foram parados automaticamente.")
-        QMessageBox.warning(self, "Tempo esgotado", "Tempo esgotado. Containers foram parados.")
-        self.close_app()
+        def on_finished(results):
+            log_and_notify("Tempo esgotado. Containers foram parados automaticamente.")
+            QMessageBox.warning(self, "Tempo esgotado", "Tempo esgotado. Containers foram parados.")
+            self.close_app()
+
+        self.run_stop_all_worker(on_finished)
+
+    def run_stop_all_worker(self, on_finished):
+        """Para todos os containers em execução numa thread, chamando on_finished(resultados) ao final."""
+        self.thread_stop_all = QThread()
+        self.worker_stop_all = StopAllContainersWorker(self.dockerUtils)
+        self.worker_stop_all.moveToThread(self.thread_stop_all)
+
+        self.thread_stop_all.started.connect(self.worker_stop_all.run)
+        self.worker_stop_all.finished.connect(self.thread_stop_all.quit)
+        self.worker_stop_all.finished.connect(self.worker_stop_all.deleteLater)
+        self.thread_stop_all.finished.connect(self.thread_stop_all.deleteLater)
+        self.worker_stop_all.finished.connect(on_finished)
+
+        self.thread_stop_all.start()
 
     def change_timer(self):
         new_value, ok = QInputDialog.getInt(
@@ -532,18 +766,64 @@ class DockerMonitor(QMainWindow):
         )
         if ok:
             self.timeout_seconds = new_value * 60
-            save_config(self.timeout_seconds)
+            save_config(self.timeout_seconds, self.monitoring_enabled)
             QMessageBox.information(self, "Configuração Salva",
                                     f"Novo tempo: {new_value} minutos. A mudança terá efeito no próximo monitoramento.")
 
     def carrega_info_logs(self, index):
         self.stack_widget.setCurrentIndex(index)
         if index == 1:
-            try:
-                with open(get_log_path(), "r") as f:
-                    self.report_text.setText(f.read())
-            except Exception as e:
-                self.report_text.setText(f"Erro ao carregar relatório: {e}")
+            self.refresh_report()
+
+    def refresh_report(self):
+        """Indexa só o que foi anexado ao log desde a última visita e mostra a página atual."""
+        try:
+            flush_log()
+            if self.log_index is None:
+                self.log_index = LogFileIndex(get_log_path())
+            self.log_index.refresh()
+            self.show_report_page()
+        except Exception as e:
+            self.report_text.setPlainText(f"Erro ao carregar relatório: {e}")
+
+    def show_report_page(self):
+        total = len(self.log_index)
+        start = self.report_page_start
+        if start is None or start >= total:
+            start = max(0, total - REPORT_PAGE_LINES)
+        start = max(0, min(start, max(0, total - REPORT_PAGE_LINES)))
+        stop = min(total, start + REPORT_PAGE_LINES)
+
+        self.report_text.setPlainText("\n".join(self.log_index.lines(start, stop)))
+        self.report_position_label.setText(f"Linhas {start + 1 if total else 0}–{stop} de {total}")
+        self.report_older_button.setEnabled(start > 0)
+        self.report_newer_button.setEnabled(stop < total)
+
+        # Na última página o texto fica rolado para o fim, como num tail
+        if stop == total:
+            self.report_text.verticalScrollBar().setValue(self.report_text.verticalScrollBar().maximum())
+
+    def move_report_page(self, delta):
+        if self.log_index is None:
+            return
+        total = len(self.log_index)
+        current = self.report_page_start
+        if current is None:
+            current = max(0, total - REPORT_PAGE_LINES)
+        start = max(0, current + delta)
+        self.report_page_start = None if start + REPORT_PAGE_LINES >= total else start
+        self.show_report_page()
+
+    def show_report_tail(self):
+        self.report_page_start = None
+        self.refresh_report()
+
+    def jump_report_to_date(self):
+        if self.log_index is None:
+            return
+        timestamp = self.report_date_edit.dateTime().toString("yyyy-MM-dd HH:mm:ss")
+        self.report_page_start = self.log_index.find_time(timestamp)
+        self.show_report_page()
 
     def close_app(self):
         if self.tray_icon and platform.system() in ["Linux", "Windows"]:
@@ -559,14 +839,10 @@ class DockerMonitor(QMainWindow):
 
     def update_tables(self):
         # Containers
-        container_headers, container_data = self.dockerUtils.get_all_containers_details()
-        container_model = ContainerTableModel(container_headers, container_data)
-        self.containers_table.setModel(container_model)
+        self.load_containers()
 
-        # Imagens
-        image_headers, image_data = self.dockerUtils.get_docker_images_details()
-        image_model = ImageTableModel(image_headers, image_data)
-        self.images_table.setModel(image_model)
+        # Imagens: atualizadas por diff no model existente
+        self.load_imagens()
 
     def update_controls_visibility(self):
         is_containers_tab = self.tabs.currentIndex() == 0
@@ -628,9 +904,12 @@ class DockerMonitor(QMainWindow):
         self.worker_start_container.progress.connect(self.progress_dialog.setValue)
 
         # Conecta sinais para feedback
+        worker = self.worker_start_container
+
         def on_finished():
             self.progress_dialog.close()
-            QMessageBox.information(self, "Iniciando containers", f"Container(s) '{nome_formatados}' iniciado com sucesso.")
+            if not worker.errors:
+                QMessageBox.information(self, "Iniciando containers", f"Container(s) '{nome_formatados}' iniciado com sucesso.")
             self.load_containers()
 
         def on_error(message):
@@ -677,9 +956,12 @@ class DockerMonitor(QMainWindow):
         self.worker_stop_container.progress.connect(self.progress_dialog.setValue)
 
         # Conecta sinais para feedback
+        worker = self.worker_stop_container
+
         def on_finished():
             self.progress_dialog.close()
-            QMessageBox.information(self, "Parando containers", f"Container(s) '{nome_formatados}' parado com sucesso.")
+            if not worker.errors:
+                QMessageBox.information(self, "Parando containers", f"Container(s) '{nome_formatados}' parado com sucesso.")
             self.load_containers()
 
         def on_error(message):
@@ -726,9 +1008,12 @@ class DockerMonitor(QMainWindow):
         self.worker_remove_container.progress.connect(self.progress_dialog.setValue)
 
         # Conecta sinais para feedback
+        worker = self.worker_remove_container
+
         def on_finished():
             self.progress_dialog.close()
-            QMessageBox.information(self, "Parando containers", f"Container(s) '{nome_formatados}' parado com sucesso.")
+            if not worker.errors:
+                QMessageBox.information(self, "Parando containers", f"Container(s) '{nome_formatados}' parado com sucesso.")
             self.load_containers()
 
         def on_error(message):
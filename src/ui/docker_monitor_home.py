@@ -19,9 +19,12 @@ class DockerMonitorHome(QWidget):
         layout.addWidget(self.tabs)
 
         self.docker_utils = docker_utils
+        self.container_model = None
+        self.image_model = None
 
         self.init_container_tab()
         self.init_images_tab()
+        self.docker_utils.get_state_cache().subscribe(self.load_containers)
 
         self.setLayout(layout)
 
@@ -50,7 +53,11 @@ class DockerMonitorHome(QWidget):
         self.tabs.addTab(image_tab, "Imagens")
 
     def load_containers(self):
-        headers, data = self.docker_utils.get_running_containers_details()
+        headers, data = self.docker_utils.get_state_cache().running()
+        if self.container_model is not None:
+            self.container_model.update_data(headers, data)
+            return
+
         self.container_model = ContainerTableModel(headers, data)
         self.containers_table.setModel(self.container_model)
 
@@ -89,6 +96,10 @@ class DockerMonitorHome(QWidget):
 
     def load_images(self):
         headers, data = self.docker_utils.get_docker_images_details()
+        if self.image_model is not None:
+            self.image_model.update_data(headers, data)
+            return
+
         self.image_model = ImageTableModel(headers, data)
         self.images_table.setModel(self.image_model)
 
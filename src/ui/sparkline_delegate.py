@@ -0,0 +1,35 @@
+from PyQt5.QtCore import Qt, QPointF
+from PyQt5.QtGui import QColor, QPen, QPolygonF
+from PyQt5.QtWidgets import QStyledItemDelegate
+
+from src.models.container_table_model import SPARKLINE_ROLE
+
+
+class SparklineDelegate(QStyledItemDelegate):
+    """Desenha a série de SPARKLINE_ROLE como uma linha na célula, escalada pelo maior valor."""
+
+    def __init__(self, color="#8be9fd", minimum_scale=1.0, parent=None):
+        super().__init__(parent)
+        self.pen = QPen(QColor(color))
+        self.pen.setWidthF(1.5)
+        self.minimum_scale = minimum_scale
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        values = index.data(SPARKLINE_ROLE)
+        if values is None or len(values) < 2:
+            return
+
+        rect = option.rect.adjusted(4, 4, -4, -4)
+        scale = max(float(max(values)), self.minimum_scale)
+        step = rect.width() / (len(values) - 1)
+        points = QPolygonF([
+            QPointF(rect.left() + i * step, rect.bottom() - float(value) / scale * rect.height())
+            for i, value in enumerate(values)
+        ])
+
+        painter.save()
+        painter.setRenderHint(painter.Antialiasing)
+        painter.setPen(self.pen)
+        painter.drawPolyline(points)
+        painter.restore()
@@ -1,6 +1,7 @@
 import os
 import subprocess
 import sys
+from functools import lru_cache
 
 from src.services.config_utils import resource_path, exist_file
 
@@ -9,10 +10,25 @@ folder_prod = '/opt/DockerMonitor/assets'
 file_folder_monitor_prod = '/opt/DockerMonitor'
 file_monitor = 'monitoramento_container_app.py'
 
-ICON_PATH = f'{folder_prod}/app-icon.png' if exist_file(folder_prod) else resource_path(f"{folder_dev}/app-icon.png")
-ICON_HOME_PATH = f'{folder_prod}/home.png' if exist_file(folder_prod) else resource_path(f"{folder_dev}/home.png")
-ICON_REPORT_PATH = f'{folder_prod}/report.png' if exist_file(folder_prod) else resource_path(f"{folder_dev}/report.png")
-ICON_SETTINGS_PATH = f'{folder_prod}/settings.png' if exist_file(folder_prod) else resource_path(f"{folder_dev}/settings.png")
+ICON_FILES = {
+    'ICON_PATH': 'app-icon.png',
+    'ICON_HOME_PATH': 'home.png',
+    'ICON_REPORT_PATH': 'report.png',
+    'ICON_SETTINGS_PATH': 'settings.png',
+}
+
+def __getattr__(name):
+    # Caminhos dos ícones resolvidos no primeiro acesso (e não no import do módulo)
+    if name in ICON_FILES:
+        return asset_path(ICON_FILES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@lru_cache(maxsize=None)
+def assets_folder():
+    return folder_prod if exist_file(folder_prod) else resource_path(folder_dev)
+
+def asset_path(file_name):
+    return f'{assets_folder()}/{file_name}'
 
 def iniciar_popup_monitoramento():
     global script_path
@@ -25,7 +41,18 @@ def iniciar_popup_monitoramento():
         popup_executable = sys.executable
         script_path = resource_path("monitoramento_container_app.py")
 
+    # Se o popup já estiver aberto, a nova execução só pede a ele para atualizar a lista
     if getattr(sys, 'frozen', False):
-        subprocess.Popen([popup_executable])
+        subprocess.Popen([popup_executable, "--refresh"])
     else:
-        subprocess.Popen([popup_executable, script_path])
\ No newline at end of file
+        subprocess.Popen([popup_executable, script_path, "--refresh"])
+
+def iniciar_daemon_monitoramento():
+    """Inicia o daemon de monitoramento numa sessão própria (sobrevive à janela que o iniciou)."""
+    if getattr(sys, 'frozen', False):
+        # Os dois executáveis empacotados aceitam --monitor-daemon
+        command = [sys.executable, "--monitor-daemon"]
+    else:
+        command = [sys.executable, resource_path("main.py"), "--monitor-daemon"]
+
+    return subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
@@ -0,0 +1,122 @@
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+TOP_MODULES = 20
+
+
+class _TimedLoader:
+    """Repassa tudo ao loader original, medindo o tempo de execução do módulo."""
+
+    def __init__(self, loader, name, profiler):
+        self._loader = loader
+        self._name = name
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        # Em extensões (PyQt5, _ssl, ...) o carregamento da biblioteca acontece aqui
+        self._profiler._enter_module()
+        start = time.perf_counter()
+        try:
+            return self._loader.create_module(spec)
+        finally:
+            self._profiler._exit_module(self._name, time.perf_counter() - start)
+
+    def exec_module(self, module):
+        self._profiler._enter_module()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_module(self._name, time.perf_counter() - start)
+
+    def __getattr__(self, attribute):
+        return getattr(self._loader, attribute)
+
+
+class _TimingFinder:
+    """Meta path finder que só embrulha o loader encontrado pelos finders seguintes."""
+
+    def __init__(self, profiler):
+        self._profiler = profiler
+        self._resolving = set()
+
+    def find_spec(self, name, path=None, target=None):
+        if name in self._resolving:
+            return None
+        self._resolving.add(name)
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, name, self._profiler)
+                    return spec
+            return None
+        finally:
+            self._resolving.discard(name)
+
+
+class StartupProfiler:
+    """Mede o tempo das fases de inicialização e o custo de import de cada módulo.
+
+    `phase` marca uma fase (import da UI, criação da janela, ...); enquanto ativo, cada
+    módulo importado tem o tempo próprio (sem os imports aninhados) contabilizado.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = []  # (fase, duração em s)
+        self.marks = []  # (evento, instante em s desde a criação do profiler)
+        self.module_times = {}  # módulo -> tempo próprio (s)
+        self._child_time = [0.0]
+        self._finder = _TimingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def mark(self, name):
+        """Registra o instante (desde a criação do profiler) em que algo aconteceu."""
+        self.marks.append((name, time.perf_counter() - self.started))
+
+    def _enter_module(self):
+        self._child_time.append(0.0)
+
+    def _exit_module(self, name, elapsed):
+        children = self._child_time.pop()
+        self.module_times[name] = self.module_times.get(name, 0.0) + elapsed - children
+        self._child_time[-1] += elapsed
+
+    def report(self):
+        lines = ["=== Perfil de inicialização ===", "Fases:"]
+        for name, elapsed in self.phases:
+            lines.append(f"  {name:<40} {elapsed * 1000:>9.1f} ms")
+        for name, instant in self.marks:
+            lines.append(f"  {name:<40} em {instant * 1000:>6.1f} ms")
+
+        packages = defaultdict(float)
+        for name, own in self.module_times.items():
+            packages[name.split(".")[0]] += own
+
+        lines.append(f"Imports por pacote (tempo próprio, total {sum(packages.values()) * 1000:.1f} ms):")
+        for name, own in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:TOP_MODULES]:
+            lines.append(f"  {name:<40} {own * 1000:>9.1f} ms")
+
+        lines.append(f"Módulos mais lentos (top {TOP_MODULES}):")
+        slowest = sorted(self.module_times.items(), key=lambda item: item[1], reverse=True)[:TOP_MODULES]
+        for name, own in slowest:
+            lines.append(f"  {name:<40} {own * 1000:>9.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,22 @@
+# Colunas de estatísticas da tabela de containers: só formatação, sem asyncio (importado pela UI)
+SPARKLINE_HEADER = "CPU (5 min)"
+SPARKLINE_SECONDS = 300
+STATS_HEADERS = ["CPU %", "Memória", "Rede I/O", "Disco I/O", SPARKLINE_HEADER]
+
+
+def stats_columns(metrics):
+    """Textos das colunas STATS_HEADERS (exceto a do gráfico) para as métricas de um container."""
+    return {
+        "CPU %": f"{metrics['cpu_percent']:.1f}%",
+        "Memória": f"{format_bytes(metrics['memory_usage'])} / {format_bytes(metrics['memory_limit'])}",
+        "Rede I/O": f"{format_bytes(metrics['net_rx'])} / {format_bytes(metrics['net_tx'])}",
+        "Disco I/O": f"{format_bytes(metrics['block_read'])} / {format_bytes(metrics['block_write'])}",
+    }
+
+
+def format_bytes(value):
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB"
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from src.services.config_utils import log_and_notify, load_config, DEFAULT_BULK_PARALLELISM
+
+
+class BulkContainersWorker(QObject):
+    """Executa uma ação em vários containers com paralelismo limitado.
+
+    `action(nome)` é executada para cada container e `success_message(nome)` monta a
+    notificação de sucesso. O progresso é emitido a cada container concluído e as falhas são
+    acumuladas em `errors`; ao final, se houve falhas, `error` é emitido com o resumo antes de
+    `finished`.
+    """
+    finished = pyqtSignal()
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+    def __init__(self, docker_utils, container_names, action, success_message, max_workers=None):
+        super().__init__()
+        self.docker_utils = docker_utils
+        self.container_names = container_names
+        self.action = action
+        self.success_message = success_message
+        self.max_workers = max_workers or get_bulk_parallelism()
+        self.errors = []
+
+    @pyqtSlot()
+    def run(self):
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.action, name): name for name in self.container_names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    log_and_notify(self.success_message(name))
+                except Exception as e:
+                    self.errors.append((name, str(e)))
+                    log_and_notify(f"Erro no container {name}: {e}")
+
+                done += 1
+                self.progress.emit(done)
+
+        if self.errors:
+            self.error.emit("\n".join(f"{name}: {message}" for name, message in self.errors))
+        self.finished.emit()
+
+
+def get_bulk_parallelism():
+    try:
+        return max(1, int(load_config().get("bulk_parallelism", DEFAULT_BULK_PARALLELISM)))
+    except (TypeError, ValueError):
+        return DEFAULT_BULK_PARALLELISM
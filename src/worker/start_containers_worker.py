@@ -1,25 +1,11 @@
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+from src.worker.bulk_containers_worker import BulkContainersWorker
 
-from src.services.config_utils import log_and_notify
 
-
-class StartContainersWorker(QObject):
-    finished = pyqtSignal()
-    error = pyqtSignal(str)
-    progress = pyqtSignal(int)
-
-    def __init__(self, docker_utils, container_names):
-        super().__init__()
-        self.docker_utils = docker_utils
-        self.container_names = container_names
-
-    @pyqtSlot()
-    def run(self):
-        try:
-            for idx, name in enumerate(self.container_names, start=1):
-                self.docker_utils.start_container_by_name_or_id(name)
-                log_and_notify(f"Container {name} foi iniciado.")
-                self.progress.emit(idx)
-            self.finished.emit()
-        except Exception as e:
-            self.error.emit(str(e))
\ No newline at end of file
+class StartContainersWorker(BulkContainersWorker):
+    def __init__(self, docker_utils, container_names, max_workers=None):
+        super().__init__(
+            docker_utils, container_names,
+            action=lambda name: docker_utils.start_container_by_name_or_id(name, raise_errors=True),
+            success_message=lambda name: f"Container {name} foi iniciado.",
+            max_workers=max_workers,
+        )
@@ -0,0 +1,33 @@
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from src.services.config_utils import log_and_notify
+from src.services.stop_engine import format_stop_summary
+
+
+class StopAllContainersWorker(QObject):
+    """Para containers via ContainerStopEngine fora da thread da UI."""
+    finished = pyqtSignal(list)  # resultados por container
+    progress = pyqtSignal(int)
+
+    def __init__(self, docker_utils, containers=None):
+        super().__init__()
+        self.docker_utils = docker_utils
+        self.containers = containers
+
+    @pyqtSlot()
+    def run(self):
+        done = []
+
+        def on_result(result):
+            done.append(result)
+            self.progress.emit(len(done))
+
+        try:
+            results = self.docker_utils.stop_containers(self.containers, on_result=on_result)
+        except Exception as e:
+            log_and_notify(f"Erro ao parar containers: {str(e)}")
+            results = done
+
+        if results:
+            log_and_notify(f"Resumo da parada de containers:\n{format_stop_summary(results)}")
+        self.finished.emit(results)
@@ -0,0 +1,152 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.services.cgroup_stats import CgroupStatsReader, metrics_from_counters
+
+CONTAINER_ID = "a" * 64
+PID = "4242"
+MEMORY = 64 * 1024 * 1024
+MEM_TOTAL_KB = 16 * 1024 * 1024
+NET_DEV = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:   99999       9    0    0    0     0          0         0    99999       9    0    0    0     0       0          0
+  eth0:    1500      10    0    0    0     0          0         0      700      10    0    0    0     0       0          0
+  eth1:     500       5    0    0    0     0          0         0      300       5    0    0    0     0       0          0
+"""
+CGROUPFS = os.path.join("docker", CONTAINER_ID)
+SYSTEMD = os.path.join("system.slice", f"docker-{CONTAINER_ID}.scope")
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+class CgroupStatsReaderTest(unittest.TestCase):
+    """Árvores de cgroup falsas (v1 e v2, drivers cgroupfs e systemd) num diretório temporário."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.root = os.path.join(self.tmp, "cgroup")
+        self.proc_root = os.path.join(self.tmp, "proc")
+        os.makedirs(self.root)
+        write(os.path.join(self.proc_root, "meminfo"), f"MemTotal:       {MEM_TOTAL_KB} kB\nMemFree: 1 kB\n")
+        write(os.path.join(self.proc_root, PID, "net", "dev"), NET_DEV)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def build_v2(self, relative, memory_max="max", usage_usec=1000):
+        write(os.path.join(self.root, "cgroup.controllers"), "cpu io memory pids\n")
+        path = os.path.join(self.root, relative)
+        write(os.path.join(path, "cgroup.procs"), f"{PID}\n")
+        write(os.path.join(path, "cpu.stat"), f"usage_usec {usage_usec}\nuser_usec 0\nsystem_usec 0\n")
+        write(os.path.join(path, "memory.current"), f"{MEMORY + 4096}\n")
+        write(os.path.join(path, "memory.max"), f"{memory_max}\n")
+        write(os.path.join(path, "memory.stat"), "anon 0\nfile 4096\ninactive_file 4096\n")
+        write(os.path.join(path, "io.stat"),
+              "8:0 rbytes=4096 wbytes=8192 rios=1 wios=2 dbytes=0 dios=0\n"
+              "8:16 rbytes=1024 wbytes=0 rios=1 wios=0 dbytes=0 dios=0\n")
+
+    def build_v1(self, relative, limit=2 ** 63 - 4096, usage=1000000):
+        memory = os.path.join(self.root, "memory", relative)
+        write(os.path.join(memory, "cgroup.procs"), f"{PID}\n")
+        write(os.path.join(memory, "memory.usage_in_bytes"), f"{MEMORY + 4096}\n")
+        write(os.path.join(memory, "memory.limit_in_bytes"), f"{limit}\n")
+        write(os.path.join(memory, "memory.stat"), "cache 8192\ntotal_inactive_file 4096\n")
+        write(os.path.join(self.root, "cpuacct", relative, "cpuacct.usage"), f"{usage}\n")
+        write(os.path.join(self.root, "blkio", relative, "blkio.throttle.io_service_bytes"),
+              "8:0 Read 4096\n8:0 Write 8192\n8:0 Total 12288\nTotal 12288\n")
+
+    def reader(self):
+        return CgroupStatsReader(self.root, self.proc_root)
+
+    def test_v2_cgroupfs(self):
+        self.build_v2(CGROUPFS, memory_max=str(MEMORY * 2))
+        reader = self.reader()
+        self.assertEqual(reader.version, 2)
+        self.assertEqual(reader.find(CONTAINER_ID), os.path.join(self.root, CGROUPFS))
+        counters = reader.read(CONTAINER_ID)
+        self.assertEqual(counters["cpu_usage"], 1000 * 1000)
+        self.assertEqual(counters["memory_limit"], MEMORY * 2)
+        self.assertEqual(counters["block_read"], 4096 + 1024)
+        self.assertEqual(counters["block_write"], 8192)
+        metrics = metrics_from_counters(counters)
+        self.assertEqual(metrics["memory_usage"], MEMORY)
+
+    def test_v2_systemd(self):
+        self.build_v2(SYSTEMD)
+        reader = self.reader()
+        self.assertEqual(reader.find(CONTAINER_ID), os.path.join(self.root, SYSTEMD))
+        self.assertIsNotNone(reader.read(CONTAINER_ID))
+
+    def test_v2_unlimited_memory_uses_mem_total(self):
+        self.build_v2(CGROUPFS, memory_max="max")
+        counters = self.reader().read(CONTAINER_ID)
+        self.assertEqual(counters["memory_limit"], MEM_TOTAL_KB * 1024)
+
+    def test_v1_cgroupfs(self):
+        self.build_v1(CGROUPFS, limit=MEMORY * 2)
+        reader = self.reader()
+        self.assertEqual(reader.version, 1)
+        paths = reader.find(CONTAINER_ID)
+        self.assertEqual(paths["memory"], os.path.join(self.root, "memory", CGROUPFS))
+        counters = reader.read(CONTAINER_ID)
+        self.assertEqual(counters["cpu_usage"], 1000000)
+        self.assertEqual(counters["memory_limit"], MEMORY * 2)
+        self.assertEqual((counters["block_read"], counters["block_write"]), (4096, 8192))
+        # total_inactive_file tem prioridade sobre cache, como no `docker stats`
+        self.assertEqual(metrics_from_counters(counters)["memory_usage"], MEMORY)
+
+    def test_v1_systemd(self):
+        self.build_v1(SYSTEMD)
+        reader = self.reader()
+        self.assertEqual(reader.find(CONTAINER_ID)["cpuacct"], os.path.join(self.root, "cpuacct", SYSTEMD))
+        self.assertIsNotNone(reader.read(CONTAINER_ID))
+
+    def test_v1_page_counter_max_uses_mem_total(self):
+        self.build_v1(CGROUPFS, limit=9223372036854771712)
+        counters = self.reader().read(CONTAINER_ID)
+        self.assertEqual(counters["memory_limit"], MEM_TOTAL_KB * 1024)
+
+    def test_cpu_percent_from_two_reads(self):
+        self.build_v2(CGROUPFS, usage_usec=1000000)
+        reader = self.reader()
+        first = reader.read(CONTAINER_ID)
+        self.assertEqual(metrics_from_counters(first)["cpu_percent"], 0.0)
+
+        self.build_v2(CGROUPFS, usage_usec=1500000)
+        second = reader.read(CONTAINER_ID)
+        # 0,5 s de CPU em 2 s de relógio: 25%
+        first["time"], second["time"] = 10.0, 12.0
+        self.assertAlmostEqual(metrics_from_counters(second, first)["cpu_percent"], 25.0)
+
+    def test_network_excludes_loopback(self):
+        self.build_v2(CGROUPFS)
+        counters = self.reader().read(CONTAINER_ID)
+        self.assertEqual((counters["net_rx"], counters["net_tx"]), (1500 + 500, 700 + 300))
+
+    def test_missing_cgroup_reads_none(self):
+        self.build_v2(CGROUPFS)
+        reader = self.reader()
+        self.assertIsNone(reader.find("b" * 64))
+        self.assertIsNone(reader.read("b" * 64))
+
+    def test_removed_cgroup_reads_none(self):
+        self.build_v1(CGROUPFS)
+        reader = self.reader()
+        self.assertIsNotNone(reader.read(CONTAINER_ID))
+        shutil.rmtree(os.path.join(self.root, "memory", CGROUPFS))
+        self.assertIsNone(reader.read(CONTAINER_ID))
+
+    def test_no_cgroup_tree(self):
+        reader = self.reader()
+        self.assertFalse(reader.available())
+        self.assertIsNone(reader.read(CONTAINER_ID))
+
+
+if __name__ == "__main__":
+    unittest.main()